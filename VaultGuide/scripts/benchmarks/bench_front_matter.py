@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark front-matter extraction over a vault tree.
+
+Compares the original whole-file ``read_text().splitlines()`` reader with the
+header-only ``frontmatter.read_front_matter_lazy`` path, each with the pure
+Python ``SafeLoader`` and (when available) libyaml's ``CSafeLoader``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+import yaml
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "sync"))
+
+import frontmatter  # noqa: E402
+
+
+def legacy_read(path: Path, loader: Any) -> Dict[str, Any]:
+    lines = path.read_text().splitlines()
+    if not lines or lines[0].strip() != "---":
+        return {}
+    for idx, line in enumerate(lines[1:], start=1):
+        if line.strip() == "---":
+            return yaml.load("\n".join(lines[1:idx]), Loader=loader) or {}
+    raise ValueError(f"Front matter in {path} is not closed with '---'.")
+
+
+def fast_read(path: Path, loader: Any) -> Dict[str, Any]:
+    frontmatter.SafeLoader = loader
+    return frontmatter.read_front_matter_lazy(path)[0]
+
+
+def run(reader: Callable[[Path, Any], Dict[str, Any]], paths: List[Path], loader: Any) -> float:
+    start = time.perf_counter()
+    for path in paths:
+        try:
+            reader(path, loader)
+        except (ValueError, yaml.YAMLError):
+            pass
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Microbenchmark front-matter extraction.")
+    parser.add_argument("--root", type=Path, required=True, help="Tree to scan (e.g. Product/)")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per variant (best is kept)")
+    args = parser.parse_args()
+
+    paths = sorted(path for path in args.root.rglob("*.md") if path.is_file())
+    total_bytes = sum(path.stat().st_size for path in paths)
+    print(f"{len(paths)} files, {total_bytes / 1024:.0f} KiB")
+
+    loaders = [("SafeLoader", yaml.SafeLoader)]
+    if hasattr(yaml, "CSafeLoader"):
+        loaders.append(("CSafeLoader", yaml.CSafeLoader))
+    original = frontmatter.SafeLoader
+    try:
+        for reader_name, reader in (("whole-file", legacy_read), ("header-only", fast_read)):
+            for loader_name, loader in loaders:
+                best = min(run(reader, paths, loader) for _ in range(args.repeat))
+                per_file = best / max(len(paths), 1) * 1e6
+                print(f"{reader_name:>12} + {loader_name:<12} {best * 1000:8.1f} ms  {per_file:7.1f} us/file")
+    finally:
+        frontmatter.SafeLoader = original
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Benchmark front-matter parsing speedup against worker count.
+
+Parses every epic, feature and story markdown file under ``<vault>/EPICS``
+(optionally replicated ``--copies`` times into a scratch directory to simulate a
+larger vault) with 1, 2, 4, ... up to ``--max-jobs`` processes, bypassing the
+front-matter index so every run pays the full YAML cost.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "sync"))
+
+from roadmap_sync import collect_artifact_metadata  # noqa: E402
+
+
+def replicate_epics(epics_dir: Path, target: Path, copies: int) -> Path:
+    out = target / "EPICS"
+    for copy in range(copies):
+        shutil.copytree(epics_dir, out / f"COPY-{copy:03d}")
+    return out
+
+
+def job_counts(max_jobs: int) -> List[int]:
+    counts = [1]
+    while counts[-1] * 2 <= max_jobs:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != max_jobs:
+        counts.append(max_jobs)
+    return counts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark parallel front-matter parsing.")
+    parser.add_argument("--vault", type=Path, required=True, help="Path to product root")
+    parser.add_argument("--copies", type=int, default=1, help="Replicate EPICS/ this many times")
+    parser.add_argument("--max-jobs", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per job count (best is kept)")
+    args = parser.parse_args()
+
+    epics_dir = args.vault.resolve() / "EPICS"
+    with tempfile.TemporaryDirectory() as scratch:
+        if args.copies > 1:
+            epics_dir = replicate_epics(epics_dir, Path(scratch), args.copies)
+
+        baseline = None
+        reference = None
+        print(f"{'jobs':>4} | {'files':>6} | {'best (s)':>8} | {'speedup':>7}")
+        for jobs in job_counts(args.max_jobs):
+            best = float("inf")
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                result = collect_artifact_metadata(epics_dir, jobs=jobs)
+                best = min(best, time.perf_counter() - start)
+            if reference is None:
+                reference = result
+            elif result != reference:
+                raise SystemExit(f"jobs={jobs} produced different output than jobs=1")
+            baseline = baseline or best
+            print(f"{jobs:>4} | {len(result):>6} | {best:>8.3f} | {baseline / best:>6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
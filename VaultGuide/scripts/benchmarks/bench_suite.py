@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Reproducible benchmark suite for the sync scripts and the dashboard.
+
+For each ``--sizes`` entry a synthetic vault is generated with
+``synthetic_vault.py``, using git worktrees when the dashboard benchmark is
+selected. Each benchmark then runs in a fresh worker process, so peak RSS
+belongs to that benchmark alone:
+
+    collect   roadmap_sync.collect_epic_metadata, cold (no front-matter index)
+    summary   update_epic_status.process_summary on one sprint; targets are restored between runs
+    replace   roadmap_render.render_blocks streaming the full table into ROADMAP.md
+    dashboard ParallelDevDashboard.generate_status_report over the worktrees
+
+Results report median/min latency, throughput (items per second at the
+median) and peak RSS. ``--save-baseline`` records them in ``--baseline``.
+Later runs compare against that file and exit 1 when a median latency or the
+peak RSS regresses by more than ``--tolerance``. Baselines are specific to a
+machine; record them on the machine that runs the comparison.
+
+Usage:
+    python bench_suite.py --sizes 10,1000,10000 --save-baseline
+    python bench_suite.py --sizes 10,1000,10000            # fails on regression
+    python bench_suite.py --sizes 100000 --bench collect,replace --repeat 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+HERE = Path(__file__).resolve().parent
+sys.path.insert(0, str(HERE.parents[0] / "sync"))
+sys.path.insert(0, str(HERE.parents[2] / "scripts"))
+
+from synthetic_vault import add_worktrees, generate_vault  # noqa: E402
+
+BENCHMARKS = ("collect", "summary", "replace", "dashboard")
+DEFAULT_SIZES = "10,1000,10000"
+DEFAULT_BASELINE = HERE / "baselines.json"
+WORKTREES = 3
+MIN_BATCH_SECONDS = 0.05  # repeat sub-millisecond calls until one sample takes this long
+
+
+def peak_rss_mib() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KiB on Linux and bytes on macOS.
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def sample(func: Callable[[], Any], repeat: int, batch: int = 1, reset: Optional[Callable[[], None]] = None) -> List[float]:
+    """Per-call latency in seconds for ``repeat`` samples of ``batch`` calls each."""
+    latencies = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(batch):
+            func()
+        latencies.append((time.perf_counter() - start) / batch)
+        if reset is not None:
+            reset()
+    return latencies
+
+
+def calibrate(func: Callable[[], Any]) -> int:
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    return max(1, int(MIN_BATCH_SECONDS / elapsed)) if elapsed > 0 else 1000
+
+
+def bench_collect(vault: Path, repeat: int) -> Tuple[List[float], int]:
+    from roadmap_sync import collect_epic_metadata
+
+    epics_dir = vault / "EPICS"
+    rows = collect_epic_metadata(epics_dir)
+    return sample(lambda: collect_epic_metadata(epics_dir), repeat), len(rows)
+
+
+def bench_summary(vault: Path, repeat: int) -> Tuple[List[float], int]:
+    import yaml
+
+    from update_epic_status import iter_summary_updates, process_summary
+
+    summary_path = sorted((vault / "Sprints").glob("*/execution_summary.yaml"))[0]
+    updates = list(iter_summary_updates(yaml.safe_load(summary_path.read_text())))
+    originals = {vault / update["path"]: (vault / update["path"]).read_bytes() for update in updates}
+
+    def restore() -> None:
+        for path, content in originals.items():
+            path.write_bytes(content)
+
+    def run() -> None:
+        with contextlib.redirect_stdout(io.StringIO()):
+            process_summary(vault, summary_path)
+
+    return sample(run, repeat, reset=restore), len(updates)
+
+
+def bench_replace(vault: Path, repeat: int) -> Tuple[List[float], int]:
+    from roadmap_render import render_blocks
+    from roadmap_sync import SUMMARY_BLOCK, collect_epic_metadata, table_lines
+
+    roadmap = vault / "ROADMAP.md"
+    rows = collect_epic_metadata(vault / "EPICS")
+    run = lambda: render_blocks(roadmap, {SUMMARY_BLOCK: table_lines(rows)})  # noqa: E731
+    run()  # steady state: the block already exists
+    return sample(run, repeat, calibrate(run)), len(rows)
+
+
+def bench_dashboard(vault: Path, repeat: int) -> Tuple[List[float], int]:
+    from parallel_dev_dashboard import ParallelDevDashboard
+
+    worktrees = {path.name[len(vault.name) + 1 :]: path for path in sorted(vault.parent.glob(f"{vault.name}-wt-*"))}
+
+    def run() -> None:
+        # A fresh dashboard per sample: the CLI starts with an empty diff cache too.
+        dashboard = ParallelDevDashboard(worktrees=worktrees)
+        dashboard.main_repo = vault
+        dashboard.generate_status_report()
+
+    return sample(run, repeat), len(worktrees)
+
+
+WORKERS: Dict[str, Callable[[Path, int], Tuple[List[float], int]]] = {
+    "collect": bench_collect,
+    "summary": bench_summary,
+    "replace": bench_replace,
+    "dashboard": bench_dashboard,
+}
+
+
+def run_worker(name: str, vault: Path, repeat: int) -> None:
+    latencies, items = WORKERS[name](vault, repeat)
+    median = statistics.median(latencies)
+    print(
+        json.dumps(
+            {
+                "median_ms": round(median * 1000, 3),
+                "min_ms": round(min(latencies) * 1000, 3),
+                "items": items,
+                "throughput": round(items / median, 1) if median > 0 else None,
+                "peak_rss_mib": round(peak_rss_mib(), 1),
+            }
+        )
+    )
+
+
+def run_benchmark(name: str, vault: Path, repeat: int) -> Dict[str, Any]:
+    result = subprocess.run(
+        [sys.executable, __file__, "--worker", name, "--vault", str(vault), "--repeat", str(repeat)],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise SystemExit(f"{name} benchmark failed:\n{result.stderr}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def load_baseline(path: Path) -> Dict[str, Any]:
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def machine() -> str:
+    return f"{platform.node()} {platform.machine()} python {platform.python_version()}"
+
+
+def regressions(
+    key: str, result: Dict[str, Any], base: Dict[str, Any], tolerance: float, min_delta_ms: float
+) -> List[str]:
+    found = []
+    slower = result["median_ms"] - base["median_ms"]
+    if slower > max(base["median_ms"] * tolerance, min_delta_ms):
+        found.append(f"{key}: median {result['median_ms']:.2f} ms vs baseline {base['median_ms']:.2f} ms")
+    if result["peak_rss_mib"] > base["peak_rss_mib"] * (1 + tolerance):
+        found.append(f"{key}: peak RSS {result['peak_rss_mib']:.1f} MiB vs baseline {base['peak_rss_mib']:.1f} MiB")
+    return found
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the sync scripts on synthetic vaults.")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="Comma-separated artifact counts (e.g. 10,1000,100000)")
+    parser.add_argument("--bench", default=",".join(BENCHMARKS), help=f"Comma-separated subset of {', '.join(BENCHMARKS)}")
+    parser.add_argument("--repeat", type=int, default=5, help="Samples per benchmark (median is compared)")
+    parser.add_argument("--seed", type=int, default=0, help="Synthetic vault seed")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="Baseline results file")
+    parser.add_argument("--save-baseline", action="store_true", help="Record these results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed fractional slowdown / RSS growth")
+    parser.add_argument("--min-delta-ms", type=float, default=2.0, help="Ignore latency regressions smaller than this")
+    parser.add_argument("--work-dir", type=Path, help="Keep generated vaults here instead of a temp directory")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument("--worker", choices=BENCHMARKS, help=argparse.SUPPRESS)
+    parser.add_argument("--vault", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker(args.worker, args.vault, args.repeat)
+        return
+
+    selected = [name.strip() for name in args.bench.split(",") if name.strip()]
+    unknown = sorted(set(selected) - set(BENCHMARKS))
+    if unknown:
+        parser.error(f"unknown benchmark(s): {', '.join(unknown)}")
+    sizes = [int(size) for size in args.sizes.split(",")]
+
+    baseline = load_baseline(args.baseline)
+    if baseline and baseline.get("machine") != machine() and not args.save_baseline:
+        print(f"Warning: baseline was recorded on {baseline.get('machine')}, not {machine()}", file=sys.stderr)
+
+    results: Dict[str, Dict[str, Any]] = {}
+    failures: List[str] = []
+    with contextlib.ExitStack() as stack:
+        work_dir = args.work_dir or Path(stack.enter_context(tempfile.TemporaryDirectory(prefix="vault-bench-")))
+        if not args.json:
+            print(f"{'benchmark':<22} | {'median ms':>10} | {'min ms':>10} | {'items/s':>11} | {'peak MiB':>8} | vs baseline")
+        for size in sizes:
+            vault = work_dir / f"vault-{size}-seed{args.seed}"
+            if not vault.exists():
+                generate_vault(vault, size, args.seed)
+                if "dashboard" in selected:
+                    add_worktrees(vault, WORKTREES, args.seed)
+            elif "dashboard" in selected and not (vault / ".git").exists():
+                add_worktrees(vault, WORKTREES, args.seed)
+            for name in selected:
+                key = f"{name}@{size}"
+                result = results[key] = run_benchmark(name, vault, args.repeat)
+                base = baseline.get("results", {}).get(key)
+                found = regressions(key, result, base, args.tolerance, args.min_delta_ms) if base else []
+                failures += found
+                if not args.json:
+                    change = f"{(result['median_ms'] / base['median_ms'] - 1) * 100:+.0f}%" if base and base["median_ms"] else "—"
+                    flag = " REGRESSION" if found else ""
+                    print(
+                        f"{key:<22} | {result['median_ms']:>10.2f} | {result['min_ms']:>10.2f} | "
+                        f"{result['throughput'] or 0:>11,.0f} | {result['peak_rss_mib']:>8.1f} | {change}{flag}",
+                        flush=True,
+                    )
+
+    if args.json:
+        print(json.dumps({"machine": machine(), "results": results, "regressions": failures}, indent=2))
+    if args.save_baseline:
+        merged = dict(baseline.get("results", {})) if baseline.get("machine") == machine() else {}
+        merged.update(results)
+        args.baseline.write_text(json.dumps({"machine": machine(), "results": merged}, indent=2, sort_keys=True) + "\n")
+        print(f"Saved baseline for {len(results)} benchmarks to {args.baseline}", file=sys.stderr)
+    elif failures:
+        print("\n".join(["Regressions over baseline:"] + failures), file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
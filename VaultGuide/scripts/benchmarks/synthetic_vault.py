@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Generate a synthetic product vault shaped like ``Product/`` for benchmarking.
+
+The tree mirrors the real layout: ``EPICS/EPIC-*/README.md``, then
+``Features/FEATURE-*/README.md``, then ``Stories/STORY-*.md``. It also writes
+``Sprints/*/execution_summary.yaml`` (one per epic) and a ``ROADMAP.md`` with an
+auto-summary block. Front matter carries the fields the sync scripts read,
+including change logs and linked sprints. Bodies are a few paragraphs of
+markdown. Output is deterministic for a given ``--artifacts`` and ``--seed``.
+
+With ``--worktrees N`` the vault is committed to a git repository on ``main``
+and N linked worktrees are added next to it. Each worktree commits edits to a
+partly shared set of files, so the dashboard has conflicts to report.
+
+Usage:
+    python synthetic_vault.py --out /tmp/vault-10k --artifacts 10000
+    python synthetic_vault.py --out /tmp/vault-1k --artifacts 1000 --worktrees 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import random
+import shutil
+import subprocess
+from pathlib import Path
+from typing import Any, Dict, List
+
+import yaml
+
+FEATURES_PER_EPIC = 8
+STORIES_PER_FEATURE = 10
+STATUSES = ["completed", "in_progress", "planned", "blocked", "at_risk", "not_started"]
+STATUS_WEIGHTS = [30, 25, 25, 5, 5, 10]
+OWNERS = ["product_ops_team", "eng_team", "data_team", "platform_team"]
+WORDS = (
+    "adapter backtest clock strategy portfolio replay validation latency pipeline "
+    "market data order fill slippage commission risk report coverage contract port "
+    "deterministic ingestion catalog workflow checkpoint snapshot metric"
+).split()
+GIT_IDENTITY = ["-c", "user.name=benchmark", "-c", "user.email=benchmark@localhost"]
+EPOCH = dt.datetime(2025, 1, 6, 9, 0, tzinfo=dt.timezone.utc)
+
+
+def _iso(moment: dt.datetime) -> str:
+    return moment.replace(microsecond=0).isoformat().replace("+00:00", "Z")
+
+
+def _words(rng: random.Random, count: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(count))
+
+
+def _body(rng: random.Random, heading: str, paragraphs: int) -> str:
+    sections = [f"# {heading}", ""]
+    for index in range(paragraphs):
+        sections += [f"## {_words(rng, 2).title()} {index + 1}", "", _words(rng, rng.randint(40, 90)).capitalize() + ".", ""]
+        sections += [f"- [{rng.choice('x ')}] {_words(rng, 6)}" for _ in range(rng.randint(2, 5))]
+        sections.append("")
+    return "\n".join(sections)
+
+
+def _sprint_id(number: int) -> str:
+    start = EPOCH + dt.timedelta(days=14 * number)
+    return f"SPRINT-{start:%Y%m%d}-synthetic{number:04d}"
+
+
+def _front_matter(
+    rng: random.Random, artifact_type: str, artifact_id: str, title: str, seq: int, sprints: int
+) -> Dict[str, Any]:
+    created = EPOCH + dt.timedelta(minutes=rng.randint(0, 60 * 24 * 90))
+    linked = sorted({_sprint_id(rng.randrange(max(sprints, 1))) for _ in range(rng.randint(0, 4))})
+    status = rng.choices(STATUSES, STATUS_WEIGHTS)[0]
+    progress = 100 if status == "completed" else rng.randint(0, 95)
+    return {
+        "artifact_type": artifact_type,
+        "change_log": [
+            f"{(created + dt.timedelta(days=3 * n)):%Y-%m-%d} – {sprint} – {_words(rng, 5)}."
+            for n, sprint in enumerate(linked)
+        ]
+        or None,
+        "created_at": _iso(created),
+        "id": artifact_id,
+        "linked_sprints": linked,
+        "manual_update": rng.random() < 0.3,
+        "owner": rng.choice(OWNERS),
+        "progress_pct": progress,
+        "requirement_coverage": min(100, progress + rng.randint(0, 20)),
+        "seq": seq,
+        "status": status,
+        "title": title,
+        "updated_at": _iso(created + dt.timedelta(days=rng.randint(0, 30))),
+    }
+
+
+def _write_markdown(path: Path, metadata: Dict[str, Any], body: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    front = yaml.safe_dump(metadata, sort_keys=False, allow_unicode=True).strip()
+    path.write_text(f"---\n{front}\n---\n\n{body}\n", encoding="utf-8")
+
+
+def generate_vault(root: Path, artifacts: int, seed: int = 0) -> Dict[str, int]:
+    """Write ``artifacts`` epic/feature/story files plus summaries and a roadmap under ``root``."""
+    rng = random.Random(seed)
+    epics_dir = root / "EPICS"
+    epics_needed = max(1, -(-artifacts // (1 + FEATURES_PER_EPIC * (1 + STORIES_PER_FEATURE))))
+    sprints = max(1, epics_needed)
+    written = 0
+    epic_updates: List[Dict[str, Any]] = []
+
+    for epic_no in range(1, epics_needed + 1):
+        epic_id = f"EPIC-{epic_no:04d}"
+        epic_dir = epics_dir / f"{epic_id}-{_words(rng, 1).title()}"
+        epic_path = epic_dir / "README.md"
+        epic_meta = _front_matter(rng, "epic_overview", epic_id, _words(rng, 3).title(), epic_no, sprints)
+        _write_markdown(epic_path, epic_meta, _body(rng, f"{epic_id}: {epic_meta['title']}", 4))
+        written += 1
+        update: Dict[str, Any] = {"id": epic_id, "path": str(epic_path.relative_to(root)), "features": []}
+
+        for feature_no in range(1, FEATURES_PER_EPIC + 1):
+            if written >= artifacts:
+                break
+            feature_id = f"FEATURE-{epic_no:04d}-{feature_no:02d}"
+            feature_dir = epic_dir / "Features" / f"{feature_id}-{_words(rng, 1).title()}"
+            feature_path = feature_dir / "README.md"
+            feature_meta = _front_matter(rng, "feature_overview", feature_id, _words(rng, 3).title(), feature_no, sprints)
+            feature_meta["parent_epic"] = epic_id
+            _write_markdown(feature_path, feature_meta, _body(rng, f"{feature_id}: {feature_meta['title']}", 3))
+            written += 1
+            feature_update: Dict[str, Any] = {"id": feature_id, "path": str(feature_path.relative_to(root)), "stories": []}
+
+            for story_no in range(1, STORIES_PER_FEATURE + 1):
+                if written >= artifacts:
+                    break
+                story_id = f"STORY-{epic_no:04d}-{feature_no:02d}-{story_no:02d}"
+                story_path = feature_dir / "Stories" / f"{story_id}-{_words(rng, 1).title()}.md"
+                story_meta = _front_matter(rng, "story", story_id, _words(rng, 4).capitalize(), story_no, sprints)
+                story_meta["parent_feature"] = feature_id
+                _write_markdown(story_path, story_meta, _body(rng, f"{story_id}: {story_meta['title']}", 2))
+                written += 1
+                if story_no <= 3:
+                    feature_update["stories"].append(
+                        {"id": story_id, "path": str(story_path.relative_to(root)), "status": "completed", "progress_pct": 100}
+                    )
+            feature_update.update(status="in_progress", progress_pct=rng.randint(10, 90))
+            update["features"].append(feature_update)
+
+        update.update(
+            status="in_progress",
+            progress_pct=rng.randint(10, 90),
+            change_log_entry=f"{_sprint_id(epic_no - 1)} – {_words(rng, 6)}.",
+        )
+        epic_updates.append(update)
+
+    sprints_dir = root / "Sprints"
+    for number, update in enumerate(epic_updates):
+        sprint_id = _sprint_id(number)
+        summary = {
+            "sprint_id": sprint_id,
+            "status": "completed",
+            "started_at": _iso(EPOCH + dt.timedelta(days=14 * number)),
+            "ended_at": _iso(EPOCH + dt.timedelta(days=14 * number + 13)),
+            "epic_updates": [update],
+        }
+        summary_dir = sprints_dir / sprint_id
+        summary_dir.mkdir(parents=True, exist_ok=True)
+        (summary_dir / "execution_summary.yaml").write_text(yaml.safe_dump(summary, sort_keys=False, allow_unicode=True))
+
+    (root / "ROADMAP.md").write_text(
+        "# Synthetic Roadmap\n\n<!-- AUTO-ROADMAP-SUMMARY:START -->\n<!-- AUTO-ROADMAP-SUMMARY:END -->\n"
+    )
+    return {"artifacts": written, "epics": epics_needed, "summaries": len(epic_updates)}
+
+
+def _git(cwd: Path, *args: str) -> str:
+    result = subprocess.run(["git", *GIT_IDENTITY, *args], cwd=cwd, capture_output=True, text=True, check=True)
+    return result.stdout
+
+
+def add_worktrees(root: Path, count: int, seed: int = 0) -> Dict[str, Path]:
+    """Commit ``root`` on ``main`` and add ``count`` worktrees with overlapping edits."""
+    rng = random.Random(seed)
+    _git(root, "init", "-q", "-b", "main")
+    _git(root, "add", "-A")
+    _git(root, "commit", "-q", "-m", "Synthetic vault")
+    candidates = sorted(str(path.relative_to(root)) for path in (root / "EPICS").rglob("*.md"))
+    shared = rng.sample(candidates, min(len(candidates), 5))
+
+    worktrees: Dict[str, Path] = {}
+    for number in range(1, count + 1):
+        name = f"wt-{number}"
+        path = root.parent / f"{root.name}-{name}"
+        if path.exists():
+            shutil.rmtree(path)
+        _git(root, "worktree", "add", "-q", "-b", f"feature/{name}", str(path))
+        touched = shared[: rng.randint(1, len(shared))] + rng.sample(candidates, min(len(candidates), 10))
+        for commit in range(3):
+            for rel in touched[commit::3]:
+                target = path / rel
+                target.write_text(target.read_text() + f"\n<!-- {name} edit {commit} -->\n")
+            _git(path, "commit", "-q", "-am", f"{name}: edit batch {commit}")
+        worktrees[name] = path
+    return worktrees
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate a synthetic Product-shaped vault.")
+    parser.add_argument("--out", type=Path, required=True, help="Directory to create (must not exist)")
+    parser.add_argument("--artifacts", type=int, default=1000, help="Epic + feature + story files to write")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (output is deterministic per seed)")
+    parser.add_argument("--worktrees", type=int, default=0, help="Commit to git and add this many worktrees")
+    args = parser.parse_args()
+
+    if args.out.exists():
+        parser.error(f"{args.out} already exists")
+    stats = generate_vault(args.out, args.artifacts, args.seed)
+    print(f"Wrote {stats['artifacts']} artifacts in {stats['epics']} epics and {stats['summaries']} summaries to {args.out}")
+    if args.worktrees:
+        for name, path in add_worktrees(args.out, args.worktrees, args.seed).items():
+            print(f"  worktree {name}: {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Transactional multi-file writer for front-matter updates.
+
+Each target is read once and edited in memory. On commit every changed document
+is rendered and validated first; only then are the new contents written to
+temp files next to their targets (concurrently) and renamed into place. A
+validation or write failure leaves every original file untouched. Each rename is
+atomic, but the batch as a whole is not: if a rename fails, the files renamed
+before it keep their new contents, the remaining temp files are removed, and
+``BatchCommitError`` lists which paths were and were not committed.
+
+A document flagged as changed is still skipped if its metadata hashes the same
+as when it was read. The hash uses sorted keys and ignores ``volatile`` fields
+such as ``updated_at``. Edits that cancel out, or differ only in key order, so
+never rewrite a file or bump its timestamps.
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from frontmatter import LazyBody, parse_front_matter_text, read_front_matter_lazy
+from profiling import count, phase
+from render_cache import semantic_digest
+
+Renderer = Callable[[Dict[str, Any], Union[str, LazyBody]], str]
+
+
+def atomic_write_text(path: Path, content: str) -> None:
+    """Replace ``path`` with ``content`` via write-to-temp-then-rename."""
+    tmp_path = _write_temp(path, content)
+    try:
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _write_temp(path: Path, content: str) -> str:
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            handle.write(content)
+            handle.flush()
+            os.fsync(handle.fileno())
+        if path.exists():
+            os.chmod(tmp_path, path.stat().st_mode & 0o7777)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return tmp_path
+
+
+class Document:
+    """A front-matter document loaded for editing."""
+
+    def __init__(self, path: Path, volatile: Sequence[str] = ()) -> None:
+        self.path = path
+        self.metadata, self.body = read_front_matter_lazy(path)
+        self.digest = semantic_digest(self.metadata, volatile)
+        self.changed = False
+        self.skipped = False  # flagged as changed, but semantically identical to the file
+
+
+class BatchValidationError(ValueError):
+    def __init__(self, errors: List[str]) -> None:
+        super().__init__("Batch not written:\n  " + "\n  ".join(errors))
+        self.errors = errors
+
+
+class BatchCommitError(OSError):
+    def __init__(self, committed: List[Path], pending: List[Path], cause: BaseException) -> None:
+        lines = [f"Batch partly written ({cause}):"]
+        lines += [f"  committed: {path}" for path in committed]
+        lines += [f"  not committed: {path}" for path in pending]
+        super().__init__("\n".join(lines))
+        self.committed = committed
+        self.pending = pending
+
+
+class BatchWriter:
+    def __init__(self, render: Renderer, max_workers: int = 8, volatile: Sequence[str] = ()) -> None:
+        self.render = render
+        self.max_workers = max_workers
+        self.volatile = tuple(volatile)
+        self.documents: Dict[Path, Document] = {}
+
+    def document(self, path: Path) -> Document:
+        """Return the in-memory document for ``path``, reading it on first use."""
+        key = path.resolve()
+        if key not in self.documents:
+            self.documents[key] = Document(key, self.volatile)
+        return self.documents[key]
+
+    def changed(self) -> List[Document]:
+        return [doc for doc in self.documents.values() if doc.changed]
+
+    def skipped(self) -> List[Document]:
+        return [doc for doc in self.documents.values() if doc.skipped]
+
+    def prepare(self) -> List[Tuple[Document, str]]:
+        """Render every changed document, raising if any fails to round-trip."""
+        rendered: List[Tuple[Document, str]] = []
+        errors: List[str] = []
+        for doc in self.changed():
+            if semantic_digest(doc.metadata, self.volatile) == doc.digest:
+                doc.changed, doc.skipped = False, True
+                count("writes_skipped")
+                continue
+            try:
+                with phase("render"):
+                    content = self.render(doc.metadata, doc.body)
+                if not parse_front_matter_text(content, doc.path):
+                    raise ValueError("rendered front matter is empty")
+            except Exception as exc:  # collect every failure before aborting
+                errors.append(f"{doc.path}: {exc}")
+                continue
+            rendered.append((doc, content))
+        if errors:
+            raise BatchValidationError(errors)
+        return rendered
+
+    def commit(self) -> List[Document]:
+        """Validate, stage and rename every changed document; returns what was written."""
+        rendered = self.prepare()
+        if not rendered:
+            return []
+
+        staged: List[Optional[str]] = [None] * len(rendered)
+
+        def stage(pos: int) -> None:
+            doc, content = rendered[pos]
+            staged[pos] = _write_temp(doc.path, content)
+
+        try:
+            with phase("write", files=len(rendered)), ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                list(pool.map(stage, range(len(rendered))))
+        except BaseException:
+            for tmp_path in staged:
+                if tmp_path is not None and os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+            raise
+
+        done = 0
+        try:
+            for (doc, _), tmp_path in zip(rendered, staged):
+                os.replace(tmp_path, doc.path)  # type: ignore[arg-type]
+                done += 1
+        except OSError as exc:
+            paths = [doc.path for doc, _ in rendered]
+            raise BatchCommitError(paths[:done], paths[done:], exc) from exc
+        finally:
+            for tmp_path in staged[done:]:  # empty once every rename succeeded
+                if tmp_path is not None and os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+        count("files_written", len(rendered))
+        count("bytes_written", sum(len(content.encode("utf-8")) for _, content in rendered))
+        return [doc for doc, _ in rendered]
@@ -0,0 +1,373 @@
+#!/usr/bin/env python3
+"""
+Replay sprint progress cursors into point-in-time epic/feature/story state.
+
+Every ``Sprints/*/progress_cursor.yaml`` is streamed one cursor at a time (the
+YAML event parser never holds a whole log in memory), and the per-sprint
+streams are merged by ``timestamp``. Two layouts are understood:
+
+    cursors:                          checkpoints:
+      - cursor_id: CURSOR-002           - cursor_id: DAY-01-AM
+        timestamp: 2025-11-19T00:00Z      timestamp: 2025-11-04T10:00:00Z
+        touched_epics:                    epics_touchpoints: [EPIC-007]
+          - id: EPIC-002                  features_in_scope: [FEATURE-006-DataPipeline]
+            status: in-progress           stories:
+            progress_pct: 29                - STORY-006-01 (40%)
+
+Folding the merged stream yields the latest status/progress per artifact. A
+snapshot of the folded state is kept every ``--snapshot-every`` events, so an
+"as of T" query bisects to the nearest snapshot and replays at most that many
+events. Events and snapshots are cached in ``<vault>/.vault-cache/`` and
+rebuilt only when a cursor file changes.
+
+Usage:
+    python cursor_replay.py --vault Product --as-of 2025-11-19T03:00:00Z
+    python cursor_replay.py --vault Product --kind epic
+    python cursor_replay.py --vault Product --history EPIC-002
+"""
+
+from __future__ import annotations
+
+import argparse
+import bisect
+import datetime as dt
+import heapq
+import os
+import pickle
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+import yaml
+from yaml.composer import Composer
+from yaml.constructor import SafeConstructor
+from yaml.resolver import Resolver
+
+from frontmatter_index import default_cache_dir
+from timeutil import format_ts, to_utc
+
+try:  # libyaml's event parser; the pure-Python composer builds one node at a time on top
+    from yaml._yaml import CParser as _Parser
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml.parser import Parser
+    from yaml.reader import Reader
+    from yaml.scanner import Scanner
+
+    class _Parser(Reader, Scanner, Parser):  # type: ignore[no-redef]
+        def __init__(self, stream: Any) -> None:
+            Reader.__init__(self, stream)
+            Scanner.__init__(self)
+            Parser.__init__(self)
+
+
+CURSOR_GLOB = "*/progress_cursor.yaml"
+CACHE_FILENAME = "cursor_replay.pickle"
+CACHE_VERSION = 1
+DEFAULT_SNAPSHOT_EVERY = 512
+
+CURSOR_KEYS = ("cursors", "checkpoints")
+KINDS = ("epic", "feature", "story")
+# Per kind, the cursor fields that list touched artifacts (new layout first).
+TOUCH_FIELDS = {
+    "epic": ("touched_epics", "epics_touchpoints"),
+    "feature": ("touched_features", "features_in_scope"),
+    "story": ("touched_stories", "stories"),
+}
+# "STORY-006-01 (40%)" in checkpoint-style logs.
+INLINE_PROGRESS = re.compile(r"^\s*([^\s(]+)\s*(?:\((\d+(?:\.\d+)?)%\))?")
+
+Update = Tuple[str, str, Optional[str], Optional[float]]  # (kind, id, status, progress_pct)
+State = Dict[str, Dict[str, Dict[str, Any]]]  # kind -> id -> record
+
+
+class StreamLoader(_Parser, Composer, SafeConstructor, Resolver):
+    """Safe loader whose callers compose and construct one node at a time."""
+
+    def __init__(self, stream: Any) -> None:
+        _Parser.__init__(self, stream)
+        Composer.__init__(self)
+        SafeConstructor.__init__(self)
+        Resolver.__init__(self)
+
+
+class CursorEvent(NamedTuple):
+    timestamp: dt.datetime
+    sprint_id: str
+    cursor_id: str
+    updates: Tuple[Update, ...]
+
+
+def _progress(value: Any) -> Optional[float]:
+    if isinstance(value, bool) or value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def cursor_updates(entry: Dict[str, Any]) -> Tuple[Update, ...]:
+    updates: List[Update] = []
+    for kind in KINDS:
+        for field in TOUCH_FIELDS[kind]:
+            for item in entry.get(field) or []:
+                if isinstance(item, dict) and item.get("id"):
+                    status = item.get("status")
+                    updates.append(
+                        (kind, str(item["id"]), str(status) if status else None, _progress(item.get("progress_pct")))
+                    )
+                elif isinstance(item, str):
+                    match = INLINE_PROGRESS.match(item)
+                    if match:
+                        updates.append((kind, match.group(1), None, _progress(match.group(2))))
+    return tuple(updates)
+
+
+def stream_cursor_file(path: Path, problems: Optional[List[str]] = None) -> Iterator[CursorEvent]:
+    """Yield the cursors of one log in file order, parsing one entry at a time.
+
+    With ``problems`` given, a YAML syntax error ends the stream after the last
+    complete cursor and is recorded there instead of raised. A cursor without a
+    valid timestamp, or earlier than the cursor before it, is skipped and
+    recorded the same way, so the stream stays sorted for ``heapq.merge``.
+    """
+    sprint_id = path.parent.name
+    last: Optional[dt.datetime] = None
+    with path.open(encoding="utf-8") as handle:
+        loader = StreamLoader(handle)
+        try:
+            loader.get_event()  # StreamStart
+            if not loader.check_event(yaml.DocumentStartEvent):
+                return
+            loader.get_event()
+            if not loader.check_event(yaml.MappingStartEvent):
+                return
+            loader.get_event()
+            while not loader.check_event(yaml.MappingEndEvent):
+                key = loader.construct_document(loader.compose_node(None, None))
+                if key not in CURSOR_KEYS or not loader.check_event(yaml.SequenceStartEvent):
+                    value = loader.construct_document(loader.compose_node(None, None))
+                    if key == "metadata" and isinstance(value, dict):
+                        value = value.get("sprint_id")
+                        key = "sprint_id"
+                    if key == "sprint_id" and value:
+                        sprint_id = str(value)
+                    continue
+                loader.get_event()
+                while not loader.check_event(yaml.SequenceEndEvent):
+                    entry = loader.construct_document(loader.compose_node(None, None))
+                    if not isinstance(entry, dict):
+                        continue
+                    cursor_id = str(entry.get("cursor_id", "?"))
+                    timestamp = to_utc(entry.get("timestamp"))
+                    problem = None
+                    if timestamp is None:
+                        problem = f"{path}: cursor {cursor_id} has no valid timestamp"
+                    elif last is not None and timestamp < last:
+                        problem = f"{path}: cursor {cursor_id} ({format_ts(timestamp)}) is earlier than the cursor before it"
+                    if problem is not None:
+                        if problems is None:
+                            raise ValueError(problem)
+                        problems.append(f"{problem}; skipped")
+                        continue
+                    last = timestamp
+                    yield CursorEvent(timestamp, sprint_id, cursor_id, cursor_updates(entry))
+                loader.get_event()
+        except yaml.YAMLError as exc:
+            if problems is None:
+                raise
+            problems.append(f"{path}: stopped after {format_ts(last) if last else 'no cursors'}: {exc}")
+        finally:
+            loader.dispose()
+
+
+def merged_events(paths: List[Path], problems: Optional[List[str]] = None) -> Iterator[CursorEvent]:
+    """Merge per-sprint streams by timestamp; ties keep path order."""
+    streams = [stream_cursor_file(path, problems) for path in paths]
+    return heapq.merge(*streams, key=lambda event: event.timestamp)
+
+
+def fold(state: State, event: CursorEvent) -> None:
+    for kind, artifact_id, status, progress in event.updates:
+        records = state[kind]
+        # Records are replaced, never mutated, so snapshots can share them.
+        record = dict(records.get(artifact_id, {}))
+        if status is not None:
+            record["status"] = status
+        if progress is not None:
+            record["progress_pct"] = progress
+        record.update(sprint=event.sprint_id, cursor_id=event.cursor_id, timestamp=event.timestamp)
+        records[artifact_id] = record
+
+
+def copy_state(state: State) -> State:
+    return {kind: dict(records) for kind, records in state.items()}
+
+
+class CursorReplay:
+    def __init__(self, snapshot_every: int = DEFAULT_SNAPSHOT_EVERY) -> None:
+        if snapshot_every < 1:
+            raise ValueError("snapshot_every must be at least 1")
+        self.snapshot_every = snapshot_every
+        self.events: List[CursorEvent] = []
+        self.times: List[dt.datetime] = []
+        # snapshots[i] is the state after the first i * snapshot_every events.
+        self.snapshots: List[State] = [{kind: {} for kind in KINDS}]
+        self.sources: Dict[str, List[int]] = {}
+        self.problems: List[str] = []
+
+    def build(self, events: Iterator[CursorEvent]) -> None:
+        state = copy_state(self.snapshots[-1])
+        for event in events:
+            fold(state, event)
+            self.events.append(event)
+            self.times.append(event.timestamp)
+            if len(self.events) % self.snapshot_every == 0:
+                self.snapshots.append(copy_state(state))
+
+    def state_at(self, when: Optional[dt.datetime] = None) -> State:
+        """State after every cursor with ``timestamp <= when`` (latest if None)."""
+        count = len(self.events) if when is None else bisect.bisect_right(self.times, when)
+        base = count // self.snapshot_every
+        state = copy_state(self.snapshots[base])
+        for event in self.events[base * self.snapshot_every : count]:
+            fold(state, event)
+        return state
+
+    def history(self, artifact_id: str) -> List[Tuple[CursorEvent, Update]]:
+        return [
+            (event, update)
+            for event in self.events
+            for update in event.updates
+            if update[1] == artifact_id
+        ]
+
+    # -- persistence -------------------------------------------------------
+
+    @classmethod
+    def load(cls, cache_path: Path, sources: Dict[str, List[int]], snapshot_every: int) -> Optional["CursorReplay"]:
+        try:
+            with cache_path.open("rb") as handle:
+                data = pickle.load(handle)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+            return None
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != CACHE_VERSION
+            or data.get("sources") != sources
+            or data.get("snapshot_every") != snapshot_every
+        ):
+            return None
+        replay = cls(snapshot_every)
+        replay.events = [CursorEvent(*event) for event in data["events"]]
+        replay.times = [event.timestamp for event in replay.events]
+        replay.snapshots = data["snapshots"]
+        replay.sources = sources
+        replay.problems = data.get("problems", [])
+        return replay
+
+    def save(self, cache_path: Path) -> None:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "version": CACHE_VERSION,
+            "sources": self.sources,
+            "snapshot_every": self.snapshot_every,
+            "events": [tuple(event) for event in self.events],
+            "snapshots": self.snapshots,
+            "problems": self.problems,
+        }
+        tmp_path = cache_path.with_suffix(".tmp")
+        with tmp_path.open("wb") as handle:
+            pickle.dump(payload, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+
+
+def cursor_paths(vault: Path) -> List[Path]:
+    return sorted((vault / "Sprints").glob(CURSOR_GLOB))
+
+
+def open_replay(
+    vault: Path,
+    cache_dir: Optional[Path] = None,
+    rebuild: bool = False,
+    snapshot_every: int = DEFAULT_SNAPSHOT_EVERY,
+) -> CursorReplay:
+    paths = cursor_paths(vault)
+    sources = {}
+    for path in paths:
+        stat = path.stat()
+        sources[path.relative_to(vault).as_posix()] = [stat.st_mtime_ns, stat.st_size]
+    cache_path = (cache_dir or default_cache_dir(vault)) / CACHE_FILENAME
+
+    replay = None if rebuild else CursorReplay.load(cache_path, sources, snapshot_every)
+    if replay is None:
+        replay = CursorReplay(snapshot_every)
+        replay.build(merged_events(paths, replay.problems))
+        replay.sources = sources
+        replay.save(cache_path)
+    return replay
+
+
+def _format_pct(value: Optional[float]) -> str:
+    if value is None:
+        return "—"
+    return f"{value:g}%"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Reconstruct artifact state from sprint progress cursors.")
+    parser.add_argument(
+        "--vault",
+        type=Path,
+        required=True,
+        help="Path to product root (e.g., SynapticTrading_Vault/Product)",
+    )
+    parser.add_argument("--cache-dir", type=Path, help="Replay cache location (default: <vault>/.vault-cache)")
+    parser.add_argument("--rebuild", action="store_true", help="Ignore the cached replay")
+    parser.add_argument("--as-of", help="ISO timestamp or date; default is the latest cursor")
+    parser.add_argument("--kind", choices=list(KINDS), help="Only show this artifact kind")
+    parser.add_argument("--history", metavar="ID", help="List every cursor that touched this artifact")
+    parser.add_argument(
+        "--snapshot-every",
+        type=int,
+        default=DEFAULT_SNAPSHOT_EVERY,
+        help="Events between stored state snapshots",
+    )
+    args = parser.parse_args()
+
+    when = None
+    if args.as_of:
+        when = to_utc(args.as_of)
+        if when is None:
+            parser.error(f"invalid --as-of value: {args.as_of}")
+        if len(args.as_of.strip()) == 10:
+            when += dt.timedelta(days=1) - dt.timedelta(microseconds=1)  # whole day
+
+    replay = open_replay(args.vault.resolve(), args.cache_dir, args.rebuild, args.snapshot_every)
+    for problem in replay.problems:
+        print(f"Warning: {problem}")
+
+    if args.history:
+        for event, (kind, _, status, progress) in replay.history(args.history):
+            print(
+                f"{format_ts(event.timestamp)}  {event.sprint_id} {event.cursor_id}  "
+                f"{kind} {status or '—'} {_format_pct(progress)}"
+            )
+        return
+
+    state = replay.state_at(when)
+    label = format_ts(when) if when else "latest cursor"
+    print(f"State as of {label} ({len(replay.events)} cursors from {len(replay.sources)} sprints)")
+    for kind in KINDS:
+        if args.kind and kind != args.kind:
+            continue
+        for artifact_id, record in sorted(state[kind].items()):
+            print(
+                f"{kind:8} {artifact_id:40} {record.get('status', '—'):12} "
+                f"{_format_pct(record.get('progress_pct')):>6}  "
+                f"{record['sprint']} {record['cursor_id']} {format_ts(record['timestamp'])}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Client side of ``vault_daemon.py``.
+
+The sync CLIs call ``run_via_daemon`` first. When a daemon for the same vault
+is listening on ``<cache-dir>/daemon.sock`` the operation runs there, against
+its warm model, and its output is relayed. ``None`` means no daemon accepted
+the connection, and the caller should continue in-process. Once a request has
+been sent the daemon may already be running it, so a failure after that point
+is reported as an error instead of being retried in-process.
+"""
+
+from __future__ import annotations
+
+import json
+import socket
+import sys
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+SOCKET_FILENAME = "daemon.sock"
+PROTOCOL_VERSION = 1
+CONNECT_TIMEOUT = 0.5
+REQUEST_TIMEOUT = 600.0
+
+
+class DaemonError(RuntimeError):
+    """The daemon accepted a request but no usable reply came back."""
+
+
+def socket_path(cache_dir: Path) -> Path:
+    return cache_dir / SOCKET_FILENAME
+
+
+def send_request(sock_path: Path, request: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Send one JSON request; ``None`` if nothing accepts the connection.
+
+    Raises ``DaemonError`` when the connection was accepted but the request
+    failed, timed out or got an unusable reply.
+    """
+    if not sock_path.exists():
+        return None
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+        conn.settimeout(CONNECT_TIMEOUT)
+        try:
+            conn.connect(str(sock_path))
+        except OSError:
+            return None
+        try:
+            conn.settimeout(REQUEST_TIMEOUT)
+            conn.sendall(json.dumps(request).encode("utf-8") + b"\n")
+            chunks = []
+            while True:
+                chunk = conn.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+            response = json.loads(b"".join(chunks).decode("utf-8"))
+        except socket.timeout:
+            raise DaemonError(f"no reply within {REQUEST_TIMEOUT:.0f}s") from None
+        except (OSError, ValueError) as exc:
+            raise DaemonError(f"request failed: {exc}") from exc
+    if not isinstance(response, dict) or response.get("protocol") != PROTOCOL_VERSION:
+        raise DaemonError(f"unexpected reply (protocol {PROTOCOL_VERSION} expected); restart the daemon")
+    return response
+
+
+def run_via_daemon(cache_dir: Path, vault: Path, op: str, args: Dict[str, Any]) -> Optional[int]:
+    """Run ``op`` in the daemon and relay its output; returns its exit code or ``None``.
+
+    A request the daemon accepted but did not answer is reported on stderr and
+    returns 1: it may have partly run, so it is not repeated in-process.
+    """
+    sock_path = socket_path(cache_dir)
+    try:
+        response = send_request(
+            sock_path,
+            {"protocol": PROTOCOL_VERSION, "op": op, "vault": str(vault), "args": args},
+        )
+    except DaemonError as exc:
+        print(f"Vault daemon on {sock_path}: {exc}; {op} was not re-run in-process", file=sys.stderr)
+        return 1
+    if response is None or response.get("vault") != str(vault):
+        return None
+    sys.stdout.write(response.get("stdout", ""))
+    if response.get("error"):
+        print(response["error"], file=sys.stderr)
+    return int(response.get("exit", 0))
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Front-matter reader shared by the sync scripts.
+
+Only the lines up to the closing ``---`` are read and parsed; the markdown body
+is returned as a ``LazyBody`` that loads the rest of the file on first use, so
+metadata-only callers never allocate the whole document. YAML is parsed with
+libyaml's ``CSafeLoader`` when PyYAML was built with it. PyYAML is imported on
+the first parse, so runs served entirely from the front-matter index skip it.
+"""
+
+from __future__ import annotations
+
+import io
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from profiling import count, phase
+
+SafeLoader: Any = None  # resolved by safe_loader(); bench_front_matter.py swaps loaders here
+
+DELIMITER = "---"
+
+
+def safe_loader() -> Any:
+    """The YAML loader class, importing PyYAML on first use."""
+    global SafeLoader
+    if SafeLoader is None:
+        import yaml
+
+        SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)  # SafeLoader if built without libyaml
+    return SafeLoader
+
+
+def load_yaml(text: str) -> Any:
+    with phase("yaml"):
+        loader = safe_loader()(text)  # what yaml.load() does, without importing yaml here
+        try:
+            return loader.get_single_data()
+        finally:
+            loader.dispose()
+
+
+class LazyBody:
+    """Markdown body after the front matter, read from disk only when needed."""
+
+    def __init__(self, path: Path, offset: int, text: Optional[str] = None) -> None:
+        self.path = path
+        self.offset = offset
+        self._text = text
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            with phase("read body"), self.path.open("rb") as handle:
+                handle.seek(self.offset)
+                raw = handle.read()
+                rest = raw.decode("utf-8")
+            count("bytes_read", len(raw))
+            self._text = "\n".join(rest.splitlines()).lstrip("\n")
+        return self._text
+
+    def __str__(self) -> str:
+        return self.text
+
+
+def _read_header(readline: Callable[[], str], path: Path) -> Optional[str]:
+    """Consume lines up to the closing delimiter; ``None`` if there is no front matter."""
+    if readline().strip() != DELIMITER:
+        return None
+    header = []
+    for line in iter(readline, ""):
+        if line.strip() == DELIMITER:
+            return "\n".join("".join(header).splitlines())
+        header.append(line)
+    raise ValueError(f"Front matter in {path} is not closed with '---'.")
+
+
+def read_front_matter_lazy(path: Path) -> Tuple[Dict[str, Any], LazyBody]:
+    """Parse the front matter of ``path`` without reading past the closing delimiter."""
+    with phase("read header"), path.open("rb") as handle:
+        front = _read_header(lambda: handle.readline().decode("utf-8"), path)
+        offset = handle.tell()
+    count("files_read")
+    count("bytes_read", offset)
+    if front is None:
+        return {}, LazyBody(path, 0)
+    return load_yaml(front) or {}, LazyBody(path, offset)
+
+
+def read_front_matter(path: Path) -> Tuple[Dict[str, Any], str]:
+    metadata, body = read_front_matter_lazy(path)
+    if body.offset == 0:
+        # No front matter: the caller gets the file verbatim.
+        return {}, path.read_text()
+    return metadata, body.text
+
+
+def front_matter_header(text: str, path: Path) -> Optional[str]:
+    """Raw YAML between the delimiters (starting at line 2 of the file), or ``None``."""
+    return _read_header(io.StringIO(text).readline, path)
+
+
+def parse_front_matter_text(text: str, path: Path) -> Dict[str, Any]:
+    """Parse front matter from already-loaded file content."""
+    front = front_matter_header(text, path)
+    if front is None:
+        return {}
+    return load_yaml(front) or {}
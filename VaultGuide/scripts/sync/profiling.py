@@ -0,0 +1,180 @@
+"""
+Lightweight phase timing and counters for the sync scripts and the dashboard.
+
+Code marks phases with ``with phase("yaml"):`` and bumps counters with
+``count("files_parsed")``. Both are no-ops until a CLI enables the shared
+``PROFILER`` through ``--profile``. At exit the profile is written either as a
+JSON summary (per-phase calls, total and max milliseconds, plus counters) or as
+a Chrome trace (``--profile-format chrome``), which loads in ``chrome://tracing``
+or https://ui.perfetto.dev.
+
+Phases that overlap on one thread, such as concurrent git subprocesses under
+asyncio, pass ``concurrent=True``. Each one is then drawn on its own lane
+instead of being nested.
+"""
+
+from __future__ import annotations
+
+import argparse
+import atexit
+import contextlib
+import json
+import os
+import sys
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+PROFILE_FORMATS = ("json", "chrome")
+LANE_BASE = 1_000_000  # Chrome trace tids for concurrent lanes, clear of thread idents
+
+_NULL = contextlib.nullcontext()
+
+
+class _Span:
+    __slots__ = ("profiler", "name", "cat", "args", "concurrent", "start", "tid")
+
+    def __init__(self, profiler: "Profiler", name: str, cat: str, args: Dict[str, Any], concurrent: bool) -> None:
+        self.profiler = profiler
+        self.name = name
+        self.cat = cat
+        self.args = args
+        self.concurrent = concurrent
+
+    def __enter__(self) -> "_Span":
+        self.tid = self.profiler._acquire_lane() if self.concurrent else threading.get_ident()
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        end = time.perf_counter_ns()
+        self.profiler._record(self.name, self.cat, self.start, end, self.tid, self.args)
+        if self.concurrent:
+            self.profiler._release_lane(self.tid)
+
+
+class Profiler:
+    def __init__(self) -> None:
+        self.enabled = False
+        self.events: List[Tuple[str, str, int, int, int, Dict[str, Any]]] = []
+        self.counters: Dict[str, float] = {}
+        self.origin = time.perf_counter_ns()
+        self._lock = threading.Lock()
+        self._free_lanes: List[int] = []
+        self._lanes = 0
+
+    def enable(self) -> None:
+        self.enabled = True
+        self.origin = time.perf_counter_ns()
+
+    def phase(self, name: str, cat: str = "phase", concurrent: bool = False, **args: Any) -> Any:
+        if not self.enabled:
+            return _NULL
+        return _Span(self, name, cat, args, concurrent)
+
+    def count(self, name: str, value: float = 1) -> None:
+        if self.enabled:
+            with self._lock:
+                self.counters[name] = self.counters.get(name, 0) + value
+
+    def _record(self, name: str, cat: str, start: int, end: int, tid: int, args: Dict[str, Any]) -> None:
+        self.events.append((name, cat, start, end, tid, args))
+
+    def _acquire_lane(self) -> int:
+        with self._lock:
+            if self._free_lanes:
+                return self._free_lanes.pop()
+            self._lanes += 1
+            return LANE_BASE + self._lanes
+
+    def _release_lane(self, lane: int) -> None:
+        with self._lock:
+            self._free_lanes.append(lane)
+            self._free_lanes.sort(reverse=True)  # reuse the lowest lane first
+
+    def summary(self) -> Dict[str, Any]:
+        phases: Dict[str, Dict[str, Any]] = {}
+        for name, _, start, end, _, _ in self.events:
+            stats = phases.setdefault(name, {"calls": 0, "total_ms": 0.0, "max_ms": 0.0})
+            duration = (end - start) / 1e6
+            stats["calls"] += 1
+            stats["total_ms"] += duration
+            stats["max_ms"] = max(stats["max_ms"], duration)
+        for stats in phases.values():
+            stats["total_ms"] = round(stats["total_ms"], 3)
+            stats["max_ms"] = round(stats["max_ms"], 3)
+        return {
+            "command": " ".join(sys.argv),
+            "wall_ms": round((time.perf_counter_ns() - self.origin) / 1e6, 3),
+            "phases": dict(sorted(phases.items(), key=lambda item: -item[1]["total_ms"])),
+            "counters": dict(sorted(self.counters.items())),
+        }
+
+    def chrome_trace(self) -> Dict[str, Any]:
+        pid = os.getpid()
+        trace: List[Dict[str, Any]] = []
+        for name, cat, start, end, tid, args in self.events:
+            event = {
+                "name": name,
+                "cat": cat,
+                "ph": "X",
+                "ts": (start - self.origin) / 1000,
+                "dur": (end - start) / 1000,
+                "pid": pid,
+                "tid": tid,
+            }
+            if args:
+                event["args"] = {key: str(value) for key, value in args.items()}
+            trace.append(event)
+        for lane in range(1, self._lanes + 1):
+            trace.append(
+                {"name": "thread_name", "ph": "M", "pid": pid, "tid": LANE_BASE + lane, "args": {"name": f"concurrent {lane}"}}
+            )
+        if self.counters:
+            trace.append(
+                {
+                    "name": "counters",
+                    "ph": "C",
+                    "ts": (time.perf_counter_ns() - self.origin) / 1000,
+                    "pid": pid,
+                    "args": dict(self.counters),
+                }
+            )
+        return {"traceEvents": trace, "displayTimeUnit": "ms"}
+
+    def write(self, target: str, fmt: str = "json") -> None:
+        payload = self.chrome_trace() if fmt == "chrome" else self.summary()
+        text = json.dumps(payload, indent=None if fmt == "chrome" else 2)
+        if target == "-":
+            print(text, file=sys.stderr)
+        else:
+            with open(target, "w", encoding="utf-8") as handle:
+                handle.write(text + "\n")
+
+
+PROFILER = Profiler()
+phase = PROFILER.phase
+count = PROFILER.count
+
+
+def add_profile_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--profile",
+        metavar="FILE",
+        help="Record phase timings and counters and write them to FILE at exit ('-' for stderr)",
+    )
+    parser.add_argument(
+        "--profile-format",
+        choices=PROFILE_FORMATS,
+        default="json",
+        help="Profile output: JSON summary or Chrome trace events",
+    )
+
+
+def enable_from_args(args: argparse.Namespace) -> Optional[str]:
+    """Enable the profiler if ``--profile`` was given; the file is written at exit."""
+    if not getattr(args, "profile", None):
+        return None
+    PROFILER.enable()
+    atexit.register(PROFILER.write, args.profile, args.profile_format)
+    return args.profile
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Content-addressed render cache for generated files.
+
+A generator hashes the semantic content it renders from, such as table rows or
+a metadata dict. It does not hash the bytes it would write. Embedded
+timestamps, YAML formatting and key order therefore do not count as changes.
+``RenderCache`` remembers, per output file, the digest of the content last
+written there and the file's size and mtime right after the write. When the
+next render has the same digest and the file is untouched, the write is
+skipped, along with its timestamp bump. Editors, Obsidian sync and CI then see
+no change. Entries live in ``<vault>/.vault-cache/render.sqlite``.
+
+Usage:
+    python render_cache.py --vault Product            # list cached outputs
+    python render_cache.py --vault Product --clear
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import hashlib
+import json
+import sqlite3
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+from frontmatter_index import default_cache_dir
+
+CACHE_FILENAME = "render.sqlite"
+CACHE_VERSION = 1
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (dt.date, dt.datetime)):
+        return value.isoformat()
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=str)
+    return str(value)
+
+
+def semantic_digest(value: Any, ignore: Iterable[str] = ()) -> str:
+    """SHA-256 of ``value`` as canonical JSON (sorted keys); top-level keys in ``ignore`` are left out."""
+    skip = set(ignore)
+    if skip and isinstance(value, dict):
+        value = {key: item for key, item in value.items() if key not in skip}
+    text = json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=_json_default)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def lines_digest(lines: Iterable[str]) -> str:
+    """SHA-256 of rendered lines, consumed one at a time."""
+    digest = hashlib.sha256()
+    for line in lines:
+        digest.update(line.encode("utf-8"))
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+class RenderCache:
+    """Digest of the content last written to each output path."""
+
+    def __init__(self, cache_dir: Path) -> None:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(cache_dir / CACHE_FILENAME))
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        if self.conn.execute("PRAGMA user_version").fetchone()[0] != CACHE_VERSION:
+            self.conn.execute("DROP TABLE IF EXISTS outputs")
+            self.conn.execute(f"PRAGMA user_version = {CACHE_VERSION}")
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS outputs (
+                path TEXT PRIMARY KEY,
+                digest TEXT NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                size INTEGER NOT NULL
+            )
+            """
+        )
+        self.conn.commit()
+
+    def __enter__(self) -> "RenderCache":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.conn.commit()
+        self.conn.close()
+
+    def lookup(self, path: Path) -> Optional[str]:
+        """Digest last recorded for ``path``, or ``None`` if unknown or the file changed since."""
+        row = self.conn.execute(
+            "SELECT digest, mtime_ns, size FROM outputs WHERE path = ?", (str(path.resolve()),)
+        ).fetchone()
+        if row is None:
+            return None
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+        return row[0] if (row[1], row[2]) == (stat.st_mtime_ns, stat.st_size) else None
+
+    def record(self, path: Path, digest: str) -> None:
+        """Remember that ``path``, as it is on disk now, holds output rendered from ``digest``."""
+        stat = path.stat()
+        self.conn.execute(
+            "INSERT OR REPLACE INTO outputs VALUES (?, ?, ?, ?)",
+            (str(path.resolve()), digest, stat.st_mtime_ns, stat.st_size),
+        )
+        self.conn.commit()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Inspect the render cache of generated files.")
+    parser.add_argument(
+        "--vault",
+        type=Path,
+        required=True,
+        help="Path to product root (e.g., SynapticTrading_Vault/Product)",
+    )
+    parser.add_argument("--cache-dir", type=Path, help="Cache location (default: <vault>/.vault-cache)")
+    parser.add_argument("--clear", action="store_true", help="Forget every digest; the next render writes")
+    args = parser.parse_args()
+
+    with RenderCache(args.cache_dir or default_cache_dir(args.vault.resolve())) as cache:
+        if args.clear:
+            cache.conn.execute("DELETE FROM outputs")
+            print("Cleared render cache")
+            return
+        for path, digest in cache.conn.execute("SELECT path, digest FROM outputs ORDER BY path"):
+            state = "current" if cache.lookup(Path(path)) == digest else "changed since write"
+            print(f"{digest[:12]}  {state:20} {path}")
+
+
+if __name__ == "__main__":
+    main()
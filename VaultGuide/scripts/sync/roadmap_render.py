@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Streaming renderer for named auto-generated blocks in markdown files.
+
+A block sits between marker comments, usually on lines of their own:
+
+    <!-- AUTO-ROADMAP-SUMMARY:START -->
+    ...generated content...
+    <!-- AUTO-ROADMAP-SUMMARY:END -->
+
+``render_blocks`` copies the file line by line into a temp file next to it. The
+body of every block named in ``blocks`` is replaced with lines drawn from that
+block's iterable, typically a generator over table rows. The temp file is then
+renamed over the original, so readers never see a half-written file. Memory
+stays flat no matter how large the file or the blocks are. Any number of blocks
+(e.g. per-epic and per-sprint tables) are rendered in one pass. Named blocks
+missing from the file are appended at the end. Blocks that were not named are
+copied unchanged.
+
+Usage:
+    python roadmap_render.py --file Product/ROADMAP.md --list
+    python roadmap_render.py --file Product/ROADMAP.md --show ROADMAP-SUMMARY
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, TextIO, Tuple
+
+from profiling import count, phase
+
+START_MARKER = re.compile(r"<!-- AUTO-(?P<name>[A-Za-z0-9_.-]+):START -->")
+ANY_MARKER = "<!-- AUTO-"
+
+
+class BlockError(ValueError):
+    """A block's START marker has no matching END marker."""
+
+
+def start_marker(name: str) -> str:
+    return f"<!-- AUTO-{name}:START -->"
+
+
+def end_marker(name: str) -> str:
+    return f"<!-- AUTO-{name}:END -->"
+
+
+def _next_start(line: str, pos: int, names: Mapping[str, object]) -> Optional[re.Match]:
+    if ANY_MARKER not in line:
+        return None
+    for match in START_MARKER.finditer(line, pos):
+        if match.group("name") in names:
+            return match
+    return None
+
+
+def _write_lines(out: TextIO, lines: Iterable[str]) -> int:
+    written = 0
+    for line in lines:
+        out.write(line)
+        out.write("\n")
+        written += 1
+    return written
+
+
+def render_blocks(
+    path: Path, blocks: Mapping[str, Iterable[str]], append_missing: bool = True
+) -> Dict[str, int]:
+    """Stream ``path`` through a temp file, replacing each named block; returns lines per block.
+
+    Each iterable yields lines without trailing newlines and is consumed exactly
+    once. On any error the temp file is removed and ``path`` is left untouched.
+    """
+    import tempfile  # only writes need it; --check and reads stay light
+
+    pending = dict(blocks)
+    rendered: Dict[str, int] = {}
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline="") as out:
+            with path.open(encoding="utf-8", newline="") as src:
+                skipping: Optional[str] = None  # block whose old body is being dropped
+                opened_at = 0
+                blanks: List[str] = []  # trailing blank lines, held back in case blocks are appended
+                last = ""
+                for number, line in enumerate(src, 1):
+                    last = line
+                    if skipping is None and not line.strip():
+                        blanks.append(line)
+                        continue
+                    if blanks and skipping is None:
+                        out.writelines(blanks)
+                        blanks.clear()
+                    pos = 0
+                    while True:
+                        if skipping is not None:
+                            end = line.find(end_marker(skipping), pos)
+                            if end == -1:
+                                break  # the rest of this line belongs to the old block body
+                            skipping, pos = None, end
+                        match = _next_start(line, pos, pending)
+                        if match is None:
+                            out.write(line[pos:])
+                            break
+                        name = match.group("name")
+                        out.write(line[pos : match.end()] + "\n")
+                        rendered[name] = _write_lines(out, pending.pop(name))
+                        skipping, opened_at, pos = name, number, match.end()
+                if skipping is not None:
+                    raise BlockError(f"{path}:{opened_at}: {start_marker(skipping)} has no matching END marker")
+
+            if pending and append_missing:
+                if last and not last.endswith("\n"):
+                    out.write("\n")
+                for name, lines in pending.items():
+                    out.write(f"\n{start_marker(name)}\n")
+                    rendered[name] = _write_lines(out, lines)
+                    out.write(f"{end_marker(name)}\n")
+            else:
+                out.writelines(blanks)
+            out.flush()
+            os.fsync(out.fileno())
+        os.chmod(tmp_path, path.stat().st_mode & 0o7777)
+        count("bytes_written", os.path.getsize(tmp_path))
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return rendered
+
+
+def read_block(path: Path, name: str) -> Optional[str]:
+    """Body of block ``name`` in ``path`` (first occurrence), or ``None`` if absent or unterminated."""
+    start, end = start_marker(name), end_marker(name)
+    body: Optional[List[str]] = None
+    with phase("read block"), path.open(encoding="utf-8") as src:
+        for line in src:
+            if body is None:
+                pos = line.find(start)
+                if pos == -1:
+                    continue
+                body = []
+                line = line[pos + len(start) :]
+            pos = line.find(end)
+            if pos != -1:
+                body.append(line[:pos])
+                return "".join(body).strip("\n")
+            body.append(line)
+    return None
+
+
+def iter_blocks(path: Path) -> Iterator[Tuple[str, int, Optional[int]]]:
+    """(name, start line, end line) of every block in ``path``; end is ``None`` if unterminated."""
+    open_name: Optional[str] = None
+    opened_at = 0
+    with path.open(encoding="utf-8") as src:
+        for number, line in enumerate(src, 1):
+            if ANY_MARKER not in line:
+                continue
+            if open_name is not None and end_marker(open_name) in line:
+                yield open_name, opened_at, number
+                open_name = None
+            if open_name is None:
+                match = START_MARKER.search(line)
+                if match:
+                    open_name, opened_at = match.group("name"), number
+    if open_name is not None:
+        yield open_name, opened_at, None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Inspect AUTO-*:START/END blocks in a markdown file.")
+    parser.add_argument("--file", type=Path, required=True, help="Markdown file (e.g. Product/ROADMAP.md)")
+    action = parser.add_mutually_exclusive_group(required=True)
+    action.add_argument("--list", action="store_true", help="List blocks with their line ranges")
+    action.add_argument("--show", metavar="NAME", help="Print the body of one block")
+    args = parser.parse_args()
+
+    if args.list:
+        for name, start, end in iter_blocks(args.file):
+            span = f"{start}-{end}" if end is not None else f"{start}- (no END marker)"
+            print(f"{name:<30} lines {span}")
+        return
+    body = read_block(args.file, args.show)
+    if body is None:
+        print(f"No complete AUTO-{args.show} block in {args.file}", file=sys.stderr)
+        sys.exit(1)
+    print(body)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,20 +1,40 @@
 #!/usr/bin/env python3
 """
 Regenerate the auto-summary block in the roadmap based on epic metadata.
+
+The roadmap is rewritten by ``roadmap_render.render_blocks``. It streams the
+file through a temp file and renames it into place, and the table rows are
+generated one at a time, so memory does not grow with the roadmap.
 """
 
 from __future__ import annotations
 
 import argparse
 import datetime as dt
+import itertools
+import json
 import re
+import sys
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
-import yaml
+from frontmatter import read_front_matter, read_front_matter_lazy  # noqa: F401
+from frontmatter_index import (
+    FrontMatterIndex,
+    default_cache_dir,
+    iter_artifact_paths,
+    load_many,
+    open_index,
+)
+from profiling import add_profile_arguments, count, enable_from_args, phase
+from render_cache import RenderCache, lines_digest
+from roadmap_render import end_marker, read_block, render_blocks, start_marker
 
-AUTO_START = "<!-- AUTO-ROADMAP-SUMMARY:START -->"
-AUTO_END = "<!-- AUTO-ROADMAP-SUMMARY:END -->"
+SUMMARY_BLOCK = "ROADMAP-SUMMARY"
+AUTO_START = start_marker(SUMMARY_BLOCK)
+AUTO_END = end_marker(SUMMARY_BLOCK)
+STATE_FILENAME = "roadmap_sync.json"
+EPIC_README = re.compile(r"EPIC-[^/]+/README\.md")
 
 STATUS_EMOJI = {
     "completed": "✅",
@@ -27,66 +47,82 @@ STATUS_EMOJI = {
 }
 
 
-def read_front_matter(path: Path) -> Tuple[Dict[str, Any], str]:
-    text = path.read_text()
-    lines = text.splitlines()
-    if not lines or lines[0].strip() != "---":
-        return {}, text
-    end_idx = None
-    for idx, line in enumerate(lines[1:], start=1):
-        if line.strip() == "---":
-            end_idx = idx
-            break
-    if end_idx is None:
-        raise ValueError(f"Front matter in {path} is not closed with '---'.")
-    front = "\n".join(lines[1:end_idx])
-    body = "\n".join(lines[end_idx + 1 :]).lstrip("\n")
-    data = yaml.safe_load(front) or {}
-    return data, body
-
-
-def collect_epic_metadata(epics_dir: Path) -> List[Dict[str, Any]]:
+def epic_readmes(epics_dir: Path) -> List[Path]:
+    with phase("glob"):
+        return [
+            dir_path / "README.md"
+            for dir_path in sorted(epics_dir.glob("EPIC-*"))
+            if dir_path.is_dir() and (dir_path / "README.md").exists()
+        ]
+
+
+def epic_rows(
+    readmes: List[Path], index: Optional[FrontMatterIndex] = None, jobs: int = 1
+) -> List[Dict[str, Any]]:
+    if index is None and jobs == 1:
+        parsed = [read_front_matter_lazy(path)[0] for path in readmes]
+    else:
+        parsed = load_many(readmes, jobs, index)
+
     rows: List[Dict[str, Any]] = []
-    for dir_path in epics_dir.glob("EPIC-*"):
-        if not dir_path.is_dir():
-            continue
-        readme_path = dir_path / "README.md"
-        if not readme_path.exists():
-            continue
-        metadata, _ = read_front_matter(readme_path)
+    for readme_path, metadata in zip(readmes, parsed):
         epic_id = metadata.get("id") or metadata.get("epic_id")
         if not epic_id:
             continue
         rows.append(
             {
                 "id": epic_id,
-                "title": metadata.get("title", dir_path.name),
+                "title": metadata.get("title", readme_path.parent.name),
                 "status": metadata.get("status", metadata.get("epic_status", "planned")),
                 "progress_pct": metadata.get("progress_pct", metadata.get("progress", 0)),
                 "linked_sprints": metadata.get("linked_sprints", metadata.get("sprints", [])),
                 "change_log": metadata.get("change_log", []),
                 "updated_at": metadata.get("updated_at"),
+                "readme": f"{readme_path.parent.name}/{readme_path.name}",
             }
         )
     rows.sort(key=lambda row: row["id"])
     return rows
 
 
-def build_table(rows: List[Dict[str, Any]]) -> str:
-    header = [
-        "| Epic | Status | Progress | Recent Sprints | Last Update |",
-        "|------|--------|----------|----------------|-------------|",
-    ]
+def collect_epic_metadata(
+    epics_dir: Path, index: Optional[FrontMatterIndex] = None, jobs: int = 1
+) -> List[Dict[str, Any]]:
+    return epic_rows(epic_readmes(epics_dir), index, jobs)
+
+
+def collect_artifact_metadata(
+    epics_dir: Path, index: Optional[FrontMatterIndex] = None, jobs: int = 1
+) -> List[Tuple[Path, Dict[str, Any]]]:
+    """Front matter of every epic, feature and story markdown file, sorted by path."""
+    paths = iter_artifact_paths(epics_dir)
+    return list(zip(paths, load_many(paths, jobs, index)))
+
+
+TABLE_HEADER = [
+    "| Epic | Status | Progress | Recent Sprints | Last Update |",
+    "|------|--------|----------|----------------|-------------|",
+]
+
+
+def render_row(row: Dict[str, Any]) -> str:
+    emoji = STATUS_EMOJI.get(row["status"], "•")
+    progress = f"{row.get('progress_pct', 0)}%"
+    linked = row.get("linked_sprints") or []
+    recent = ", ".join(linked[-3:])
+    updated = row.get("updated_at", "—")
+    return f"| {row['id']} | {emoji} {row['status']} | {progress} | {recent or '—'} | {updated} |"
+
+
+def table_lines(rows: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    yield from TABLE_HEADER
     for row in rows:
-        emoji = STATUS_EMOJI.get(row["status"], "•")
-        progress = f"{row.get('progress_pct', 0)}%"
-        linked = row.get("linked_sprints") or []
-        recent = ", ".join(linked[-3:])
-        updated = row.get("updated_at", "—")
-        header.append(
-            f"| {row['id']} | {emoji} {row['status']} | {progress} | {recent or '—'} | {updated} |"
-        )
-    return "\n".join(header)
+        yield render_row(row)
+
+
+def build_table(rows: List[Dict[str, Any]]) -> str:
+    with phase("render"):
+        return "\n".join(table_lines(rows))
 
 
 def replace_block(content: str, block: str) -> str:
@@ -100,6 +136,207 @@ def replace_block(content: str, block: str) -> str:
     return content.rstrip() + "\n\n" + replacement + "\n"
 
 
+def extract_block(content: str) -> Optional[str]:
+    start = content.find(AUTO_START)
+    end = content.find(AUTO_END, start)
+    if start == -1 or end == -1:
+        return None
+    return content[start + len(AUTO_START) : end].strip("\n")
+
+
+def table_row_lines(block: str) -> List[str]:
+    return [line for line in block.splitlines() if line.startswith("| ") and line not in TABLE_HEADER]
+
+
+def run_git(cwd: Path, *args: str) -> Optional[str]:
+    import subprocess  # only incremental runs and saved state need git
+
+    count("git_calls")
+    try:
+        with phase(f"git {args[0]}", cat="git"):
+            result = subprocess.run(
+                ["git", *args], cwd=cwd, capture_output=True, text=True, check=False
+            )
+    except OSError:
+        return None
+    return result.stdout if result.returncode == 0 else None
+
+
+def git_changed_paths(epics_dir: Path, since: str) -> Optional[Set[str]]:
+    """Paths under ``epics_dir`` changed since commit ``since``, including uncommitted edits."""
+    diff = run_git(epics_dir, "diff", "--name-only", "--no-renames", "--relative", since, "--", ".")
+    untracked = run_git(epics_dir, "ls-files", "--others", "--exclude-standard", "--", ".")
+    if diff is None or untracked is None:
+        return None
+    return {line for line in (diff + untracked).splitlines() if line}
+
+
+def git_dirty_paths(epics_dir: Path) -> Set[str]:
+    diff = run_git(epics_dir, "diff", "--name-only", "--no-renames", "--relative", "HEAD", "--", ".") or ""
+    untracked = run_git(epics_dir, "ls-files", "--others", "--exclude-standard", "--", ".") or ""
+    return {line for line in (diff + untracked).splitlines() if line}
+
+
+def load_sync_state(state_path: Path) -> Dict[str, Any]:
+    try:
+        return json.loads(state_path.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def save_sync_state(
+    state_path: Path, epics_dir: Path, roadmap_path: Path, rows: List[Dict[str, Any]], digest: str
+) -> None:
+    head = run_git(epics_dir, "rev-parse", "HEAD")
+    if head is None:
+        return
+    state = {
+        "commit": head.strip(),
+        "roadmap": str(roadmap_path),
+        # Render-cache digest of the table as written; incremental runs trust the block only while it matches.
+        "digest": digest,
+        # Uncommitted edits already rendered; re-check them next run even if reverted.
+        "dirty": sorted(git_dirty_paths(epics_dir)),
+        # In table order: the i-th README owns the i-th row of the block.
+        "epics": {row["readme"]: row["id"] for row in rows},
+    }
+    state_path.parent.mkdir(parents=True, exist_ok=True)
+    state_path.write_text(json.dumps(state, indent=2) + "\n")
+
+
+def incremental_rows(
+    epics_dir: Path,
+    roadmap_path: Path,
+    block: Optional[str],
+    state: Dict[str, Any],
+    index: Optional[FrontMatterIndex],
+    cache: RenderCache,
+) -> Optional[Tuple[List[str], List[Dict[str, Any]]]]:
+    """Patch only the table rows of epics changed since the last sync.
+
+    Returns the rendered rows and the (id, readme) rows for the new state, or
+    ``None`` when a full rebuild is required. The old block is trusted only
+    while the render cache vouches that the roadmap is exactly as the last sync
+    left it, so a revert, checkout, merge or hand edit forces a rebuild. Rows
+    are keyed by README, as in the full build, so duplicate ids keep their rows.
+    """
+    if block is None or state.get("roadmap") != str(roadmap_path) or "commit" not in state:
+        return None
+    if cache.lookup(roadmap_path) != state.get("digest"):
+        return None
+    known: Dict[str, str] = state.get("epics", {})
+    lines = table_row_lines(block)
+    if len(lines) != len(known):
+        return None
+    changed = git_changed_paths(epics_dir, state["commit"])
+    if changed is None:
+        return None
+    changed.update(state.get("dirty", []))
+    affected = {path for path in changed if EPIC_README.fullmatch(path)}
+
+    rendered = {
+        readme: (epic_id, line)
+        for (readme, epic_id), line in zip(known.items(), lines)
+        if readme not in affected
+    }
+    fresh = epic_rows(
+        [epics_dir / readme for readme in sorted(affected) if (epics_dir / readme).exists()],
+        index,
+    )
+    for row in fresh:
+        rendered[row["readme"]] = (row["id"], render_row(row))
+
+    order = sorted(rendered, key=lambda readme: (rendered[readme][0], readme))
+    rows = [{"readme": readme, "id": rendered[readme][0]} for readme in order]
+    return [rendered[readme][1] for readme in order], rows
+
+
+def sync_roadmap(
+    vault: Path,
+    roadmap_path: Path,
+    index: Optional[FrontMatterIndex],
+    state_path: Path,
+    jobs: int = 1,
+    incremental: bool = False,
+    check: bool = False,
+) -> bool:
+    """Regenerate the summary block; returns False when the file was left untouched.
+
+    With ``check`` nothing is written and the result says whether a sync
+    would change the table.
+    """
+    epics_dir = vault / "EPICS"
+    if not epics_dir.exists():
+        raise FileNotFoundError(epics_dir)
+    if not roadmap_path.exists():
+        raise FileNotFoundError(roadmap_path)
+    # A plain sync reads the old block only when the render cache cannot vouch for the file.
+    block = read_block(roadmap_path, SUMMARY_BLOCK) if incremental or check else None
+
+    with RenderCache(state_path.parent) as cache:
+        patched = None
+        if incremental:
+            patched = incremental_rows(epics_dir, roadmap_path, block, load_sync_state(state_path), index, cache)
+        table: Callable[[], Iterable[str]]
+        if patched is not None:
+            rendered, rows = patched
+            table = lambda: TABLE_HEADER + rendered  # noqa: E731
+        else:
+            rows = collect_epic_metadata(epics_dir, index, jobs)
+            table = lambda: table_lines(rows)  # noqa: E731
+
+        if check:
+            return block is None or not block.endswith("\n".join(table()))
+
+        digest = lines_digest(table())
+        known = cache.lookup(roadmap_path)
+        if known is None and not incremental:
+            block = read_block(roadmap_path, SUMMARY_BLOCK)  # first run, or the file was edited since
+        if known == digest or (known is None and block is not None and block.endswith("\n".join(table()))):
+            # Nothing rendered differently: keep the old timestamp and skip the write.
+            count("writes_skipped")
+            if known is None:
+                cache.record(roadmap_path, digest)
+            save_sync_state(state_path, epics_dir, roadmap_path, rows, digest)
+            return False
+
+        synced_at = (
+            dt.datetime.now(dt.timezone.utc)
+            .replace(microsecond=0)
+            .isoformat()
+            .replace("+00:00", "Z")
+        )
+        with phase("write"):
+            render_blocks(roadmap_path, {SUMMARY_BLOCK: itertools.chain([f"_Auto-sync: {synced_at}_", ""], table())})
+        count("files_written")
+        cache.record(roadmap_path, digest)
+    save_sync_state(state_path, epics_dir, roadmap_path, rows, digest)
+    return True
+
+
+def run_sync(
+    vault: Path,
+    roadmap_path: Path,
+    index: Optional[FrontMatterIndex],
+    state_path: Path,
+    jobs: int = 1,
+    incremental: bool = False,
+    check: bool = False,
+) -> int:
+    """Sync (or check) and report; returns the process exit code."""
+    changed = sync_roadmap(vault, roadmap_path, index, state_path, jobs, incremental, check)
+    if check:
+        if changed:
+            print(f"Roadmap summary is out of date in {roadmap_path}")
+            return 1
+        print(f"Roadmap summary is up to date in {roadmap_path}")
+    elif changed:
+        print(f"Updated roadmap summary in {roadmap_path}")
+    else:
+        print(f"Roadmap summary unchanged in {roadmap_path}; write skipped")
+    return 0
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Sync roadmap summary with epic metadata.")
     parser.add_argument(
@@ -114,29 +351,71 @@ def main() -> None:
         default=Path("ROADMAP.md"),
         help="Roadmap file relative to the product root",
     )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        help="Front-matter index location (default: <vault>/.vault-cache)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Parse every README instead of using the front-matter index",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for parsing uncached READMEs (0 = one per CPU core)",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Re-parse only epics changed in git since the last sync; skip the write if no row changes",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Do not write; exit 1 if the summary block is out of date",
+    )
+    parser.add_argument(
+        "--no-daemon",
+        action="store_true",
+        help="Run in-process even if vault_daemon.py is serving this vault",
+    )
+    add_profile_arguments(parser)
     args = parser.parse_args()
+    enable_from_args(args)
 
-    epics_dir = args.vault / "EPICS"
-    if not epics_dir.exists():
-        raise FileNotFoundError(epics_dir)
+    vault = args.vault.resolve()
+    roadmap_path = (args.vault / args.roadmap).resolve()
+    cache_dir = args.cache_dir or default_cache_dir(vault)
+    state_path = cache_dir / STATE_FILENAME
 
-    rows = collect_epic_metadata(epics_dir)
-    table = build_table(rows)
-    synced_at = (
-        dt.datetime.now(dt.timezone.utc)
-        .replace(microsecond=0)
-        .isoformat()
-        .replace("+00:00", "Z")
-    )
-    block = f"_Auto-sync: {synced_at}_\n\n{table}"
+    # A profile of the daemon round trip says nothing useful; profile in-process.
+    if not (args.no_daemon or args.no_cache or args.profile):
+        from daemon_client import run_via_daemon
 
-    roadmap_path = (args.vault / args.roadmap).resolve()
-    if not roadmap_path.exists():
-        raise FileNotFoundError(roadmap_path)
-    content = roadmap_path.read_text()
-    updated = replace_block(content, block)
-    roadmap_path.write_text(updated)
-    print(f"Updated roadmap summary in {roadmap_path}")
+        code = run_via_daemon(
+            cache_dir,
+            vault,
+            "roadmap-sync",
+            {
+                "roadmap": str(roadmap_path),
+                "state": str(state_path.resolve()),
+                "jobs": args.jobs,
+                "incremental": args.incremental,
+                "check": args.check,
+            },
+        )
+        if code is not None:
+            sys.exit(code)
+
+    if args.no_cache:
+        code = run_sync(vault, roadmap_path, None, state_path, args.jobs, args.incremental, args.check)
+    else:
+        with open_index(vault, cache_dir) as index:
+            code = run_sync(vault, roadmap_path, index, state_path, args.jobs, args.incremental, args.check)
+    sys.exit(code)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+"""
+Velocity, estimate accuracy and throughput from sprint ``planned_items``.
+
+Each ``execution_summary.yaml`` contributes its planned items as NumPy columns
+(epic, feature, type, status, estimated/actual hours). Columns are cached per
+summary under ``<vault>/.vault-cache/analytics/<sha256>.npz``, so only new or
+edited summaries are parsed again, and the concatenated columns are cached
+against the full list of digests. Files of summaries that were edited or
+removed are deleted whenever the concatenation is rebuilt. All metrics are computed over the
+concatenated columns with ``bincount`` reductions and index arithmetic, with no per-item
+Python loops:
+
+* per epic: planned/completed items and hours, velocity (completed estimated
+  hours per sprint the epic appears in), estimate bias and MAPE over completed
+  items that have both estimated and actual hours;
+* per sprint, in ``ended_at`` order (open sprints last): completed items and
+  hours, change from the previous sprint, and a 3-sprint moving average.
+
+Requires numpy.
+
+Usage:
+    python sprint_analytics.py --vault Product
+    python sprint_analytics.py --vault Product --json > analytics.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import datetime as dt
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+import numpy as np
+import yaml
+
+from frontmatter import load_yaml
+from frontmatter_index import default_cache_dir
+
+ANALYTICS_DIRNAME = "analytics"
+COMBINED_FILENAME = "columns.npz"
+CACHE_VERSION = 1
+SUMMARY_GLOB = "*/execution_summary.yaml"
+COMPLETED_STATUSES = ("completed", "complete", "done")
+TREND_WINDOW = 3
+COLUMN_NAMES = ("sprint_id", "ended_at", "epic", "feature", "type", "status", "estimated", "actual")
+
+Columns = Dict[str, np.ndarray]
+
+
+def _hours(value: Any) -> float:
+    if isinstance(value, bool) or value is None:
+        return np.nan
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def _ended_at(value: Any) -> np.datetime64:
+    if isinstance(value, dt.datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(dt.timezone.utc).replace(tzinfo=None)
+        return np.datetime64(value, "s")
+    if isinstance(value, dt.date):
+        return np.datetime64(value.isoformat(), "s")
+    if isinstance(value, str) and value.strip():
+        try:
+            return np.datetime64(value.strip().rstrip("Z"), "s")
+        except ValueError:
+            pass
+    return np.datetime64("NaT", "s")
+
+
+def parse_summary(path: Path) -> Columns:
+    """Planned items of one summary as columns; per-sprint values are length-1 arrays."""
+    summary = load_yaml(path.read_text()) or {}
+    if not isinstance(summary, dict):
+        raise ValueError(f"expected a mapping at the top level, got {type(summary).__name__}")
+    items = [item for item in summary.get("planned_items") or [] if isinstance(item, dict)]
+    text = {field: [str(item.get(field) or "") for item in items] for field in ("linked_epic", "linked_feature", "type")}
+    return {
+        "sprint_id": np.array([str(summary.get("sprint_id") or path.parent.name)]),
+        "ended_at": np.array([_ended_at(summary.get("ended_at"))]),
+        "epic": np.array(text["linked_epic"], dtype=str),
+        "feature": np.array(text["linked_feature"], dtype=str),
+        "type": np.array(text["type"], dtype=str),
+        "status": np.array([str(item.get("status") or "").lower().replace("-", "_") for item in items], dtype=str),
+        "estimated": np.array([_hours(item.get("estimated_hours")) for item in items], dtype=np.float64),
+        "actual": np.array([_hours(item.get("actual_hours")) for item in items], dtype=np.float64),
+    }
+
+
+def summary_digest(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes() + f"v{CACHE_VERSION}".encode()).hexdigest()
+
+
+def _read_npz(path: Path) -> Optional[Columns]:
+    try:
+        with np.load(path, allow_pickle=False) as cached:
+            return {name: cached[name] for name in cached.files}
+    except (OSError, ValueError):
+        return None
+
+
+def _write_npz(path: Path, columns: Columns) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    with tmp_path.open("wb") as handle:
+        np.savez(handle, **columns)
+    os.replace(tmp_path, path)
+
+
+def load_summary(path: Path, cache_dir: Optional[Path], digest: Optional[str] = None) -> Columns:
+    if cache_dir is None:
+        return parse_summary(path)
+    cache_path = cache_dir / f"{digest or summary_digest(path)}.npz"
+    columns = _read_npz(cache_path)
+    if columns is None:
+        columns = parse_summary(path)
+        _write_npz(cache_path, columns)
+    return columns
+
+
+def _concatenate(parts: List[Columns]) -> Columns:
+    if not parts:
+        empty_text = np.array([], dtype=str)
+        return {
+            "sprint_id": empty_text,
+            "ended_at": np.array([], dtype="datetime64[s]"),
+            "sprint": np.array([], dtype=np.intp),
+            **{name: empty_text for name in ("epic", "feature", "type", "status")},
+            **{name: np.array([], dtype=np.float64) for name in ("estimated", "actual")},
+        }
+    counts = np.array([len(part["status"]) for part in parts])
+    columns = {name: np.concatenate([part[name] for part in parts]) for name in COLUMN_NAMES}
+    columns["sprint"] = np.repeat(np.arange(len(parts)), counts)
+    return columns
+
+
+def load_columns(
+    paths: List[Path], cache_dir: Optional[Path] = None, problems: Optional[List[str]] = None
+) -> Columns:
+    """Concatenate every summary's items; ``sprint`` indexes into ``sprint_id``/``ended_at``.
+
+    With a cache, the concatenation itself is stored next to the per-summary
+    files together with the digests it was built from, so an unchanged set of
+    summaries costs one hash per file and a single ``np.load``.
+
+    A summary that cannot be read or parsed raises, unless ``problems`` is
+    given: then it is left out and reported there instead. Parse failures are
+    stored with the concatenation, so a cached run reports them again.
+    """
+    skipped: List[str] = []
+
+    def guarded(load: Any, path: Path, *args: Any) -> Any:
+        try:
+            return load(path, *args)
+        except (OSError, ValueError, yaml.YAMLError) as exc:
+            if problems is None:
+                raise
+            skipped.append(f"{path}: {exc}; skipped")
+            return None
+
+    if cache_dir is None:
+        parts = [guarded(parse_summary, path) for path in paths]
+        if problems is not None:
+            problems.extend(skipped)
+        return _concatenate([part for part in parts if part is not None])
+    hashed = [(path, guarded(summary_digest, path)) for path in paths]
+    unreadable, skipped = skipped, []
+    hashed = [(path, digest) for path, digest in hashed if digest is not None]
+    digests = np.array([digest for _, digest in hashed], dtype=str)
+    combined = _read_npz(cache_dir / COMBINED_FILENAME)
+    if combined is not None and np.array_equal(combined.pop("digests"), digests):
+        skipped = combined.pop("problems", np.array([], dtype=str)).tolist()
+        columns = combined
+    else:
+        parts = [guarded(load_summary, path, cache_dir, digest) for path, digest in hashed]
+        columns = _concatenate([part for part in parts if part is not None])
+        stored = {**columns, "digests": digests, "problems": np.array(skipped, dtype=str)}
+        _write_npz(cache_dir / COMBINED_FILENAME, stored)
+        prune_cache(cache_dir, set(digests.tolist()))
+    if problems is not None:
+        problems.extend(unreadable + skipped)
+    return columns
+
+
+def prune_cache(cache_dir: Path, digests: Set[str]) -> int:
+    """Delete per-summary ``.npz`` files whose digest is not in ``digests``; returns how many."""
+    removed = 0
+    for cached in cache_dir.glob("*.npz"):
+        if cached.name != COMBINED_FILENAME and cached.stem not in digests:
+            with contextlib.suppress(FileNotFoundError):  # a concurrent run pruned it first
+                cached.unlink()
+                removed += 1
+    return removed
+
+
+def _ratio(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    return np.divide(numerator, denominator, out=np.full(numerator.shape, np.nan), where=denominator != 0)
+
+
+def analyze(columns: Columns) -> Dict[str, Any]:
+    sprint_ids = columns["sprint_id"]
+    order = np.argsort(columns["ended_at"], kind="stable")  # NaT (open sprints) sorts last
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+    item_rank = rank[columns["sprint"]]
+
+    epics, epic_idx = np.unique(columns["epic"], return_inverse=True)
+    n_epics, n_sprints = len(epics), len(sprint_ids)
+    estimated, actual = columns["estimated"], columns["actual"]
+
+    done = np.isin(columns["status"], COMPLETED_STATUSES)
+    has_est = ~np.isnan(estimated)
+    measured = done & has_est & ~np.isnan(actual) & (estimated > 0)
+    est = np.where(has_est, estimated, 0.0)
+    error = _ratio(np.where(measured, actual - est, 0.0), np.where(measured, est, 0.0))
+    error = np.where(measured, error, 0.0)
+
+    def per_epic(weights: np.ndarray) -> np.ndarray:
+        return np.bincount(epic_idx, weights=weights, minlength=n_epics)
+
+    planned = np.bincount(epic_idx, minlength=n_epics)
+    completed = per_epic(done.astype(float))
+    done_hours = per_epic(np.where(done, est, 0.0))
+    measured_count = per_epic(measured.astype(float))
+    actual_hours = per_epic(np.where(measured, actual, 0.0))
+    measured_est = per_epic(np.where(measured, est, 0.0))
+
+    presence = np.zeros((n_epics, n_sprints), dtype=bool)
+    presence[epic_idx, item_rank] = True
+    sprints_touched = presence.sum(axis=1)
+
+    sprint_items = np.bincount(item_rank, weights=done.astype(float), minlength=n_sprints)
+    sprint_hours = np.bincount(item_rank, weights=np.where(done, est, 0.0), minlength=n_sprints)
+    sprint_planned = np.bincount(item_rank, weights=est, minlength=n_sprints)
+    change = np.concatenate([[np.nan], np.diff(sprint_hours)]) if n_sprints else sprint_hours
+    window = np.ones(TREND_WINDOW) / TREND_WINDOW
+    moving = np.full(n_sprints, np.nan)
+    if n_sprints >= TREND_WINDOW:
+        moving[TREND_WINDOW - 1 :] = np.convolve(sprint_hours, window, mode="valid")
+
+    epic_rows = {
+        "epic": epics.tolist(),
+        "planned_items": planned.tolist(),
+        "completed_items": completed.astype(int).tolist(),
+        "estimated_hours": per_epic(est).tolist(),
+        "completed_hours": done_hours.tolist(),
+        "sprints": sprints_touched.tolist(),
+        "velocity": _ratio(done_hours, sprints_touched.astype(float)).tolist(),
+        "estimate_bias_pct": (_ratio(per_epic(error), measured_count) * 100).tolist(),
+        "estimate_mape_pct": (_ratio(per_epic(np.abs(error)), measured_count) * 100).tolist(),
+        "actual_vs_estimate": _ratio(actual_hours, measured_est).tolist(),
+    }
+    ended = columns["ended_at"][order]
+    sprint_rows = {
+        "sprint_id": sprint_ids[order].tolist(),
+        "ended_at": [None if np.isnat(value) else f"{value}Z" for value in ended],
+        "planned_hours": sprint_planned.tolist(),
+        "completed_items": sprint_items.astype(int).tolist(),
+        "completed_hours": sprint_hours.tolist(),
+        "change_hours": change.tolist(),
+        "moving_avg_hours": moving.tolist(),
+    }
+    return {
+        "items": int(len(epic_idx)),
+        "epics": _rows(epic_rows),
+        "sprints": _rows(sprint_rows),
+    }
+
+
+def _rows(columns: Dict[str, list]) -> List[Dict[str, Any]]:
+    """Column lists to JSON-ready row dicts, with NaN as None."""
+    names = list(columns)
+    return [
+        {name: (None if isinstance(value, float) and np.isnan(value) else value) for name, value in zip(names, row)}
+        for row in zip(*(columns[name] for name in names))
+    ]
+
+
+def _fmt(value: Optional[float], suffix: str = "", digits: int = 1) -> str:
+    return "—" if value is None else f"{value:.{digits}f}{suffix}"
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    print(f"{report['items']} planned items across {len(report['sprints'])} sprints")
+    print()
+    print(f"{'Epic':<12} {'Items':>9} {'Done h':>8} {'Sprints':>7} {'Velocity':>9} {'Bias':>8} {'MAPE':>7}")
+    for row in report["epics"]:
+        print(
+            f"{row['epic'] or '(none)':<12} {row['completed_items']:>4}/{row['planned_items']:<4} "
+            f"{row['completed_hours']:>8.1f} {row['sprints']:>7} {_fmt(row['velocity'], 'h'):>9} "
+            f"{_fmt(row['estimate_bias_pct'], '%'):>8} {_fmt(row['estimate_mape_pct'], '%'):>7}"
+        )
+    print()
+    print(f"{'Sprint':<46} {'Ended':<21} {'Done':>5} {'Done h':>7} {'Δ h':>7} {'Avg3 h':>7}")
+    for row in report["sprints"]:
+        print(
+            f"{row['sprint_id']:<46} {row['ended_at'] or 'open':<21} {row['completed_items']:>5} "
+            f"{row['completed_hours']:>7.1f} {_fmt(row['change_hours']):>7} {_fmt(row['moving_avg_hours']):>7}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Sprint velocity and estimate-accuracy analytics.")
+    parser.add_argument(
+        "--vault",
+        type=Path,
+        required=True,
+        help="Path to product root (e.g., SynapticTrading_Vault/Product)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        help="Cache location (default: <vault>/.vault-cache); columns go in its analytics/ subdirectory",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Parse every summary instead of using the cache")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    vault = args.vault.resolve()
+    paths = sorted((vault / "Sprints").glob(SUMMARY_GLOB))
+    cache_dir = None if args.no_cache else (args.cache_dir or default_cache_dir(vault)) / ANALYTICS_DIRNAME
+    problems: List[str] = []
+    report = analyze(load_columns(paths, cache_dir, problems))
+    for problem in problems:
+        print(f"Warning: {problem}", file=sys.stderr)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,431 @@
+#!/usr/bin/env python3
+"""
+Status timeline of epics, features and stories, recovered from git history.
+
+``change_log`` entries are written by hand and miss most transitions, so this
+indexer reads history instead. ``git log --first-parent --name-only`` lists
+the commits that touched markdown under ``EPICS/`` in the order they landed on
+the current branch. The front matter of every changed file at each of those
+commits is read from one ``git cat-file --batch`` process, with requests sent
+in batches. Each time an artifact's ``status`` or ``progress_pct`` differs from
+its previous value, an event is appended to ``<vault>/.vault-cache/timeline.sqlite``.
+
+The event log is append-only. Each run resumes from the last indexed commit
+and reads only newer commits, so queries over years of history are a single
+indexed lookup. The index is rebuilt only when the last indexed commit is no
+longer an ancestor of the branch, e.g. after a rebase. Moved files keep their
+history: a file added with the ``id`` of a file deleted in the same commit
+continues from that file's last values.
+
+Usage:
+    python status_timeline.py --vault Product                          # update the index
+    python status_timeline.py --vault Product --id EPIC-002            # full timeline
+    python status_timeline.py --vault Product --id EPIC-002 --field status --to in_progress
+    python status_timeline.py --vault Product --field status --since 2025-10-01 --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import json
+import sqlite3
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+import yaml
+
+from frontmatter import front_matter_header, load_yaml
+from frontmatter_index import default_cache_dir
+from profiling import add_profile_arguments, count, enable_from_args, phase
+from timeutil import format_ts, parse_when
+
+TIMELINE_FILENAME = "timeline.sqlite"
+TIMELINE_VERSION = 1
+TRACKED_FIELDS = ("status", "progress_pct")
+COMMIT_MARK = "\x1e"
+FIELD_SEP = "\x1f"
+BATCH_BYTES = 32 * 1024  # request text per cat-file batch; below the pipe buffer, so writes never block
+
+Values = Tuple[Any, ...]  # one value per TRACKED_FIELDS entry
+
+
+class TimelineEvent(NamedTuple):
+    committed_at: dt.datetime
+    commit: str
+    author: str
+    subject: str
+    path: str
+    artifact_id: str
+    field: str
+    old: Any
+    new: Any
+
+
+class Commit(NamedTuple):
+    sha: str
+    committed_at: int
+    author: str
+    subject: str
+    paths: List[str]
+
+
+def _git(cwd: Path, *args: str) -> Optional[str]:
+    count("git_calls")
+    with phase(f"git {args[0]}", cat="git"):
+        result = subprocess.run(["git", *args], cwd=cwd, capture_output=True, text=True, check=False)
+    return result.stdout.strip() if result.returncode == 0 else None
+
+
+class CatFile:
+    """A ``git cat-file --batch`` process answering blob requests in batches."""
+
+    def __init__(self, cwd: Path) -> None:
+        count("git_calls")
+        self.proc = subprocess.Popen(
+            ["git", "cat-file", "--batch"], cwd=cwd, stdin=subprocess.PIPE, stdout=subprocess.PIPE
+        )
+
+    def __enter__(self) -> "CatFile":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        assert self.proc.stdin is not None
+        self.proc.stdin.close()
+        self.proc.wait()
+
+    def read_many(self, specs: Sequence[str]) -> List[Optional[bytes]]:
+        """Contents of each ``<rev>:<path>`` in ``specs``; ``None`` where the path does not exist."""
+        stdin, stdout = self.proc.stdin, self.proc.stdout
+        assert stdin is not None and stdout is not None
+        blobs: List[Optional[bytes]] = []
+        start = 0
+        with phase("cat-file", cat="git"):
+            while start < len(specs):
+                end, size = start, 0
+                while end < len(specs) and (end == start or size + len(specs[end]) < BATCH_BYTES):
+                    size += len(specs[end]) + 1
+                    end += 1
+                stdin.write("".join(spec + "\n" for spec in specs[start:end]).encode("utf-8"))
+                stdin.flush()
+                for _ in range(start, end):
+                    header = stdout.readline().split()
+                    if len(header) < 3 or header[1] != b"blob":
+                        blobs.append(None)  # "<spec> missing": deleted in this commit
+                        continue
+                    blobs.append(stdout.read(int(header[2])))
+                    stdout.read(1)  # trailing newline
+                    count("blobs_read")
+                start = end
+        return blobs
+
+
+def iter_commits(vault: Path, revisions: str) -> Iterator[Commit]:
+    """Commits in ``revisions`` touching markdown under ``EPICS/``, oldest first."""
+    count("git_calls")
+    proc = subprocess.Popen(
+        [
+            "git", "-c", "core.quotePath=false", "log", "--first-parent", "--reverse", "--no-renames",
+            f"--format={COMMIT_MARK}%H{FIELD_SEP}%ct{FIELD_SEP}%an{FIELD_SEP}%s",
+            "--name-only", revisions, "--", "EPICS",
+        ],
+        cwd=vault,
+        stdout=subprocess.PIPE,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+    )
+    assert proc.stdout is not None
+    current: Optional[Commit] = None
+    with phase("git log", cat="git"):
+        for line in proc.stdout:
+            line = line.rstrip("\n")
+            if line.startswith(COMMIT_MARK):
+                if current is not None and current.paths:
+                    yield current
+                sha, committed_at, author, subject = line[1:].split(FIELD_SEP, 3)
+                current = Commit(sha, int(committed_at), author, subject, [])
+            elif line.endswith(".md") and current is not None:
+                current.paths.append(line)
+        if current is not None and current.paths:
+            yield current
+    if proc.wait() != 0:
+        raise RuntimeError(f"git log {revisions} failed in {vault}")
+
+
+def tracked_values(blob: bytes, path: str) -> Optional[Tuple[Optional[str], Values]]:
+    """(id, tracked values) from a blob's front matter, or ``None`` if it cannot be parsed."""
+    try:
+        header = front_matter_header(blob.decode("utf-8", errors="replace"), Path(path))
+        metadata = load_yaml(header) if header is not None else {}
+    except (ValueError, yaml.YAMLError):
+        return None
+    if not isinstance(metadata, dict):
+        return None
+    values = []
+    for field in TRACKED_FIELDS:
+        value = metadata.get(field)
+        values.append(value if value is None or isinstance(value, (str, int, float)) else str(value))
+    artifact_id = metadata.get("id")
+    return (str(artifact_id) if artifact_id else None), tuple(values)
+
+
+def default_id(path: str) -> str:
+    rel = Path(path)
+    return rel.parent.name if rel.name == "README.md" else rel.stem
+
+
+class StatusTimeline:
+    """Append-only log of status/progress changes, plus the state at the last indexed commit."""
+
+    def __init__(self, cache_dir: Path) -> None:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(cache_dir / TIMELINE_FILENAME))
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        if self.conn.execute("PRAGMA user_version").fetchone()[0] != TIMELINE_VERSION:
+            self._drop()
+            self.conn.execute(f"PRAGMA user_version = {TIMELINE_VERSION}")
+        self.conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS events (
+                seq INTEGER PRIMARY KEY,
+                commit_sha TEXT NOT NULL,
+                committed_at INTEGER NOT NULL,
+                author TEXT NOT NULL,
+                subject TEXT NOT NULL,
+                path TEXT NOT NULL,
+                artifact_id TEXT NOT NULL,
+                field TEXT NOT NULL,
+                old_value,
+                new_value
+            );
+            CREATE INDEX IF NOT EXISTS events_by_artifact ON events (artifact_id, field, committed_at);
+            CREATE INDEX IF NOT EXISTS events_by_time ON events (committed_at);
+            CREATE TABLE IF NOT EXISTS current (
+                path TEXT PRIMARY KEY,
+                artifact_id TEXT NOT NULL,
+                status,
+                progress_pct
+            );
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+            """
+        )
+        self.conn.commit()
+        self.problems: List[str] = []
+
+    def __enter__(self) -> "StatusTimeline":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.conn.commit()
+        self.conn.close()
+
+    def _drop(self) -> None:
+        self.conn.executescript("DROP TABLE IF EXISTS events; DROP TABLE IF EXISTS current; DROP TABLE IF EXISTS meta;")
+
+    @property
+    def last_commit(self) -> Optional[str]:
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'last_commit'").fetchone()
+        return row[0] if row else None
+
+    def reset(self) -> None:
+        """Forget everything; the next ``update`` re-reads the whole history."""
+        self.conn.executescript("DELETE FROM events; DELETE FROM current; DELETE FROM meta;")
+        self.conn.commit()
+
+    def update(self, vault: Path, ref: str = "HEAD") -> Tuple[int, int]:
+        """Index commits after the last indexed one up to ``ref``; returns (commits, events) added."""
+        head = _git(vault, "rev-parse", "--verify", f"{ref}^{{commit}}")
+        prefix = _git(vault, "rev-parse", "--show-prefix")
+        if head is None or prefix is None:
+            raise RuntimeError(f"{vault} is not inside a git repository with a commit at {ref}")
+        last = self.last_commit
+        if last == head:
+            return 0, 0
+        if last is not None and _git(vault, "merge-base", "--is-ancestor", last, head) is None:
+            self.problems.append(f"{last[:12]} is no longer an ancestor of {ref}; rebuilding the timeline")
+            self.reset()
+            last = None
+
+        state: Dict[str, Tuple[str, Values]] = {
+            path: (artifact_id, (status, progress))
+            for path, artifact_id, status, progress in self.conn.execute("SELECT * FROM current")
+        }
+        commits = events = 0
+        try:
+            with CatFile(vault) as cat:
+                for commit in iter_commits(vault, f"{last}..{head}" if last else head):
+                    blobs = cat.read_many([f"{commit.sha}:{path}" for path in commit.paths])
+                    events += self._apply(commit, prefix, blobs, state)
+                    commits += 1
+            with phase("index write"):
+                self.conn.execute("DELETE FROM current")
+                self.conn.executemany(
+                    "INSERT INTO current VALUES (?, ?, ?, ?)",
+                    ((path, artifact_id, *values) for path, (artifact_id, values) in state.items()),
+                )
+                self.conn.execute("INSERT OR REPLACE INTO meta VALUES ('last_commit', ?)", (head,))
+        except BaseException:
+            # Events and last_commit move together, so an interrupted run resumes cleanly.
+            self.conn.rollback()
+            raise
+        self.conn.commit()
+        return commits, events
+
+    def _apply(
+        self,
+        commit: Commit,
+        prefix: str,
+        blobs: List[Optional[bytes]],
+        state: Dict[str, Tuple[str, Values]],
+    ) -> int:
+        removed: Dict[str, Tuple[str, Values]] = {}
+        present: List[Tuple[str, Optional[str], Values]] = []
+        for repo_path, blob in zip(commit.paths, blobs):
+            path = repo_path[len(prefix) :] if repo_path.startswith(prefix) else repo_path
+            if blob is None:
+                previous = state.pop(path, None)
+                if previous is not None:
+                    removed[previous[0]] = previous
+                continue
+            parsed = tracked_values(blob, path)
+            if parsed is None:
+                self.problems.append(f"{commit.sha[:12]} {path}: front matter does not parse; kept previous values")
+                continue
+            present.append((path, *parsed))
+
+        rows = []
+        for path, artifact_id, values in present:
+            artifact_id = artifact_id or default_id(path)
+            previous = state.get(path) or removed.pop(artifact_id, None)
+            old_values = previous[1] if previous else (None,) * len(TRACKED_FIELDS)
+            for field, old, new in zip(TRACKED_FIELDS, old_values, values):
+                if old != new:
+                    rows.append(
+                        (commit.sha, commit.committed_at, commit.author, commit.subject, path, artifact_id, field, old, new)
+                    )
+            state[path] = (artifact_id, values)
+        if rows:
+            self.conn.executemany(
+                "INSERT INTO events (commit_sha, committed_at, author, subject, path, artifact_id, field, "
+                "old_value, new_value) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+        return len(rows)
+
+    def events(
+        self,
+        artifact: Optional[str] = None,
+        field: Optional[str] = None,
+        to: Optional[str] = None,
+        since: Optional[dt.datetime] = None,
+        until: Optional[dt.datetime] = None,
+    ) -> Iterator[TimelineEvent]:
+        """Matching events, oldest first. ``artifact`` also matches ids it prefixes (``EPIC-002`` → ``EPIC-002-Backtesting``)."""
+        clauses: List[str] = []
+        params: List[Any] = []
+        if artifact:
+            escaped = artifact.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            clauses.append("(artifact_id = ? OR artifact_id LIKE ? ESCAPE '\\')")
+            params += [artifact, f"{escaped}-%"]
+        if field:
+            clauses.append("field = ?")
+            params.append(field)
+        if to is not None:
+            # Statuses are compared the way the schema's enum check does: case and -/_ insensitive.
+            clauses.append("REPLACE(LOWER(CAST(new_value AS TEXT)), '-', '_') = ?")
+            params.append(to.lower().replace("-", "_"))
+        if since:
+            clauses.append("committed_at >= ?")
+            params.append(int(since.timestamp()))
+        if until:
+            clauses.append("committed_at <= ?")
+            params.append(int(until.timestamp()))
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        query = (
+            "SELECT committed_at, commit_sha, author, subject, path, artifact_id, field, old_value, new_value "
+            f"FROM events {where} ORDER BY seq"
+        )
+        for row in self.conn.execute(query, params):
+            yield TimelineEvent(dt.datetime.fromtimestamp(row[0], dt.timezone.utc), *row[1:])
+
+    def stats(self) -> Tuple[int, int]:
+        """(events, artifacts) in the index."""
+        row = self.conn.execute("SELECT COUNT(*), COUNT(DISTINCT artifact_id) FROM events").fetchone()
+        return row[0], row[1]
+
+
+def open_timeline(vault: Path, cache_dir: Optional[Path] = None, rebuild: bool = False) -> StatusTimeline:
+    timeline = StatusTimeline(cache_dir or default_cache_dir(vault))
+    if rebuild:
+        timeline.reset()
+    return timeline
+
+
+def _format_value(value: Any) -> str:
+    if value is None:
+        return "—"
+    return f"{value:g}" if isinstance(value, float) else str(value)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Index and query status/progress changes from git history.")
+    parser.add_argument(
+        "--vault",
+        type=Path,
+        required=True,
+        help="Path to product root (e.g., SynapticTrading_Vault/Product)",
+    )
+    parser.add_argument("--cache-dir", type=Path, help="Timeline index location (default: <vault>/.vault-cache)")
+    parser.add_argument("--ref", default="HEAD", help="Branch or commit to index up to (default: HEAD)")
+    parser.add_argument("--rebuild", action="store_true", help="Discard the index and re-read all history")
+    parser.add_argument("--no-update", action="store_true", help="Query the index as it is, without reading new commits")
+    parser.add_argument("--id", dest="artifact", metavar="ID", help="Artifact id or id prefix (e.g. EPIC-002)")
+    parser.add_argument("--field", choices=list(TRACKED_FIELDS), help="Only changes to this field")
+    parser.add_argument("--to", metavar="VALUE", help="Only changes to this value (e.g. in_progress)")
+    parser.add_argument("--since", help="ISO date or timestamp")
+    parser.add_argument("--until", help="ISO date or timestamp (a date includes the whole day)")
+    parser.add_argument("--json", action="store_true", help="Print matching events as JSON lines")
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+    enable_from_args(args)
+
+    since = parse_when(parser, args.since, False)
+    until = parse_when(parser, args.until, True)
+    vault = args.vault.resolve()
+    with open_timeline(vault, args.cache_dir, args.rebuild) as timeline:
+        if not args.no_update:
+            try:
+                commits, added = timeline.update(vault, args.ref)
+            except RuntimeError as exc:
+                print(exc, file=sys.stderr)
+                sys.exit(1)
+            for problem in timeline.problems:
+                print(f"Warning: {problem}", file=sys.stderr)
+            if commits:
+                print(f"Indexed {commits} new commits: {added} events", file=sys.stderr)
+
+        if not (args.artifact or args.field or args.to or since or until):
+            total, artifacts = timeline.stats()
+            last = timeline.last_commit
+            print(f"{total} events for {artifacts} artifacts, indexed through {last[:12] if last else 'nothing yet'}")
+            return
+
+        for event in timeline.events(args.artifact, args.field, args.to, since, until):
+            if args.json:
+                print(json.dumps({**event._asdict(), "committed_at": format_ts(event.committed_at)}))
+            else:
+                print(
+                    f"{format_ts(event.committed_at)}  {event.commit[:10]}  {event.artifact_id:40} {event.field:12} "
+                    f"{_format_value(event.old):>12} → {_format_value(event.new):<12} {event.author}: {event.subject}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""
+UTC timestamp helpers shared by the sync scripts and ``scripts/dashboard_history.py``.
+
+Timestamps are handled as timezone-aware UTC datetimes and printed in ISO 8601
+with a ``Z`` suffix. Naive values are taken to be UTC already.
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+from typing import Any, Optional
+
+
+def to_utc(value: Any) -> Optional[dt.datetime]:
+    """``value`` (datetime, date or ISO 8601 string) as an aware UTC datetime; ``None`` if it is none of those."""
+    if isinstance(value, dt.datetime):
+        return value.astimezone(dt.timezone.utc) if value.tzinfo else value.replace(tzinfo=dt.timezone.utc)
+    if isinstance(value, dt.date):
+        return dt.datetime(value.year, value.month, value.day, tzinfo=dt.timezone.utc)
+    if isinstance(value, str) and value.strip():
+        try:
+            return to_utc(dt.datetime.fromisoformat(value.strip().replace("Z", "+00:00")))
+        except ValueError:
+            return None
+    return None
+
+
+def format_ts(value: dt.datetime) -> str:
+    return value.isoformat().replace("+00:00", "Z")
+
+
+def parse_when(parser: argparse.ArgumentParser, value: Optional[str], end_of_day: bool) -> Optional[dt.datetime]:
+    """A ``--since``/``--until`` argument as UTC; with ``end_of_day``, a bare date covers the whole day."""
+    if not value:
+        return None
+    when = to_utc(value)
+    if when is None:
+        parser.error(f"invalid date: {value}")
+    if end_of_day and len(value.strip()) == 10:
+        when += dt.timedelta(days=1) - dt.timedelta(seconds=1)  # whole day
+    return when
@@ -25,30 +25,22 @@ from __future__ import annotations
 
 import argparse
 import datetime as dt
+import glob
+import sys
 from pathlib import Path
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 import yaml
 
+from batch_writer import BatchValidationError, BatchWriter, atomic_write_text
+from frontmatter import LazyBody, load_yaml, read_front_matter, read_front_matter_lazy  # noqa: F401
+from frontmatter_index import FrontMatterIndex, default_cache_dir, open_index
+from profiling import add_profile_arguments, enable_from_args, phase
+from vault_schema import default_schema
 
-def read_front_matter(path: Path) -> Tuple[Dict[str, Any], str]:
-    text = path.read_text()
-    lines = text.splitlines()
-    if not lines or lines[0].strip() != "---":
-        return {}, text
 
-    end_idx = None
-    for idx, line in enumerate(lines[1:], start=1):
-        if line.strip() == "---":
-            end_idx = idx
-            break
-    if end_idx is None:
-        raise ValueError(f"Front matter in {path} is not closed with '---'.")
-
-    front = "\n".join(lines[1:end_idx])
-    body = "\n".join(lines[end_idx + 1 :]).lstrip("\n")
-    data = yaml.safe_load(front) or {}
-    return data, body
+UPDATE_FIELDS = ("status", "progress_pct", "requirement_coverage")
+VOLATILE_FIELDS = ("updated_at", "last_review")  # bumped by every merge; not content of their own
 
 
 def _normalize(value: Any) -> Any:
@@ -64,11 +56,14 @@ def _normalize(value: Any) -> Any:
     return value
 
 
-def write_front_matter(path: Path, metadata: Dict[str, Any], body: str) -> None:
+def render_front_matter(metadata: Dict[str, Any], body: Union[str, LazyBody]) -> str:
     metadata = _normalize(metadata)
     front = yaml.safe_dump(metadata, sort_keys=False).strip()
-    content = f"---\n{front}\n---\n\n{body}".rstrip() + "\n"
-    path.write_text(content)
+    return f"---\n{front}\n---\n\n{body}".rstrip() + "\n"
+
+
+def write_front_matter(path: Path, metadata: Dict[str, Any], body: Union[str, LazyBody]) -> None:
+    atomic_write_text(path, render_front_matter(metadata, body))
 
 
 def ensure_list(value: Any) -> list:
@@ -79,20 +74,15 @@ def ensure_list(value: Any) -> list:
     return [value]
 
 
-def apply_update(
-    vault_path: Path,
-    file_path: Path,
+def merge_update(
+    metadata: Dict[str, Any],
     sprint_id: str,
     update: Dict[str, Any],
     now_iso: str,
-) -> None:
-    metadata, body = read_front_matter(file_path)
-    if not metadata:
-        raise ValueError(f"{file_path} is missing YAML front matter.")
-
+) -> bool:
     changed = False
 
-    for field in ("status", "progress_pct", "requirement_coverage"):
+    for field in UPDATE_FIELDS:
         if field in update:
             if metadata.get(field) != update[field]:
                 metadata[field] = update[field]
@@ -127,33 +117,174 @@ def apply_update(
     if changed:
         metadata["updated_at"] = now_iso
         metadata["last_review"] = update.get("last_review", now_iso.split("T")[0])
+    return changed
 
+
+def apply_update(
+    vault_path: Path,
+    file_path: Path,
+    sprint_id: str,
+    update: Dict[str, Any],
+    now_iso: str,
+    index: Optional[FrontMatterIndex] = None,
+) -> None:
+    metadata, body = read_front_matter_lazy(file_path)
+    if not metadata:
+        raise ValueError(f"{file_path} is missing YAML front matter.")
+
+    if merge_update(metadata, sprint_id, update, now_iso):
         write_front_matter(file_path, metadata, body)
+        if index is not None:
+            # Write-through so a following roadmap sync gets a cache hit.
+            index.put(file_path, _normalize(metadata))
         rel_path = file_path.relative_to(vault_path)
         print(f"Updated {rel_path}")
     else:
         print(f"No changes for {file_path}")
 
 
-def process_summary(vault_path: Path, summary_path: Path) -> None:
-    summary = yaml.safe_load(summary_path.read_text())
-    if not summary:
-        raise ValueError("Summary file is empty.")
+def iter_summary_updates(summary: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """Yield epic, feature and story updates in document order."""
+    for epic in summary.get("epic_updates") or []:
+        yield epic
+        for feature in epic.get("features") or []:
+            yield feature
+            for story in feature.get("stories") or []:
+                yield story
+
 
+def stage_summary(
+    batch: BatchWriter, vault_path: Path, summary: Dict[str, Any], now_iso: str
+) -> None:
+    """Merge every update in ``summary`` into ``batch``; raises before touching disk."""
     sprint_id = summary["sprint_id"]
-    now_iso = dt.datetime.now(dt.timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+    schema = default_schema()
+    errors: List[str] = []
+    for update in iter_summary_updates(summary):
+        if not update.get("path"):
+            errors.append(f"{update.get('id', '<unknown>')}: update has no 'path'")
+            continue
+        file_path = vault_path / update["path"]
+        if not file_path.is_file():
+            errors.append(f"{update['path']}: file not found")
+            continue
+        try:
+            doc = batch.document(file_path)
+        except ValueError as exc:
+            errors.append(str(exc))
+            continue
+        if not doc.metadata:
+            errors.append(f"{file_path} is missing YAML front matter.")
+            continue
+        if merge_update(doc.metadata, sprint_id, update, now_iso):
+            doc.changed = True
+        # Only the values this update sets; existing drift elsewhere is vault_schema.py's job.
+        touched = [field for field in UPDATE_FIELDS if field in update] + list(update.get("fields", {}))
+        errors.extend(f"{update['path']}: {error}" for error in schema.check_fields(doc.metadata, touched))
+    if errors:
+        raise BatchValidationError(errors)
+
+
+def commit_batch(
+    batch: BatchWriter, vault_path: Path, index: Optional[FrontMatterIndex] = None
+) -> None:
+    written = batch.commit()
+    for doc in written:
+        if index is not None:
+            # Write-through so a following roadmap sync gets a cache hit.
+            index.put(doc.path, _normalize(doc.metadata))
+        print(f"Updated {doc.path.relative_to(vault_path)}")
+    for doc in batch.skipped():
+        print(f"Unchanged {doc.path.relative_to(vault_path)}; write skipped")
+    for doc in batch.documents.values():
+        if not (doc.changed or doc.skipped):
+            print(f"No changes for {doc.path}")
+
 
-    for epic in summary.get("epic_updates", []):
-        epic_path = vault_path / epic["path"]
-        apply_update(vault_path, epic_path, sprint_id, epic, now_iso)
+def _now_iso() -> str:
+    return dt.datetime.now(dt.timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
 
-        for feature in epic.get("features", []):
-            feature_path = vault_path / feature["path"]
-            apply_update(vault_path, feature_path, sprint_id, feature, now_iso)
 
-            for story in feature.get("stories", []):
-                story_path = vault_path / story["path"]
-                apply_update(vault_path, story_path, sprint_id, story, now_iso)
+def process_summary(
+    vault_path: Path, summary_path: Path, index: Optional[FrontMatterIndex] = None
+) -> None:
+    with phase("read summary"):
+        text = summary_path.read_text()
+    summary = load_yaml(text)
+    if not summary:
+        raise ValueError("Summary file is empty.")
+
+    batch = BatchWriter(render_front_matter, volatile=VOLATILE_FIELDS)
+    with phase("merge"):
+        stage_summary(batch, vault_path, summary, _now_iso())
+    commit_batch(batch, vault_path, index)
+
+
+def expand_summary_paths(patterns: List[str]) -> List[Path]:
+    """Resolve paths and glob patterns (``**`` allowed) to unique summary files."""
+    found: Dict[Path, None] = {}
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern, recursive=True)) if glob.has_magic(pattern) else [pattern]
+        for match in matches:
+            path = Path(match).resolve()
+            if path.is_dir():
+                path = path / "execution_summary.yaml"
+            found.setdefault(path, None)
+    return list(found)
+
+
+def _ended_at_key(summary: Dict[str, Any]) -> Tuple[int, str]:
+    """Sort key: by ``ended_at`` ascending, summaries without one (still open) last."""
+    ended = summary.get("ended_at")
+    if isinstance(ended, dt.datetime):
+        if ended.tzinfo is None:
+            ended = ended.replace(tzinfo=dt.timezone.utc)
+        return 0, ended.astimezone(dt.timezone.utc).isoformat()
+    if isinstance(ended, dt.date):
+        return 0, dt.datetime(ended.year, ended.month, ended.day, tzinfo=dt.timezone.utc).isoformat()
+    if ended:
+        return 0, str(ended)
+    return 1, ""
+
+
+def process_summaries(
+    vault_path: Path, summary_paths: List[Path], index: Optional[FrontMatterIndex] = None
+) -> None:
+    """Apply many sprint summaries in ``ended_at`` order, writing each target at most once.
+
+    Updates are merged into one in-memory batch exactly as consecutive
+    ``process_summary`` runs would merge them, so change logs and linked sprints
+    come out the same. Any invalid summary or target aborts the whole batch.
+    """
+    summaries: List[Tuple[Tuple[int, str], str, Path, Dict[str, Any]]] = []
+    errors: List[str] = []
+    for summary_path in summary_paths:
+        try:
+            with phase("read summary"):
+                text = summary_path.read_text()
+            summary = load_yaml(text)
+        except (OSError, yaml.YAMLError) as exc:
+            errors.append(f"{summary_path}: {exc}")
+            continue
+        if not isinstance(summary, dict) or not summary.get("sprint_id"):
+            errors.append(f"{summary_path}: summary is empty or has no sprint_id")
+            continue
+        summaries.append((_ended_at_key(summary), str(summary["sprint_id"]), summary_path, summary))
+    summaries.sort(key=lambda item: item[:2])
+
+    now_iso = _now_iso()
+    batch = BatchWriter(render_front_matter, volatile=VOLATILE_FIELDS)
+    for _, _, summary_path, summary in summaries:
+        try:
+            with phase("merge"):
+                stage_summary(batch, vault_path, summary, now_iso)
+        except BatchValidationError as exc:
+            errors.extend(f"{summary_path.parent.name}: {error}" for error in exc.errors)
+    if errors:
+        raise BatchValidationError(errors)
+
+    print(f"Merged {len(summaries)} summaries into {len(batch.documents)} files")
+    commit_batch(batch, vault_path, index)
 
 
 def main() -> None:
@@ -164,18 +295,73 @@ def main() -> None:
         required=True,
         help="Path to product root (e.g., SynapticTrading_Vault/Product)",
     )
-    parser.add_argument(
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument(
         "--summary",
         type=Path,
-        required=True,
         help="Path to execution_summary.yaml for the sprint",
     )
+    source.add_argument(
+        "--summaries",
+        nargs="+",
+        metavar="PATTERN",
+        help="Summary files, sprint directories or quoted globs to apply in ended_at order "
+        "(e.g. '<vault>/Sprints/*/execution_summary.yaml')",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        help="Front-matter index location (default: <vault>/.vault-cache)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not write updated metadata through to the front-matter index",
+    )
+    parser.add_argument(
+        "--no-daemon",
+        action="store_true",
+        help="Run in-process even if vault_daemon.py is serving this vault",
+    )
+    add_profile_arguments(parser)
     args = parser.parse_args()
+    enable_from_args(args)
+
+    vault_path = args.vault.resolve()
+    cache_dir = args.cache_dir or default_cache_dir(vault_path)
+    if args.summaries:
+        summary_paths = expand_summary_paths(args.summaries)
+        if not summary_paths:
+            parser.error("--summaries matched no files")
+        missing = [path for path in summary_paths if not path.is_file()]
+        if missing:
+            raise FileNotFoundError(missing[0])
+
+        request = {"summaries": [str(path) for path in summary_paths]}
 
-    if not args.summary.exists():
-        raise FileNotFoundError(args.summary)
+        def run(index: Optional[FrontMatterIndex]) -> None:
+            process_summaries(vault_path, summary_paths, index)
 
-    process_summary(args.vault.resolve(), args.summary.resolve())
+    else:
+        if not args.summary.exists():
+            raise FileNotFoundError(args.summary)
+        request = {"summary": str(args.summary.resolve())}
+
+        def run(index: Optional[FrontMatterIndex]) -> None:
+            process_summary(vault_path, args.summary.resolve(), index)
+
+    if not (args.no_daemon or args.no_cache or args.profile):
+        from daemon_client import run_via_daemon
+
+        code = run_via_daemon(cache_dir, vault_path, "epic-status", request)
+        if code is not None:
+            sys.exit(code)
+
+    if args.no_cache:
+        run(None)
+    else:
+        with open_index(vault_path, cache_dir) as index:
+            run(index)
 
 
 if __name__ == "__main__":
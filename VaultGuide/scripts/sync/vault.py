@@ -0,0 +1,376 @@
+#!/usr/bin/env python3
+"""
+Single entry point for the vault tooling, built for fast startup.
+
+Subcommands run in order and can be chained with ``+`` in one invocation:
+
+    roadmap-sync   regenerate (or --check) the roadmap summary block
+    epic-status    apply one or more sprint execution summaries
+    check          validate front matter and check the roadmap block is current
+    dashboard      parallel development dashboard (arguments are passed through)
+
+This module imports only ``sys``, ``time`` and ``typing`` at load. Each
+subcommand imports YAML, SQLite, git helpers or asyncio inside its own handler,
+so a hook pays only for what it runs. Chained subcommands share one opened front-matter index.
+``epic-status`` writes through to it, so a following ``roadmap-sync`` reads
+every README from the index instead of re-parsing.
+
+When ``vault_daemon.py`` serves the vault, ``roadmap-sync``, ``epic-status``
+and ``check`` are sent to it instead, so the warm model does the work and this
+process imports only ``daemon_client``. ``--no-daemon`` (implied by
+``--no-cache``) always runs in-process.
+
+``--timings`` prints, on stderr, the interpreter's startup CPU time, the time
+until each subcommand began useful work, and how long each one ran.
+
+Usage:
+    python vault.py --vault Product roadmap-sync
+    python vault.py --vault Product epic-status --summary Product/Sprints/<ID>/execution_summary.yaml + roadmap-sync
+    python vault.py --vault Product --timings check --staged --strict
+    python vault.py --vault Product dashboard --export report.json
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:  # annotations only; handlers import these when they run
+    import argparse
+    from pathlib import Path
+
+    from frontmatter_index import FrontMatterIndex
+
+_LOADED_AT = time.perf_counter()
+_BOOT_CPU = time.process_time()  # CPU spent before this module ran: interpreter startup and site
+
+CHAIN_SEPARATOR = "+"
+CACHE_DIRNAME = ".vault-cache"  # as frontmatter_index.default_cache_dir, without importing SQLite and pickle
+COMMANDS = {
+    "roadmap-sync": "Regenerate the roadmap summary block from epic metadata",
+    "epic-status": "Apply sprint execution summaries to stories, features and epics",
+    "check": "Validate front matter and check that the roadmap block is current",
+    "dashboard": "Parallel development dashboard (arguments are passed through)",
+}
+# Options accepted before the first command, and whether each takes a value.
+GLOBAL_OPTIONS = {
+    "--vault": True,
+    "--cache-dir": True,
+    "--no-cache": False,
+    "--no-daemon": False,
+    "--timings": False,
+    "-h": False,
+    "--help": False,
+}
+
+Chain = List[Tuple[str, List[str]]]
+
+
+class VaultSession:
+    """State shared by the subcommands of one invocation."""
+
+    def __init__(
+        self, vault: Path, cache_dir: Optional[Path] = None, use_cache: bool = True, use_daemon: bool = True
+    ) -> None:
+        self.vault = vault
+        self.use_cache = use_cache
+        self.use_daemon = use_daemon and use_cache
+        self._cache_dir = cache_dir
+        self._index: Optional[FrontMatterIndex] = None
+
+    @property
+    def cache_dir(self) -> Path:
+        if self._cache_dir is None:
+            self._cache_dir = self.vault / CACHE_DIRNAME
+        return self._cache_dir
+
+    @property
+    def index(self) -> Optional[FrontMatterIndex]:
+        """The front-matter index, opened on first use; ``None`` with ``--no-cache``."""
+        if self._index is None and self.use_cache:
+            from frontmatter_index import open_index
+
+            self._index = open_index(self.vault, self.cache_dir)
+        return self._index
+
+    def via_daemon(self, command: str, args: Dict[str, Any], timings: Timings) -> Optional[int]:
+        """Run ``command`` in vault_daemon.py if one serves this vault; ``None`` means run in-process."""
+        if not self.use_daemon:
+            return None
+        from daemon_client import run_via_daemon, socket_path
+
+        if not socket_path(self.cache_dir).exists():
+            return None
+        timings.ready(command)
+        return run_via_daemon(self.cache_dir, self.vault, command, args)
+
+    def close(self) -> None:
+        if self._index is not None:
+            self._index.close()
+            self._index = None
+
+
+class Timings:
+    def __init__(self, enabled: bool) -> None:
+        self.enabled = enabled
+        self.rows: List[List[Any]] = []  # [command, ready ms after load, ready perf_counter, run ms]
+
+    def ready(self, command: str) -> None:
+        """Mark the moment ``command`` finished importing and starts real work."""
+        if self.rows and self.rows[-1][0] == command and self.rows[-1][3] is None:
+            self.rows.pop()  # the daemon did not answer; re-mark the in-process start
+        self.rows.append([command, (time.perf_counter() - _LOADED_AT) * 1000, time.perf_counter(), None])
+
+    def done(self) -> None:
+        if self.rows and self.rows[-1][3] is None:
+            self.rows[-1][3] = (time.perf_counter() - self.rows[-1][2]) * 1000
+
+    def report(self) -> None:
+        if not self.enabled:
+            return
+        print(f"[timings] interpreter startup: {_BOOT_CPU * 1000:.1f} ms CPU", file=sys.stderr)
+        for command, ready_ms, _, run_ms in self.rows:
+            ran = f"{run_ms:.1f} ms" if run_ms is not None else "failed"
+            print(f"[timings] {command}: first work at +{ready_ms:.1f} ms, ran {ran}", file=sys.stderr)
+        print(f"[timings] total: {(time.perf_counter() - _LOADED_AT) * 1000:.1f} ms after load", file=sys.stderr)
+
+
+def _help_width() -> int:
+    # What argparse gets from shutil.get_terminal_size(), without importing shutil
+    # (and bz2/lzma with it) for every parser that never prints help.
+    import os
+
+    try:
+        return int(os.environ.get("COLUMNS", "0")) or os.get_terminal_size(sys.__stdout__.fileno()).columns
+    except (AttributeError, OSError, ValueError):
+        return 80
+
+
+def _parser(prog: str, description: str, allow_abbrev: bool = True) -> argparse.ArgumentParser:
+    import argparse
+
+    def formatter(prog: str) -> argparse.HelpFormatter:
+        return argparse.HelpFormatter(prog, width=_help_width() - 2)
+
+    return argparse.ArgumentParser(
+        prog=prog, description=description, formatter_class=formatter, allow_abbrev=allow_abbrev
+    )
+
+
+def cmd_roadmap_sync(session: VaultSession, argv: List[str], timings: Timings) -> int:
+    from pathlib import Path
+
+    parser = _parser("vault roadmap-sync", COMMANDS["roadmap-sync"])
+    parser.add_argument("--roadmap", type=Path, default=Path("ROADMAP.md"), help="Roadmap file relative to the product root")
+    parser.add_argument("--jobs", type=int, default=1, help="Worker processes for parsing uncached READMEs (0 = one per CPU core)")
+    parser.add_argument("--incremental", action="store_true", help="Re-parse only epics changed in git since the last sync")
+    parser.add_argument("--check", action="store_true", help="Do not write; exit 1 if the summary block is out of date")
+    args = parser.parse_args(argv)
+    roadmap = (session.vault / args.roadmap).resolve()
+    request = {"roadmap": str(roadmap), "jobs": args.jobs, "incremental": args.incremental, "check": args.check}
+    code = session.via_daemon("roadmap-sync", request, timings)
+    if code is not None:
+        return code
+
+    from roadmap_sync import STATE_FILENAME, run_sync
+
+    timings.ready("roadmap-sync")
+    return run_sync(
+        session.vault,
+        roadmap,
+        session.index,
+        session.cache_dir / STATE_FILENAME,
+        args.jobs,
+        args.incremental,
+        args.check,
+    )
+
+
+def cmd_epic_status(session: VaultSession, argv: List[str], timings: Timings) -> int:
+    from pathlib import Path
+
+    parser = _parser("vault epic-status", COMMANDS["epic-status"])
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--summary", type=Path, help="Path to execution_summary.yaml for the sprint")
+    source.add_argument("--summaries", nargs="+", metavar="PATTERN", help="Summary files, sprint directories or quoted globs, applied in ended_at order")
+    args = parser.parse_args(argv)
+
+    if args.summaries:
+        from update_epic_status import expand_summary_paths
+
+        paths = expand_summary_paths(args.summaries)
+        missing = [path for path in paths if not path.is_file()]
+        if not paths or missing:
+            print(f"No summary file at {missing[0]}" if missing else "--summaries matched no files", file=sys.stderr)
+            return 2
+        request = {"summaries": [str(path) for path in paths]}
+    else:
+        if not args.summary.is_file():
+            print(f"No summary file at {args.summary}", file=sys.stderr)
+            return 2
+        request = {"summary": str(args.summary.resolve())}
+    code = session.via_daemon("epic-status", request, timings)
+    if code is not None:
+        return code
+
+    from batch_writer import BatchCommitError, BatchValidationError
+    from update_epic_status import process_summaries, process_summary
+
+    timings.ready("epic-status")
+    try:
+        if args.summaries:
+            process_summaries(session.vault, paths, session.index)
+        else:
+            process_summary(session.vault, args.summary.resolve(), session.index)
+    except (BatchValidationError, BatchCommitError) as exc:
+        print(exc, file=sys.stderr)
+        return 1
+    return 0
+
+
+def cmd_check(session: VaultSession, argv: List[str], timings: Timings) -> int:
+    from pathlib import Path
+
+    parser = _parser("vault check", COMMANDS["check"])
+    parser.add_argument("paths", nargs="*", type=Path, help="Only validate these files")
+    parser.add_argument("--staged", action="store_true", help="Only validate markdown files staged in git")
+    parser.add_argument("--strict", action="store_true", help="Fail on schema warnings as well as errors")
+    parser.add_argument("--schema", type=Path, help="YAML schema merged over the built-in one")
+    parser.add_argument("--jobs", type=int, default=1, help="Worker processes for files without cached results (0 = one per CPU core)")
+    parser.add_argument("--roadmap", type=Path, default=Path("ROADMAP.md"), help="Roadmap file relative to the product root")
+    parser.add_argument("--no-roadmap", action="store_true", help="Skip the roadmap freshness check")
+    args = parser.parse_args(argv)
+    paths = [path.resolve() for path in args.paths]
+    roadmap = (session.vault / args.roadmap).resolve()
+    check_roadmap = not args.no_roadmap and roadmap.exists()
+    request = {
+        "paths": [str(path) for path in paths],
+        "staged": args.staged,
+        "schema": str(args.schema.resolve()) if args.schema else None,
+        "jobs": args.jobs,
+        "strict": args.strict,
+        "roadmap": str(roadmap) if check_roadmap else None,
+    }
+    code = session.via_daemon("check", request, timings)
+    if code is not None:
+        return code
+
+    from vault_schema import run_check
+
+    timings.ready("check")
+    code = run_check(
+        session.vault,
+        paths,
+        args.staged,
+        args.schema,
+        session.cache_dir if session.use_cache else None,
+        args.jobs,
+        args.strict,
+    )
+    if check_roadmap:
+        from roadmap_sync import STATE_FILENAME, run_sync
+
+        code = max(code, run_sync(session.vault, roadmap, session.index, session.cache_dir / STATE_FILENAME, check=True))
+    return code
+
+
+def cmd_dashboard(session: VaultSession, argv: List[str], timings: Timings) -> int:
+    from pathlib import Path
+
+    sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+    import parallel_dev_dashboard
+
+    timings.ready("dashboard")
+    saved = sys.argv
+    sys.argv = ["vault dashboard", *argv]
+    try:
+        parallel_dev_dashboard.main()
+    finally:
+        sys.argv = saved
+    return 0
+
+
+HANDLERS: Dict[str, Callable[[VaultSession, List[str], Timings], int]] = {
+    "roadmap-sync": cmd_roadmap_sync,
+    "epic-status": cmd_epic_status,
+    "check": cmd_check,
+    "dashboard": cmd_dashboard,
+}
+
+
+def split_chain(argv: List[str]) -> Tuple[List[str], Chain]:
+    """Split ``[global opts] cmd args + cmd args ...`` into the global part and (cmd, args) pairs.
+
+    The chain starts at the first token that is neither a global option nor
+    the value of one, so ``--vault check check`` runs ``check`` on a vault
+    directory named ``check``. Unknown options stay in the global part for
+    argparse to reject.
+    """
+    pos = 0
+    while pos < len(argv) and argv[pos].startswith("-"):
+        pos += 2 if GLOBAL_OPTIONS.get(argv[pos]) else 1  # "--vault=PATH" is one token, like unknown options
+    pos = min(pos, len(argv))
+    chain: Chain = []
+    current: Optional[Tuple[str, List[str]]] = None
+    for arg in argv[pos:]:
+        if arg == CHAIN_SEPARATOR:
+            current = None
+        elif current is None:
+            current = (arg, [])
+            chain.append(current)
+        else:
+            current[1].append(arg)
+    return argv[:pos], chain
+
+
+def usage() -> str:
+    lines = [
+        "usage: vault.py --vault PATH [--cache-dir DIR] [--no-cache] [--no-daemon] [--timings] COMMAND [ARGS] [+ COMMAND [ARGS] ...]",
+        "",
+        "commands:",
+    ]
+    lines += [f"  {name:<14} {text}" for name, text in COMMANDS.items()]
+    lines += ["", "Run 'vault.py --vault PATH COMMAND --help' for a command's options."]
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    global_args, chain = split_chain(sys.argv[1:] if argv is None else argv)
+    if "-h" in global_args or "--help" in global_args:
+        print(usage())
+        return 0
+    unknown = [name for name, _ in chain if name not in HANDLERS]
+    if not chain or unknown:
+        problem = f"unknown command {unknown[0]!r}" if unknown else f"expected one of: {', '.join(COMMANDS)}"
+        print(f"vault.py: {problem}\n\n{usage()}", file=sys.stderr)
+        return 2
+
+    from pathlib import Path
+
+    # No abbreviations: split_chain only recognises the full option names.
+    parser = _parser("vault.py", "Vault tooling entry point", allow_abbrev=False)
+    parser.add_argument("--vault", type=Path, required=True, help="Path to product root (e.g., SynapticTrading_Vault/Product)")
+    parser.add_argument("--cache-dir", type=Path, help="Front-matter index location (default: <vault>/.vault-cache)")
+    parser.add_argument("--no-cache", action="store_true", help="Parse every file instead of using the front-matter index")
+    parser.add_argument("--no-daemon", action="store_true", help="Run in-process even if vault_daemon.py is serving this vault")
+    parser.add_argument("--timings", action="store_true", help="Report startup and per-command timings on stderr")
+    options = parser.parse_args(global_args)
+
+    session = VaultSession(options.vault.resolve(), options.cache_dir, not options.no_cache, not options.no_daemon)
+    timings = Timings(options.timings)
+    code = 0
+    try:
+        for name, args in chain:
+            code = HANDLERS[name](session, args, timings)
+            timings.done()
+            if code:
+                break  # like '&&': later commands assume earlier ones succeeded
+    finally:
+        session.close()
+        timings.report()
+    return code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+Optional long-running sync daemon that keeps the vault model warm.
+
+The daemon holds the front-matter index open, with an in-memory layer that is
+validated by stat only. While idle it rescans EPICS/ every ``--poll`` seconds
+and re-parses files whose mtime or size changed, so requests rarely parse
+anything. Requests are JSON lines on ``<cache-dir>/daemon.sock``:
+
+    {"protocol": 1, "op": "roadmap-sync", "vault": "...", "args": {...}}
+
+Supported ops are ``roadmap-sync`` (also ``--check``), ``epic-status``,
+``check``, ``status`` and ``shutdown``. ``roadmap_sync.py``,
+``update_epic_status.py`` and ``vault.py`` try the socket first and fall back to
+in-process mode when no daemon answers; pass ``--no-daemon`` to skip it. Requests are served one at a time, so writes
+never interleave.
+
+Usage:
+    python vault_daemon.py --vault Product &        # serve until stopped
+    python vault_daemon.py --vault Product --status
+    python vault_daemon.py --vault Product --stop
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import pickle
+import signal
+import socketserver
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from daemon_client import PROTOCOL_VERSION, DaemonError, send_request, socket_path
+from frontmatter_index import FrontMatterIndex, default_cache_dir, load_many
+from roadmap_sync import STATE_FILENAME, run_sync
+from update_epic_status import process_summaries, process_summary
+from vault_schema import run_check
+
+DEFAULT_POLL = 2.0
+
+
+class WarmIndex(FrontMatterIndex):
+    """Front-matter index with an in-memory layer validated by mtime and size only."""
+
+    def __init__(self, cache_dir: Path) -> None:
+        super().__init__(cache_dir)
+        self.memory: Dict[str, Tuple[int, int, bytes]] = {}
+        self._keys: Dict[str, str] = {}
+
+    def _key(self, path: Path) -> str:  # type: ignore[override]
+        # Path.resolve() dominates a rescan; resolve each path once.
+        name = str(path)
+        key = self._keys.get(name)
+        if key is None:
+            key = self._keys[name] = str(path.resolve())
+        return key
+
+    def lookup(self, path: Path) -> Optional[Dict[str, Any]]:
+        key = self._key(path)
+        stat = path.stat()
+        entry = self.memory.get(key)
+        if entry is not None and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+            self.hits += 1
+            # Unpickle per call so callers can never mutate the cached copy.
+            return pickle.loads(entry[2])
+        metadata = super().lookup(path)
+        if metadata is not None:
+            self.memory[key] = (stat.st_mtime_ns, stat.st_size, pickle.dumps(metadata))
+        return metadata
+
+    def _store(self, key: str, stat: os.stat_result, digest: str, metadata: Dict[str, Any]) -> None:
+        super()._store(key, stat, digest, metadata)
+        self.memory[key] = (stat.st_mtime_ns, stat.st_size, pickle.dumps(metadata))
+
+    def invalidate(self, paths: Iterable[Path]) -> None:
+        paths = list(paths)
+        for path in paths:
+            self.memory.pop(self._key(path), None)
+        super().invalidate(paths)
+
+    def clear(self) -> None:
+        self.memory.clear()
+        super().clear()
+
+    def refresh(self, files: Iterable[Tuple[str, os.stat_result]], jobs: int = 1) -> int:
+        """Parse every (path, stat) in ``files`` that changed since it was last seen."""
+        changed: List[Path] = []
+        for name, stat in files:
+            entry = self.memory.get(self._keys.get(name) or self._key(Path(name)))
+            if entry is None or entry[0] != stat.st_mtime_ns or entry[1] != stat.st_size:
+                changed.append(Path(name))
+        misses = self.misses
+        try:
+            load_many(changed, jobs, self)
+        except (OSError, ValueError):
+            # One unreadable or half-written file; warm the rest and retry it next scan.
+            for path in changed:
+                try:
+                    self.get(path)
+                except (OSError, ValueError):
+                    continue
+        self.conn.commit()
+        return self.misses - misses
+
+
+def walk_markdown(root: Path) -> Iterator[Tuple[str, os.stat_result]]:
+    """(path, stat) of every markdown file under ``root``, via scandir."""
+    pending = [str(root)]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.name.endswith(".md") and entry.is_file():
+                    yield entry.path, entry.stat()
+
+
+class VaultDaemon:
+    def __init__(self, vault: Path, cache_dir: Path, poll: float = DEFAULT_POLL, jobs: int = 1) -> None:
+        self.vault = vault
+        self.cache_dir = cache_dir
+        self.poll = poll
+        self.jobs = jobs
+        self.index = WarmIndex(cache_dir)
+        self.started = time.time()
+        self.last_scan = 0.0
+        self.requests = 0
+        self.stopping = False
+
+    def scan(self) -> int:
+        self.last_scan = time.monotonic()
+        epics_dir = self.vault / "EPICS"
+        if not epics_dir.exists():
+            return 0
+        return self.index.refresh(walk_markdown(epics_dir), self.jobs)
+
+    def maybe_scan(self) -> None:
+        if time.monotonic() - self.last_scan >= self.poll:
+            self.scan()
+
+    def handle(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        response: Dict[str, Any] = {"protocol": PROTOCOL_VERSION, "vault": str(self.vault), "exit": 0}
+        if request.get("vault") != str(self.vault):
+            return response  # the client sees the vault mismatch and runs in-process
+        self.requests += 1
+        op = request.get("op")
+        args = request.get("args") or {}
+        stdout = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(stdout):
+                response["exit"] = self.dispatch(op, args)
+        except Exception as exc:  # report to the client; the daemon keeps serving
+            response["exit"] = 1
+            response["error"] = f"{type(exc).__name__}: {exc}"
+        finally:
+            self.index.conn.commit()
+        response["stdout"] = stdout.getvalue()
+        return response
+
+    def dispatch(self, op: Optional[str], args: Dict[str, Any]) -> int:
+        if op == "roadmap-sync":
+            return run_sync(
+                self.vault,
+                Path(args["roadmap"]),
+                self.index,
+                Path(args["state"]) if args.get("state") else self.cache_dir / STATE_FILENAME,
+                int(args.get("jobs", 1)),
+                bool(args.get("incremental")),
+                bool(args.get("check")),
+            )
+        if op == "epic-status":
+            if args.get("summaries"):
+                process_summaries(self.vault, [Path(path) for path in args["summaries"]], self.index)
+            else:
+                process_summary(self.vault, Path(args["summary"]), self.index)
+            return 0
+        if op == "check":
+            code = run_check(
+                self.vault,
+                [Path(path) for path in args.get("paths", [])],
+                bool(args.get("staged")),
+                Path(args["schema"]) if args.get("schema") else None,
+                self.cache_dir,
+                int(args.get("jobs", 1)),
+                bool(args.get("strict")),
+            )
+            if args.get("roadmap"):
+                state = self.cache_dir / STATE_FILENAME
+                code = max(code, run_sync(self.vault, Path(args["roadmap"]), self.index, state, check=True))
+            return code
+        if op == "status":
+            print(
+                f"pid {os.getpid()}, up {time.time() - self.started:.0f}s, {self.requests} requests, "
+                f"{len(self.index.memory)} files warm, {self.index.hits} hits / {self.index.misses} parses"
+            )
+            return 0
+        if op == "shutdown":
+            self.stopping = True
+            print(f"Stopping vault daemon (pid {os.getpid()})")
+            return 0
+        raise ValueError(f"unknown op {op!r}")
+
+    def close(self) -> None:
+        self.index.close()
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        line = self.rfile.readline()
+        try:
+            request = json.loads(line.decode("utf-8"))
+        except ValueError:
+            return
+        response = self.server.daemon.handle(request)  # type: ignore[attr-defined]
+        self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+
+
+class _Server(socketserver.UnixStreamServer):
+    def __init__(self, path: str, daemon: VaultDaemon) -> None:
+        self.daemon = daemon
+        super().__init__(path, _Handler)
+
+
+def serve(vault: Path, cache_dir: Path, poll: float, jobs: int = 1) -> None:
+    sock_path = socket_path(cache_dir)
+    try:
+        listening = send_request(sock_path, {"protocol": PROTOCOL_VERSION, "op": "status", "vault": str(vault)})
+    except DaemonError:
+        listening = True  # it accepted the connection, so the socket is not stale
+    if listening:
+        raise SystemExit(f"A vault daemon is already listening on {sock_path}")
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    if sock_path.exists():
+        sock_path.unlink()  # stale socket from a daemon that did not exit cleanly
+
+    daemon = VaultDaemon(vault, cache_dir, poll, jobs)
+    started = time.perf_counter()
+    warmed = daemon.scan()
+    print(f"Warmed {len(daemon.index.memory)} files ({warmed} parsed) in {time.perf_counter() - started:.2f}s")
+
+    old_umask = os.umask(0o077)  # socket readable by this user only
+    try:
+        server = _Server(str(sock_path), daemon)
+    finally:
+        os.umask(old_umask)
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    print(f"Serving {vault} on {sock_path} (pid {os.getpid()})", flush=True)
+    server.timeout = min(poll, 0.5)
+    try:
+        # One thread serves requests and rescans, so SQLite never crosses threads.
+        while not daemon.stopping:
+            server.handle_request()
+            daemon.maybe_scan()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if sock_path.exists():
+            sock_path.unlink()
+        daemon.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve vault sync operations from a warm in-memory model.")
+    parser.add_argument(
+        "--vault",
+        type=Path,
+        required=True,
+        help="Path to product root (e.g., SynapticTrading_Vault/Product)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        help="Index and socket location (default: <vault>/.vault-cache)",
+    )
+    parser.add_argument(
+        "--poll",
+        type=float,
+        default=DEFAULT_POLL,
+        help="Seconds between idle rescans of EPICS/",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=0,
+        help="Worker processes for parsing changed files (0 = one per CPU core)",
+    )
+    parser.add_argument("--status", action="store_true", help="Report on a running daemon and exit")
+    parser.add_argument("--stop", action="store_true", help="Ask a running daemon to exit")
+    args = parser.parse_args()
+
+    vault = args.vault.resolve()
+    cache_dir = (args.cache_dir or default_cache_dir(vault)).resolve()
+    if args.status or args.stop:
+        try:
+            response = send_request(
+                socket_path(cache_dir),
+                {"protocol": PROTOCOL_VERSION, "op": "shutdown" if args.stop else "status", "vault": str(vault)},
+            )
+        except DaemonError as exc:
+            print(f"Vault daemon on {socket_path(cache_dir)}: {exc}", file=sys.stderr)
+            sys.exit(1)
+        if response is None:
+            print(f"No vault daemon listening on {socket_path(cache_dir)}")
+            sys.exit(1)
+        sys.stdout.write(response.get("stdout", ""))
+        return
+    serve(vault, cache_dir, args.poll, args.jobs)
+
+
+if __name__ == "__main__":
+    main()
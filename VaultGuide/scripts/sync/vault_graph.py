@@ -0,0 +1,528 @@
+#!/usr/bin/env python3
+"""
+Link and traceability graph of the vault: epics → features → stories → sprints.
+
+Edges come from the EPICS/ directory layout, the ``related_epic``,
+``related_feature``, ``related_story`` and ``linked_sprints`` front-matter fields,
+the Story/Sprint columns of TRACEABILITY.md tables, and the ``epic_updates`` tree of
+each sprint's execution_summary.yaml. The graph is persisted to
+``<vault>/.vault-cache/graph.json`` along with each source file's contribution,
+so a refresh re-parses only files whose mtime or size changed. Adjacency sets
+are updated per changed file: only the edges of that file, and of files that
+mention a node or alias it added or removed, are resolved again. Queries walk
+the adjacency sets directly. A refresh still stats every source to find
+changes; a long-running caller that watches the tree passes the changed paths
+to ``refresh(changed)`` and skips the scan.
+
+Usage:
+    python vault_graph.py --vault Product --sprint SPRINT-20251118-epic002-adapter-replay
+    python vault_graph.py --vault Product --orphans feature
+    python vault_graph.py --vault Product --node EPIC-002
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import yaml
+
+from frontmatter import load_yaml, read_front_matter_lazy
+from frontmatter_index import default_cache_dir
+
+GRAPH_FILENAME = "graph.json"
+GRAPH_VERSION = 1
+
+# Values that mean "not linked yet" in hand-maintained front matter.
+PLACEHOLDERS = {"", "TBD", "tbd", "N/A", "none", "None"}
+SPRINT_ID = re.compile(r"SPRINT-[A-Za-z0-9_-]+")
+EPIC_SHORT_ID = re.compile(r"^(EPIC-[A-Z]*-?\d+)")
+
+Edge = Tuple[str, str, str]  # (source, relation, target)
+
+
+def sprint_node(sprint_id: str) -> str:
+    return f"sprint:{sprint_id}"
+
+
+def ref_node(ref: str) -> str:
+    return f"ref:{ref}"
+
+
+def classify(rel_path: str) -> Optional[Tuple[str, Optional[str]]]:
+    """Return (kind, parent node) for a path relative to EPICS/, or None for other docs."""
+    parts = rel_path.split("/")
+    if not parts[0].startswith("EPIC-"):
+        return None
+    if len(parts) == 2 and parts[1] == "README.md":
+        return "epic", None
+    if len(parts) == 4 and parts[1] == "Features" and parts[3] == "README.md":
+        return "feature", f"{parts[0]}/README.md"
+    if len(parts) == 5 and parts[1] == "Features" and parts[3] == "Stories":
+        return "story", "/".join(parts[:3] + ["README.md"])
+    return None
+
+
+def as_refs(value: Any) -> List[str]:
+    if value is None:
+        return []
+    values = value if isinstance(value, list) else [value]
+    return [str(v).strip() for v in values if str(v).strip() not in PLACEHOLDERS]
+
+
+def traceability_edges(rel_path: str, body: str, vault: Path) -> List[Edge]:
+    """Story → sprint edges from the Story ID / Sprint IDs columns of a traceability table."""
+    feature_dir = rel_path.rsplit("/", 1)[0]
+    edges: List[Edge] = []
+    header: Optional[List[str]] = None
+    for line in body.splitlines():
+        if not line.startswith("|"):
+            header = None
+            continue
+        cells = [cell.strip() for cell in line.strip().strip("|").split("|")]
+        if header is None:
+            header = [cell.lower() for cell in cells]
+            continue
+        if set("".join(cells)) <= set("-: "):
+            continue
+        row = dict(zip(header, cells))
+        story_id = row.get("story id")
+        if not story_id:
+            continue
+        story_path = f"{feature_dir}/Stories/{story_id}.md"
+        story = story_path if (vault / "EPICS" / story_path).exists() else ref_node(story_id)
+        for sprint in SPRINT_ID.findall(row.get("sprint ids", "")):
+            edges.append((story, "linked_sprint", sprint_node(sprint)))
+    return edges
+
+
+def summary_edges(summary_path: Path) -> Tuple[Optional[str], List[Edge]]:
+    summary = load_yaml(summary_path.read_text()) or {}
+    if not isinstance(summary, dict):
+        raise ValueError("summary is not a mapping")
+    sprint_id = summary.get("sprint_id")
+    if not sprint_id:
+        return None, []
+    node = sprint_node(sprint_id)
+    edges: List[Edge] = []
+
+    def walk(updates: Iterable[Dict[str, Any]], child_key: Optional[str]) -> None:
+        for update in updates or []:
+            path = update.get("path")
+            if path and path.startswith("EPICS/"):
+                edges.append((path[len("EPICS/") :], "linked_sprint", node))
+            elif update.get("id"):
+                edges.append((ref_node(update["id"]), "linked_sprint", node))
+            if child_key == "features":
+                walk(update.get("features"), "stories")
+            elif child_key == "stories":
+                walk(update.get("stories"), None)
+
+    walk(summary.get("epic_updates"), "features")
+    return node, edges
+
+
+def is_source(source: str) -> bool:
+    """True for vault-relative paths the graph is built from."""
+    if source.startswith("EPICS/"):
+        return source.endswith(".md")
+    parts = source.split("/")
+    return len(parts) == 3 and parts[0] == "Sprints" and parts[2] == "execution_summary.yaml"
+
+
+def alias_keys(node: str, attrs: Dict[str, Any]) -> List[str]:
+    """Short names a node answers to: its id, plus its directory or file name."""
+    keys = [str(attrs.get("id"))]
+    if attrs["kind"] == "epic":
+        epic_dir = node.split("/", 1)[0]
+        keys.append(epic_dir)
+        short = EPIC_SHORT_ID.match(epic_dir)
+        if short:
+            keys.append(short.group(1))
+    elif attrs["kind"] == "feature":
+        keys.append(node.split("/")[-2])
+    elif attrs["kind"] == "story":
+        keys.append(Path(node).stem)
+    return list(dict.fromkeys(keys))  # an epic's id and short id are often the same
+
+
+class VaultGraph:
+    """Adjacency index over artifacts and sprints with per-file incremental refresh."""
+
+    def __init__(self, vault: Path) -> None:
+        self.vault = vault
+        # source file -> {"mtime_ns", "size", "nodes": {node: attrs}, "edges": [...]}
+        self.sources: Dict[str, Dict[str, Any]] = {}
+        self.nodes: Dict[str, Dict[str, Any]] = {}
+        self.out_edges: Dict[str, Dict[str, Set[str]]] = {}
+        self.in_edges: Dict[str, Dict[str, Set[str]]] = {}
+        self.aliases: Dict[str, str] = {}
+        # Bookkeeping for incremental updates, filled by _build().
+        self._built = False
+        self._owners: Dict[str, Set[str]] = {}  # node -> sources declaring it
+        self._declared: Dict[str, List[str]] = {}  # source -> nodes it declares
+        self._node_aliases: Dict[str, List[str]] = {}  # node -> alias keys it claims
+        self._candidates: Dict[str, Set[str]] = {}  # alias key -> nodes claiming it
+        self._edges: Dict[str, List[Edge]] = {}  # source -> its edges, resolved
+        self._mentioned: Dict[str, Set[str]] = {}  # source -> raw names its edges use
+        self._mentions: Dict[str, Set[str]] = {}  # raw name -> sources whose edges use it
+        self._edge_counts: Dict[Edge, int] = {}  # resolved edge -> number of sources contributing it
+
+    # -- persistence -------------------------------------------------------
+
+    @classmethod
+    def load(cls, vault: Path, cache_path: Path) -> "VaultGraph":
+        graph = cls(vault)
+        try:
+            data = json.loads(cache_path.read_text())
+        except (OSError, ValueError):
+            data = {}
+        if data.get("version") == GRAPH_VERSION and data.get("vault") == str(vault):
+            graph.sources = data["sources"]
+        return graph
+
+    def save(self, cache_path: Path) -> None:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"version": GRAPH_VERSION, "vault": str(self.vault), "sources": self.sources}
+        tmp_path = cache_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(payload, separators=(",", ":"), default=str))
+        os.replace(tmp_path, cache_path)
+
+    # -- incremental refresh -----------------------------------------------
+
+    def _scan(self) -> Dict[str, os.stat_result]:
+        found: Dict[str, os.stat_result] = {}
+        epics_dir = self.vault / "EPICS"
+        for root, _, files in os.walk(epics_dir):
+            for filename in files:
+                if filename.endswith(".md"):
+                    path = os.path.join(root, filename)
+                    found["EPICS/" + os.path.relpath(path, epics_dir).replace(os.sep, "/")] = os.stat(path)
+        for summary in (self.vault / "Sprints").glob("*/execution_summary.yaml"):
+            found[summary.relative_to(self.vault).as_posix()] = summary.stat()
+        return found
+
+    def _parse_source(self, source: str) -> Dict[str, Any]:
+        path = self.vault / source
+        nodes: Dict[str, Dict[str, Any]] = {}
+        edges: List[Edge] = []
+        if source.startswith("Sprints/"):
+            try:
+                node, edges = summary_edges(path)
+            except (OSError, ValueError, yaml.YAMLError) as exc:
+                # Kept with the entry, so the warning repeats until the file changes.
+                return {"nodes": nodes, "edges": edges, "problem": f"{source}: {exc}"}
+            if node:
+                nodes[node] = {"kind": "sprint", "id": node[len("sprint:") :]}
+            return {"nodes": nodes, "edges": edges}
+
+        rel_path = source[len("EPICS/") :]
+        try:
+            metadata, body = read_front_matter_lazy(path)
+            # Read the body now, so a file removed since the scan is reported here too.
+            text = body.text if Path(rel_path).name == "TRACEABILITY.md" else ""
+        except (OSError, ValueError, yaml.YAMLError) as exc:
+            return {"nodes": nodes, "edges": edges, "problem": f"{source}: {exc}"}
+        if not isinstance(metadata, dict):
+            metadata = {}
+
+        kind = classify(rel_path)
+        if kind is not None:
+            artifact, parent = kind
+            nodes[rel_path] = {
+                "kind": artifact,
+                "id": metadata.get("id") or Path(rel_path).parent.name,
+                "status": metadata.get("status"),
+            }
+            if parent:
+                edges.append((parent, "child", rel_path))
+            for field in ("related_epic", "related_feature", "related_story"):
+                for ref in as_refs(metadata.get(field)):
+                    edges.append((rel_path, field, ref_node(ref)))
+            for sprint in as_refs(metadata.get("linked_sprints")):
+                edges.append((rel_path, "linked_sprint", sprint_node(sprint)))
+        elif Path(rel_path).name == "TRACEABILITY.md":
+            edges.extend(traceability_edges(rel_path, text, self.vault))
+        return {"nodes": nodes, "edges": edges}
+
+    def refresh(self, changed: Optional[Iterable[Any]] = None) -> Tuple[int, int]:
+        """Re-parse changed sources; returns (parsed, removed) counts.
+
+        ``changed`` lists the paths a caller that watches the tree knows changed
+        (vault-relative or absolute). Only those are stat'ed; the scan is skipped.
+        """
+        if changed is None:
+            found = self._scan()
+            gone = [source for source in self.sources if source not in found]
+        else:
+            found, gone = {}, []
+            for source in {self._source_key(path) for path in changed}:
+                if not is_source(source):
+                    continue
+                try:
+                    found[source] = os.stat(self.vault / source)
+                except FileNotFoundError:
+                    if source in self.sources:
+                        gone.append(source)
+        updated = []
+        for source, stat in found.items():
+            entry = self.sources.get(source)
+            if entry and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+                continue
+            entry = self._parse_source(source)
+            entry.update(mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+            self.sources[source] = entry
+            updated.append(source)
+        for source in gone:
+            del self.sources[source]
+        if not self._built:
+            self._build()
+        elif updated or gone:
+            self._apply(updated + gone)
+        return len(updated), len(gone)
+
+    def _source_key(self, path: Any) -> str:
+        path = Path(path)
+        if path.is_absolute():
+            path = path.relative_to(self.vault)
+        return path.as_posix()
+
+    def _build(self) -> None:
+        self.nodes, self.aliases, self.out_edges, self.in_edges = {}, {}, {}, {}
+        self._owners, self._declared, self._node_aliases, self._candidates = {}, {}, {}, {}
+        self._edges, self._mentioned, self._mentions, self._edge_counts = {}, {}, {}, {}
+        self._built = True
+        self._apply(list(self.sources))
+
+    def _apply(self, sources: List[str]) -> None:
+        """Bring nodes, aliases and adjacency up to date after ``sources`` changed or were removed.
+
+        Besides the edges of ``sources`` themselves, only edges of other sources
+        that mention a node or alias whose resolution changed are resolved again.
+        """
+        affected: Set[str] = set()
+        for source in sources:
+            for node in self._declared.pop(source, ()):
+                owners = self._owners[node]
+                owners.discard(source)
+                if not owners:
+                    del self._owners[node]
+                affected.add(node)
+            entry = self.sources.get(source)
+            if entry is not None:
+                self._declared[source] = list(entry["nodes"])
+                for node in entry["nodes"]:
+                    self._owners.setdefault(node, set()).add(source)
+                    affected.add(node)
+
+        renamed: Set[str] = set()
+        for node in affected:
+            renamed |= self._declare(node)
+        redo = set(sources)
+        for name in renamed:
+            redo |= self._mentions.get(name, set())
+        for source in redo:
+            self._retract(source)
+        for source in redo:
+            if source in self.sources:
+                self._contribute(source)
+
+    def _declare(self, node: str) -> Set[str]:
+        """Sync one node's attributes and aliases with its declaring sources.
+
+        Returns the names whose resolution may have changed as a result.
+        """
+        was_node = node in self.nodes
+        old_keys = self._node_aliases.pop(node, [])
+        for key in old_keys:
+            candidates = self._candidates[key]
+            candidates.discard(node)
+            if not candidates:
+                del self._candidates[key]
+        new_keys: List[str] = []
+        owners = self._owners.get(node)
+        if owners:
+            attrs = self.sources[min(owners)]["nodes"][node]
+            self.nodes[node] = attrs
+            new_keys = alias_keys(node, attrs)
+            self._node_aliases[node] = new_keys
+            for key in new_keys:
+                self._candidates.setdefault(key, set()).add(node)
+        elif node.startswith("sprint:") and node in self.in_edges:
+            self.nodes[node] = {"kind": "sprint", "id": node[len("sprint:") :]}
+        else:
+            self.nodes.pop(node, None)
+
+        renamed = {node} if was_node != (node in self.nodes) else set()
+        for key in set(old_keys) | set(new_keys):
+            # Deterministic regardless of refresh order: the smallest node key wins an alias.
+            best = min(self._candidates[key]) if key in self._candidates else None
+            if self.aliases.get(key) != best:
+                if best is None:
+                    del self.aliases[key]
+                else:
+                    self.aliases[key] = best
+                renamed |= {key, ref_node(key)}
+        return renamed
+
+    def _contribute(self, source: str) -> None:
+        mentioned: Set[str] = set()
+        resolved: List[Edge] = []
+        for source_name, relation, target_name in self.sources[source]["edges"]:
+            mentioned.update((source_name, target_name))
+            edge = (self.resolve(source_name), relation, self.resolve(target_name))
+            resolved.append(edge)
+            self._link(edge)
+        for name in mentioned:
+            self._mentions.setdefault(name, set()).add(source)
+        self._mentioned[source] = mentioned
+        self._edges[source] = resolved
+
+    def _retract(self, source: str) -> None:
+        for edge in self._edges.pop(source, ()):
+            self._unlink(edge)
+        for name in self._mentioned.pop(source, ()):
+            users = self._mentions[name]
+            users.discard(source)
+            if not users:
+                del self._mentions[name]
+
+    def _link(self, edge: Edge) -> None:
+        # Several sources can contribute the same edge; it stays until the last one is retracted.
+        self._edge_counts[edge] = self._edge_counts.get(edge, 0) + 1
+        if self._edge_counts[edge] > 1:
+            return
+        source, relation, target = edge
+        if target.startswith("sprint:") and target not in self.nodes:
+            self.nodes[target] = {"kind": "sprint", "id": target[len("sprint:") :]}
+        self.out_edges.setdefault(source, {}).setdefault(relation, set()).add(target)
+        self.in_edges.setdefault(target, {}).setdefault(relation, set()).add(source)
+
+    def _unlink(self, edge: Edge) -> None:
+        remaining = self._edge_counts[edge] - 1
+        if remaining:
+            self._edge_counts[edge] = remaining
+            return
+        del self._edge_counts[edge]
+        source, relation, target = edge
+        for index, key, other in ((self.out_edges, source, target), (self.in_edges, target, source)):
+            relations = index[key]
+            relations[relation].discard(other)
+            if not relations[relation]:
+                del relations[relation]
+                if not relations:
+                    del index[key]
+        if target.startswith("sprint:") and target not in self.in_edges and target not in self._owners:
+            self.nodes.pop(target, None)  # implied only by edges that are now gone
+
+    @property
+    def problems(self) -> List[str]:
+        """Sources that could not be parsed and contribute nothing to the graph."""
+        return [entry["problem"] for entry in self.sources.values() if entry.get("problem")]
+
+    # -- queries -----------------------------------------------------------
+
+    def resolve(self, name: str) -> str:
+        """Map a path, artifact id, ``ref:`` or sprint id to its node key."""
+        if name in self.nodes:
+            return name
+        bare = name[len("ref:") :] if name.startswith("ref:") else name
+        if bare in self.aliases:
+            return self.aliases[bare]
+        if SPRINT_ID.fullmatch(bare):
+            return sprint_node(bare)
+        return name
+
+    def neighbors(self, node: str, relation: str, incoming: bool = False) -> Set[str]:
+        edges = self.in_edges if incoming else self.out_edges
+        return edges.get(self.resolve(node), {}).get(relation, set())
+
+    def children(self, node: str) -> Set[str]:
+        return self.neighbors(node, "child")
+
+    def parent(self, node: str) -> Optional[str]:
+        parents = self.neighbors(node, "child", incoming=True)
+        return next(iter(parents), None)
+
+    def artifacts_for_sprint(self, sprint_id: str, kind: Optional[str] = None) -> List[str]:
+        linked = self.neighbors(sprint_node(sprint_id), "linked_sprint", incoming=True)
+        return sorted(n for n in linked if kind is None or self.nodes.get(n, {}).get("kind") == kind)
+
+    def sprints_for(self, node: str) -> List[str]:
+        return sorted(n[len("sprint:") :] for n in self.neighbors(node, "linked_sprint"))
+
+    def orphans(self, kind: str) -> List[str]:
+        """Artifacts of ``kind`` with no children, no sprint links and no related_* links."""
+        result = []
+        for node, attrs in self.nodes.items():
+            if attrs["kind"] != kind:
+                continue
+            out = self.out_edges.get(node, {})
+            inbound = self.in_edges.get(node, {})
+            if out.get("child") or out.get("linked_sprint"):
+                continue
+            if any(out.get(field) for field in ("related_epic", "related_feature", "related_story")):
+                continue
+            if any(rel != "child" for rel in inbound):
+                continue
+            result.append(node)
+        return sorted(result)
+
+
+def open_graph(vault: Path, cache_dir: Optional[Path] = None, rebuild: bool = False) -> VaultGraph:
+    cache_path = (cache_dir or default_cache_dir(vault)) / GRAPH_FILENAME
+    graph = VaultGraph(vault) if rebuild else VaultGraph.load(vault, cache_path)
+    parsed, removed = graph.refresh()
+    if parsed or removed or rebuild:
+        graph.save(cache_path)
+    return graph
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Query the vault link/traceability graph.")
+    parser.add_argument(
+        "--vault",
+        type=Path,
+        required=True,
+        help="Path to product root (e.g., SynapticTrading_Vault/Product)",
+    )
+    parser.add_argument("--cache-dir", type=Path, help="Graph cache location (default: <vault>/.vault-cache)")
+    parser.add_argument("--rebuild", action="store_true", help="Ignore the persisted graph")
+    parser.add_argument("--sprint", help="List artifacts linked to this sprint id")
+    parser.add_argument("--kind", choices=["epic", "feature", "story"], help="Filter --sprint results")
+    parser.add_argument("--orphans", choices=["epic", "feature", "story"], help="List unlinked artifacts")
+    parser.add_argument("--node", help="Show neighbours of a path or artifact id")
+    args = parser.parse_args()
+
+    graph = open_graph(args.vault.resolve(), args.cache_dir, args.rebuild)
+    for problem in graph.problems:
+        print(f"Warning: skipped {problem}")
+    if args.sprint:
+        for node in graph.artifacts_for_sprint(args.sprint, args.kind):
+            print(node)
+    elif args.orphans:
+        for node in graph.orphans(args.orphans):
+            print(node)
+    elif args.node:
+        node = graph.resolve(args.node)
+        print(f"{node}: {graph.nodes.get(node, {})}")
+        for relation, targets in sorted(graph.out_edges.get(node, {}).items()):
+            for target in sorted(targets):
+                print(f"  -> {relation} {target}")
+        for relation, sources in sorted(graph.in_edges.get(node, {}).items()):
+            for source in sorted(sources):
+                print(f"  <- {relation} {source}")
+    else:
+        kinds: Dict[str, int] = {}
+        for attrs in graph.nodes.values():
+            kinds[attrs["kind"]] = kinds.get(attrs["kind"], 0) + 1
+        edge_count = sum(len(t) for rels in graph.out_edges.values() for t in rels.values())
+        print(f"{len(graph.nodes)} nodes {kinds}, {edge_count} edges from {len(graph.sources)} files")
+
+
+if __name__ == "__main__":
+    main()
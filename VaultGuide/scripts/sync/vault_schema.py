@@ -0,0 +1,562 @@
+#!/usr/bin/env python3
+"""
+Validate front matter across the vault against a field schema.
+
+The schema is compiled once into one checker closure per field, plus one per
+cross-field rule. Only the checks a field declares are kept, so validating a
+file costs a dict lookup and a few comparisons per key. Files are validated
+in one pass across a process pool (``--jobs``). Every violation is reported
+as ``path:line: severity: message``, where the line is the field's line in the
+file.
+
+Results are cached in ``<vault>/.vault-cache/schema.sqlite``, keyed by path and
+validated by mtime/size, then SHA-256, then the schema digest. Repeat runs and
+pre-commit hooks re-check only files that changed. ``--staged`` limits the run
+to markdown files staged in git.
+
+The built-in ``DEFAULT_SCHEMA`` encodes the conventions the sync scripts rely
+on. Some examples:
+- ``manual_update`` is a real boolean, not ``'true'``.
+- ``seq`` is an integer, not ``'001'``.
+- ``progress_pct`` is a number from 0 to 100.
+- ``status`` is one of the known states.
+- A ``completed`` artifact should carry ``manual_update: true``.
+
+``--schema FILE`` takes a YAML file with the same ``fields``/``rules`` shape. Its
+fields are merged over the defaults; its rules replace them if given.
+
+Usage:
+    python vault_schema.py --vault Product
+    python vault_schema.py --vault Product --staged --strict     # pre-commit hook
+    python vault_schema.py --vault Product --jobs 0 --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import sys
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from frontmatter import front_matter_header, load_yaml
+from profiling import add_profile_arguments, count, enable_from_args, phase
+
+CACHE_FILENAME = "schema.sqlite"
+CACHE_VERSION = 1
+
+STATUSES = [
+    "idea",
+    "research",
+    "identified",
+    "draft",
+    "proposed",
+    "pending",
+    "planned",
+    "not_started",
+    "ready",
+    "ready_for_approval",
+    "ready_for_implementation",
+    "approved",
+    "active",
+    "in_progress",
+    "blocked",
+    "at_risk",
+    "completed",
+    "final",
+]
+
+DEFAULT_SCHEMA: Dict[str, Any] = {
+    "fields": {
+        "id": {"type": "str", "required": True},
+        "title": {"type": "str", "required": True},
+        "artifact_type": {"type": "str", "required": True},
+        "status": {"type": "str", "enum": STATUSES},
+        "manual_update": {"type": "bool"},
+        "seq": {"type": "int", "min": 0},
+        "progress_pct": {"type": "number", "min": 0, "max": 100},
+        "requirement_coverage": {"type": "number", "min": 0, "max": 100, "allow": ["TBD"]},
+        "created_at": {"type": "timestamp"},
+        "updated_at": {"type": "timestamp"},
+        "last_review": {"type": "date"},
+        "owner": {"type": "str"},
+        "linked_sprints": {"type": "list", "items": "str", "nullable": True},
+        "change_log": {"type": "list", "items": "str", "nullable": True},
+        "related_epic": {"type": ["str", "list"], "nullable": True},
+        "related_feature": {"type": ["str", "list"], "nullable": True},
+        "related_story": {"type": ["str", "list"], "nullable": True},
+    },
+    "rules": [
+        {
+            "when": {"status": ["completed"]},
+            "expect": {"manual_update": [True]},
+            "severity": "warning",
+            "message": "completed without manual_update: true; automatic sync may revert it",
+        },
+        {
+            "when": {"status": ["completed"]},
+            "expect": {"progress_pct": [100, 100.0]},
+            "severity": "warning",
+            "message": "completed but progress_pct is not 100",
+        },
+    ],
+}
+
+ISO_DATE = re.compile(r"\d{4}-\d{2}-\d{2}$")
+ISO_TIMESTAMP = re.compile(r"\d{4}-\d{2}-\d{2}([T ]\d{2}:\d{2}(:\d{2}(\.\d+)?)?(Z|[+-]\d{2}:?\d{2})?)?$")
+TOP_LEVEL_KEY = re.compile(r"^(?:'([^']+)'|\"([^\"]+)\"|([^\s#'\"-][^:]*)):(?:\s|$)")
+
+TYPE_TESTS: Dict[str, Callable[[Any], bool]] = {
+    "str": lambda value: isinstance(value, str),
+    "bool": lambda value: value is True or value is False,
+    "int": lambda value: type(value) is int,
+    "number": lambda value: type(value) in (int, float),
+    "list": lambda value: isinstance(value, list),
+    "dict": lambda value: isinstance(value, dict),
+    "date": lambda value: isinstance(value, dt.date) or (isinstance(value, str) and bool(ISO_DATE.match(value))),
+    "timestamp": lambda value: isinstance(value, dt.date)
+    or (isinstance(value, str) and bool(ISO_TIMESTAMP.match(value))),
+}
+
+Checker = Callable[[Any], Optional[str]]
+Rule = Callable[[Dict[str, Any]], Optional[Tuple[str, str, str]]]
+Violation = Tuple[int, str, str, str]  # line, severity, field, message
+
+
+def _hint(kinds: Sequence[str], value: Any) -> str:
+    if not isinstance(value, str):
+        return ""
+    if "bool" in kinds and value.lower() in ("true", "false"):
+        return f" (write {value.lower()} without quotes)"
+    if ("int" in kinds or "number" in kinds) and re.fullmatch(r"-?\d+(\.\d+)?", value):
+        return f" (write {value.lstrip('0') or '0'} without quotes)"
+    return ""
+
+
+def compile_field(name: str, spec: Dict[str, Any]) -> Checker:
+    """Build the checker for one field; only the checks the spec declares are included."""
+    kinds = spec["type"] if isinstance(spec["type"], list) else [spec["type"]]
+    unknown = [kind for kind in kinds if kind not in TYPE_TESTS]
+    if unknown:
+        raise ValueError(f"schema field {name!r}: unknown type {unknown[0]!r}")
+    tests = tuple(TYPE_TESTS[kind] for kind in kinds)
+    expected = " or ".join(kinds)
+    nullable = bool(spec.get("nullable"))
+    allowed = tuple(spec.get("allow", ()))
+    steps: List[Checker] = []
+
+    if "enum" in spec:
+        choices = frozenset(spec["enum"])
+        ordered = sorted(choices, key=str)
+
+        def check_enum(value: Any) -> Optional[str]:
+            if value in choices:
+                return None
+            import difflib  # only needed once a value is wrong
+
+            close = difflib.get_close_matches(str(value), [str(choice) for choice in ordered], n=1)
+            suggestion = f"; did you mean {close[0]!r}?" if close else ""
+            return f"{name}: {value!r} is not one of the allowed values{suggestion}"
+
+        steps.append(check_enum)
+    if "min" in spec or "max" in spec:
+        low = spec.get("min", float("-inf"))
+        high = spec.get("max", float("inf"))
+
+        def check_range(value: Any) -> Optional[str]:
+            if isinstance(value, (int, float)) and not low <= value <= high:
+                return f"{name}: {value!r} is outside {spec.get('min', '')}..{spec.get('max', '')}"
+            return None
+
+        steps.append(check_range)
+    if "items" in spec:
+        item_test = TYPE_TESTS[spec["items"]]
+        item_kind = spec["items"]
+
+        def check_items(value: Any) -> Optional[str]:
+            if isinstance(value, list):
+                for pos, item in enumerate(value):
+                    if not item_test(item):
+                        return f"{name}[{pos}]: expected {item_kind}, got {type(item).__name__} {item!r}"
+            return None
+
+        steps.append(check_items)
+
+    def check(value: Any) -> Optional[str]:
+        if value is None:
+            return None if nullable else f"{name}: must not be empty"
+        if allowed and isinstance(value, (str, int, float, bool)) and value in allowed:
+            return None
+        for test in tests:
+            if test(value):
+                break
+        else:
+            return f"{name}: expected {expected}, got {type(value).__name__} {value!r}{_hint(kinds, value)}"
+        for step in steps:
+            message = step(value)
+            if message is not None:
+                return message
+        return None
+
+    return check
+
+
+def compile_rule(rule: Dict[str, Any]) -> Rule:
+    when = [(field, tuple(values)) for field, values in rule["when"].items()]
+    expect = [(field, tuple(values)) for field, values in rule["expect"].items()]
+    severity = rule.get("severity", "error")
+    message = rule.get("message") or "expected " + ", ".join(f"{field} in {list(values)}" for field, values in expect)
+
+    def check(metadata: Dict[str, Any]) -> Optional[Tuple[str, str, str]]:
+        for field, values in when:
+            if metadata.get(field) not in values:
+                return None
+        for field, values in expect:
+            value = metadata.get(field)
+            # ``True in (1,)`` holds in Python; compare types too so 'true' and 1 do not pass as True.
+            if not any(value == choice and type(value) is type(choice) for choice in values):
+                return severity, field if field in metadata else when[0][0], message
+        return None
+
+    return check
+
+
+class CompiledSchema:
+    def __init__(self, schema: Dict[str, Any]) -> None:
+        fields = schema.get("fields", {})
+        self.digest = hashlib.sha256(json.dumps(schema, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+        self.checkers: Dict[str, Checker] = {name: compile_field(name, spec) for name, spec in fields.items()}
+        self.required = [name for name, spec in fields.items() if spec.get("required")]
+        self.rules = [compile_rule(rule) for rule in schema.get("rules", [])]
+
+    def validate(self, metadata: Dict[str, Any]) -> List[Tuple[str, str, str]]:
+        """(severity, field, message) for every violation in ``metadata``."""
+        problems: List[Tuple[str, str, str]] = []
+        for name in self.required:
+            if name not in metadata:
+                problems.append(("error", name, f"missing required field {name!r}"))
+        checkers = self.checkers
+        for key, value in metadata.items():
+            checker = checkers.get(key)
+            if checker is not None:
+                message = checker(value)
+                if message is not None:
+                    problems.append(("error", key, message))
+        for rule in self.rules:
+            problem = rule(metadata)
+            if problem is not None:
+                problems.append(problem)
+        return problems
+
+    def check_fields(self, metadata: Dict[str, Any], fields: Iterable[str]) -> List[str]:
+        """Type errors for just ``fields``; used to validate values a writer is about to set."""
+        errors = []
+        for name in fields:
+            checker = self.checkers.get(name)
+            message = checker(metadata.get(name)) if checker is not None and name in metadata else None
+            if message is not None:
+                errors.append(message)
+        return errors
+
+
+def load_schema(path: Optional[Path]) -> Dict[str, Any]:
+    if path is None:
+        return DEFAULT_SCHEMA
+    custom = load_yaml(path.read_text()) or {}
+    return {
+        "fields": {**DEFAULT_SCHEMA["fields"], **(custom.get("fields") or {})},
+        "rules": custom["rules"] if "rules" in custom else DEFAULT_SCHEMA["rules"],
+    }
+
+
+_DEFAULT: Optional[CompiledSchema] = None
+
+
+def default_schema() -> CompiledSchema:
+    """The built-in schema, compiled on first use."""
+    global _DEFAULT
+    if _DEFAULT is None:
+        _DEFAULT = CompiledSchema(DEFAULT_SCHEMA)
+    return _DEFAULT
+
+
+def field_lines(header: str) -> Dict[str, int]:
+    """File line number of each top-level key in a front-matter header (line 1 is ``---``)."""
+    lines: Dict[str, int] = {}
+    for number, line in enumerate(header.splitlines(), start=2):
+        match = TOP_LEVEL_KEY.match(line)
+        if match:
+            lines.setdefault(next(group for group in match.groups() if group is not None).strip(), number)
+    return lines
+
+
+def validate_text(schema: CompiledSchema, text: str, path: Path) -> List[Violation]:
+    try:
+        header = front_matter_header(text, path)
+    except ValueError as exc:
+        return [(1, "error", "", str(exc))]
+    if header is None:
+        return []
+    import yaml  # only for files without a cached result, like load_yaml itself
+
+    try:
+        metadata = load_yaml(header)
+    except yaml.YAMLError as exc:
+        mark = getattr(exc, "problem_mark", None)
+        line = mark.line + 2 if mark is not None else 1
+        return [(line, "error", "", f"front matter is not valid YAML: {getattr(exc, 'problem', None) or exc}")]
+    if not isinstance(metadata, dict):
+        return [(2, "error", "", "front matter is not a mapping")] if metadata is not None else []
+    problems = schema.validate(metadata)
+    if not problems:
+        return []
+    lines = field_lines(header)
+    return [(lines.get(field, 1), severity, field, message) for severity, field, message in problems]
+
+
+_WORKER_SCHEMA: Optional[CompiledSchema] = None
+
+
+def _init_worker(schema: Dict[str, Any]) -> None:
+    global _WORKER_SCHEMA
+    _WORKER_SCHEMA = CompiledSchema(schema)
+
+
+def _validate_chunk(paths: Sequence[str]) -> List[Tuple[str, str, List[Violation]]]:
+    results = []
+    for name in paths:
+        raw = Path(name).read_bytes()
+        violations = validate_text(_WORKER_SCHEMA, raw.decode("utf-8", "replace"), Path(name))  # type: ignore[arg-type]
+        results.append((name, hashlib.sha256(raw).hexdigest(), violations))
+    return results
+
+
+class SchemaCache:
+    """Validation results per file, reused while the file and the schema are unchanged."""
+
+    def __init__(self, cache_dir: Path, digest: str) -> None:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(cache_dir / CACHE_FILENAME))
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        if self.conn.execute("PRAGMA user_version").fetchone()[0] != CACHE_VERSION:
+            self.conn.execute("DROP TABLE IF EXISTS results")
+            self.conn.execute(f"PRAGMA user_version = {CACHE_VERSION}")
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS results (
+                path TEXT PRIMARY KEY,
+                mtime_ns INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                sha256 TEXT NOT NULL,
+                schema TEXT NOT NULL,
+                violations TEXT NOT NULL
+            )
+            """
+        )
+        self.digest = digest
+        self.hits = 0
+
+    def __enter__(self) -> "SchemaCache":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.conn.commit()
+        self.conn.close()
+
+    def lookup(self, path: Path) -> Optional[List[Violation]]:
+        key = str(path)
+        row = self.conn.execute(
+            "SELECT mtime_ns, size, sha256, schema, violations FROM results WHERE path = ?", (key,)
+        ).fetchone()
+        if row is None or row[3] != self.digest:
+            return None
+        stat = path.stat()
+        if row[0] != stat.st_mtime_ns or row[1] != stat.st_size:
+            if row[2] != hashlib.sha256(path.read_bytes()).hexdigest():
+                return None
+            self.conn.execute(
+                "UPDATE results SET mtime_ns = ?, size = ? WHERE path = ?", (stat.st_mtime_ns, stat.st_size, key)
+            )
+        self.hits += 1
+        return [tuple(item) for item in json.loads(row[4])]  # type: ignore[misc]
+
+    def put(self, path: Path, digest: str, violations: List[Violation]) -> None:
+        stat = path.stat()
+        self.conn.execute(
+            "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?)",
+            (str(path), stat.st_mtime_ns, stat.st_size, digest, self.digest, json.dumps(violations)),
+        )
+
+
+def validate_paths(
+    paths: Sequence[Path], schema: Dict[str, Any], jobs: int = 1, cache: Optional[SchemaCache] = None
+) -> Dict[Path, List[Violation]]:
+    """Violations per path, validating cache misses across ``jobs`` worker processes."""
+    results: Dict[Path, List[Violation]] = {}
+    pending: List[str] = []
+    with phase("cache lookup"):
+        for path in paths:
+            cached = cache.lookup(path) if cache is not None else None
+            if cached is None:
+                pending.append(str(path))
+            else:
+                results[path] = cached
+    count("schema_cache_hits", len(paths) - len(pending))
+    count("files_validated", len(pending))
+
+    if jobs != 1:
+        from frontmatter_index import resolve_jobs  # brings pickle; single-process runs skip it
+
+        jobs = min(resolve_jobs(jobs), max(len(pending), 1))
+    if jobs > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        size = max(1, -(-len(pending) // (jobs * 4)))
+        chunks = [pending[i : i + size] for i in range(0, len(pending), size)]
+        with phase("validate pool", jobs=jobs, files=len(pending)), ProcessPoolExecutor(
+            max_workers=jobs, initializer=_init_worker, initargs=(schema,)
+        ) as pool:
+            validated = [item for chunk in pool.map(_validate_chunk, chunks) for item in chunk]
+    else:
+        _init_worker(schema)
+        with phase("validate"):
+            validated = _validate_chunk(pending)
+
+    for name, digest, violations in validated:
+        results[Path(name)] = violations
+        if cache is not None:
+            cache.put(Path(name), digest, violations)
+    return results
+
+
+def vault_markdown(vault: Path) -> List[Path]:
+    """Every markdown file under ``vault``, skipping hidden directories such as ``.vault-cache``."""
+    with phase("glob"):
+        found = []
+        for root, dirs, files in os.walk(vault):
+            dirs[:] = sorted(name for name in dirs if not name.startswith("."))
+            found.extend(Path(root) / name for name in sorted(files) if name.endswith(".md"))
+        return found
+
+
+def staged_markdown(vault: Path) -> List[Path]:
+    import subprocess
+
+    result = subprocess.run(
+        ["git", "diff", "--cached", "--name-only", "--diff-filter=ACMR", "--relative", "--", "."],
+        cwd=vault,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return [vault / line for line in result.stdout.splitlines() if line.endswith(".md")]
+
+
+def run_check(
+    vault: Path,
+    paths: Sequence[Path] = (),
+    staged: bool = False,
+    schema_path: Optional[Path] = None,
+    cache_dir: Optional[Path] = None,
+    jobs: int = 1,
+    strict: bool = False,
+    as_json: bool = False,
+) -> int:
+    """Validate ``paths`` (default: the whole vault), print violations and return the exit code.
+
+    ``cache_dir`` of ``None`` disables the result cache.
+    """
+    if staged:
+        paths = staged_markdown(vault)
+    elif not paths:
+        paths = vault_markdown(vault)
+    paths = [path for path in paths if path.is_file()]
+
+    schema = load_schema(schema_path)
+    compiled = CompiledSchema(schema)  # fail fast on a malformed schema, before forking workers
+    if cache_dir is None:
+        results = validate_paths(paths, schema, jobs)
+    else:
+        with SchemaCache(cache_dir, compiled.digest) as cache:
+            results = validate_paths(paths, schema, jobs, cache)
+
+    violations = [
+        (path, line, severity, field, message)
+        for path in paths
+        for line, severity, field, message in sorted(results[path])
+    ]
+    errors = sum(1 for item in violations if item[2] == "error")
+    warnings = len(violations) - errors
+    if as_json:
+        print(
+            json.dumps(
+                [
+                    {"path": str(path), "line": line, "severity": severity, "field": field, "message": message}
+                    for path, line, severity, field, message in violations
+                ],
+                indent=2,
+            )
+        )
+    else:
+        for path, line, severity, _, message in violations:
+            try:
+                shown = path.relative_to(vault)
+            except ValueError:
+                shown = path
+            print(f"{shown}:{line}: {severity}: {message}")
+        print(f"Checked {len(paths)} files: {errors} errors, {warnings} warnings", file=sys.stderr)
+    return 1 if errors or (strict and warnings) else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Validate vault front matter against a schema.")
+    parser.add_argument(
+        "--vault",
+        type=Path,
+        required=True,
+        help="Path to product root (e.g., SynapticTrading_Vault/Product)",
+    )
+    parser.add_argument("paths", nargs="*", type=Path, help="Only validate these files")
+    parser.add_argument("--staged", action="store_true", help="Only validate markdown files staged in git")
+    parser.add_argument("--schema", type=Path, help="YAML schema merged over the built-in one")
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        help="Result cache location (default: <vault>/.vault-cache)",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Validate every file, ignoring cached results")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for files without cached results (0 = one per CPU core)",
+    )
+    parser.add_argument("--strict", action="store_true", help="Exit 1 on warnings as well as errors")
+    parser.add_argument("--json", action="store_true", help="Print violations as JSON")
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+    enable_from_args(args)
+
+    from frontmatter_index import default_cache_dir
+
+    code = run_check(
+        args.vault.resolve(),
+        [path.resolve() for path in args.paths],
+        args.staged,
+        args.schema,
+        None if args.no_cache else args.cache_dir or default_cache_dir(args.vault.resolve()),
+        args.jobs,
+        args.strict,
+        args.json,
+    )
+    sys.exit(code)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+Append-only time-series store of parallel development dashboard snapshots.
+
+Each refresh is reduced to a compact record, with per-worktree HEAD, commits in
+the last 24h, modified files and ahead/behind counts, plus conflict counts per
+worktree pair. The record is appended as one JSON line to a shard for its UTC
+day:
+
+    .dashboard-history/2025-11-04.ndjson          today, appended to
+    .dashboard-history/2025-11-03.ndjson.gz       sealed: gzip-compressed at day rollover
+    .dashboard-history/2025-10-01.60m.ndjson.gz   older than --raw-days: last snapshot per 60 minutes
+
+The retention policy runs when a day is sealed. Shards older than ``raw_days``
+are downsampled to the last snapshot of each ``downsample_minutes`` bucket, and
+shards older than ``keep_days`` are deleted. ``read_range`` streams the records
+of a time range one line at a time, opening only the shards for those days, so
+months of history never sit in memory at once.
+
+Usage:
+    python scripts/parallel_dev_dashboard.py --watch --history          # record every refresh
+    python scripts/dashboard_history.py --since 2025-09-01 --bucket day   # commit-rate / conflict trends
+    python scripts/dashboard_history.py --since 2025-11-04T09:00 --until 2025-11-04T12:00 --raw
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import gzip
+import json
+import os
+import shutil
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "VaultGuide" / "scripts" / "sync"))
+from timeutil import parse_when  # noqa: E402
+
+DEFAULT_HISTORY_DIR = Path(".dashboard-history")
+ACTIVE_SUFFIX = ".ndjson"
+SEALED_SUFFIX = ".ndjson.gz"
+BUCKETS = {"hour": 3600, "day": 86400, "week": 7 * 86400}
+
+
+class RetentionPolicy(NamedTuple):
+    raw_days: int = 14  # full-resolution history
+    keep_days: int = 365  # downsampled history; older shards are deleted
+    downsample_minutes: int = 60
+
+
+def _utc_iso(moment: dt.datetime) -> str:
+    return moment.astimezone(dt.timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+
+
+def _int(value: Any) -> Optional[int]:
+    try:
+        return int(str(value).strip())
+    except ValueError:
+        return None
+
+
+def compact_snapshot(report: Dict[str, Any], moment: Optional[dt.datetime] = None) -> Dict[str, Any]:
+    """Reduce a full dashboard report to the fields worth keeping as history."""
+    worktrees: Dict[str, Dict[str, Any]] = {}
+    for name, status in report.get("worktrees", {}).items():
+        if "error" in status:
+            worktrees[name] = {"error": True}
+            continue
+        counts = str(status.get("ahead_behind", "")).split()
+        behind, ahead = (_int(counts[0]), _int(counts[1])) if len(counts) == 2 else (None, None)
+        worktrees[name] = {
+            "head": (status.get("last_commit") or "").split(" ", 1)[0],
+            "commits_24h": _int(status.get("commits_today", "")),
+            "modified": status.get("modified_files"),
+            "ahead": ahead,
+            "behind": behind,
+        }
+    matrix = report.get("conflict_matrix", {"hunk_mode": False, "pairs": []})
+    key = "hunk_conflicts" if matrix.get("hunk_mode") else "files"
+    return {
+        "ts": _utc_iso(moment or dt.datetime.now(dt.timezone.utc)),
+        "worktrees": worktrees,
+        "conflicts": len(report.get("conflicts", [])),
+        "pairs": {"|".join(pair["worktrees"]): len(pair[key]) for pair in matrix.get("pairs", [])},
+        "refresh_ms": report.get("timing", {}).get("refresh_ms"),
+    }
+
+
+def _shard_day(path: Path) -> Optional[dt.date]:
+    try:
+        return dt.date.fromisoformat(path.name[:10])
+    except ValueError:
+        return None
+
+
+def _open_shard(path: Path):
+    return gzip.open(path, "rt", encoding="utf-8") if path.name.endswith(".gz") else path.open(encoding="utf-8")
+
+
+class HistoryStore:
+    """Day-sharded NDJSON snapshots under ``root``."""
+
+    def __init__(self, root: Path = DEFAULT_HISTORY_DIR, policy: RetentionPolicy = RetentionPolicy()) -> None:
+        self.root = root
+        self.policy = policy
+
+    def shards(self) -> List[Tuple[dt.date, Path]]:
+        """Readable shards by day; a day's plain file is ignored once its sealed copy exists."""
+        found: Dict[dt.date, Path] = {}
+        if not self.root.is_dir():
+            return []
+        for path in sorted(self.root.glob("*.ndjson*")):
+            day = _shard_day(path)
+            if day is None or path.name.endswith(".tmp"):
+                continue
+            if day not in found or path.name.endswith(".gz"):
+                found[day] = path
+        return sorted(found.items())
+
+    def append(self, report: Dict[str, Any], moment: Optional[dt.datetime] = None) -> Dict[str, Any]:
+        """Record one dashboard report; seals earlier days and applies retention on day rollover."""
+        moment = moment or dt.datetime.now(dt.timezone.utc)
+        record = compact_snapshot(report, moment)
+        self.root.mkdir(parents=True, exist_ok=True)
+        today = moment.astimezone(dt.timezone.utc).date()
+        active = self.root / f"{today.isoformat()}{ACTIVE_SUFFIX}"
+        if not active.exists():  # first snapshot of the day: seal the previous ones
+            self.maintain(today)
+        line = (json.dumps(record, separators=(",", ":"), ensure_ascii=False) + "\n").encode("utf-8")
+        # One O_APPEND write per record, so concurrent watchers never interleave lines.
+        fd = os.open(active, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, line)
+        finally:
+            os.close(fd)
+        return record
+
+    def maintain(self, today: Optional[dt.date] = None) -> Dict[str, int]:
+        """Seal finished days, downsample old ones and delete expired ones; returns counts."""
+        today = today or dt.datetime.now(dt.timezone.utc).date()
+        done = {"sealed": 0, "downsampled": 0, "deleted": 0}
+        downsampled_marker = f".{self.policy.downsample_minutes}m"
+        for day, path in self.shards():
+            age = (today - day).days
+            if age > self.policy.keep_days:
+                path.unlink()
+                done["deleted"] += 1
+            elif age > self.policy.raw_days and downsampled_marker not in path.name:
+                self._rewrite(path, day, f"{day.isoformat()}{downsampled_marker}{SEALED_SUFFIX}", downsample=True)
+                done["downsampled"] += 1
+            elif age > 0 and path.name.endswith(ACTIVE_SUFFIX):
+                self._rewrite(path, day, f"{day.isoformat()}{SEALED_SUFFIX}", downsample=False)
+                done["sealed"] += 1
+        return done
+
+    def _rewrite(self, source: Path, day: dt.date, name: str, downsample: bool) -> None:
+        target = self.root / name
+        tmp = target.with_name(target.name + ".tmp")
+        with _open_shard(source) as src, gzip.open(tmp, "wt", encoding="utf-8") as out:
+            if downsample:
+                for line in self._downsampled(src):
+                    out.write(line)
+            else:
+                shutil.copyfileobj(src, out)
+        os.replace(tmp, target)
+        for stale in self.root.glob(f"{day.isoformat()}*.ndjson*"):
+            if stale != target and not stale.name.endswith(".tmp"):
+                stale.unlink()
+
+    def _downsampled(self, lines) -> Iterator[str]:
+        """Keep the last snapshot of each bucket, with the number of snapshots it stands for."""
+        width = self.policy.downsample_minutes * 60
+        bucket, last, samples = None, None, 0
+        for line in lines:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            key = int(_parse_ts(record["ts"]).timestamp()) // width
+            if bucket is not None and key != bucket:
+                yield json.dumps(dict(last, samples=samples), separators=(",", ":"), ensure_ascii=False) + "\n"
+                samples = 0
+            bucket, last = key, record
+            samples += record.get("samples", 1)
+        if last is not None:
+            yield json.dumps(dict(last, samples=samples), separators=(",", ":"), ensure_ascii=False) + "\n"
+
+    def read_range(
+        self, start: Optional[dt.datetime] = None, end: Optional[dt.datetime] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream snapshots with ``start <= ts <= end`` in time order, one line at a time."""
+        start_ts = _utc_iso(start) if start else ""
+        end_ts = _utc_iso(end) if end else "~"  # sorts after any ISO timestamp
+        for day, path in self.shards():
+            if (start and day < start.astimezone(dt.timezone.utc).date()) or (
+                end and day > end.astimezone(dt.timezone.utc).date()
+            ):
+                continue
+            with _open_shard(path) as lines:
+                for line in lines:
+                    if not line.strip():
+                        continue
+                    record = json.loads(line)
+                    if record["ts"] > end_ts:
+                        break  # shards are appended in time order
+                    if record["ts"] >= start_ts:
+                        yield record
+
+
+def _parse_ts(value: str) -> dt.datetime:
+    moment = dt.datetime.fromisoformat(value.replace("Z", "+00:00"))
+    return moment if moment.tzinfo else moment.replace(tzinfo=dt.timezone.utc)
+
+
+def trends(records: Iterator[Dict[str, Any]], bucket_seconds: int) -> Dict[int, Dict[str, Dict[str, float]]]:
+    """Per bucket start and worktree: mean commits in the trailing 24h and max conflicting files.
+
+    Conflict counts per worktree are summed over the pairs it belongs to.
+    Memory grows with buckets × worktrees, not with the number of snapshots.
+    """
+    sums: Dict[int, Dict[str, List[float]]] = {}
+    for record in records:
+        bucket = int(_parse_ts(record["ts"]).timestamp()) // bucket_seconds * bucket_seconds
+        per_worktree = sums.setdefault(bucket, {})
+        conflicts: Dict[str, int] = {}
+        for pair, files in record.get("pairs", {}).items():
+            for name in pair.split("|"):
+                conflicts[name] = conflicts.get(name, 0) + files
+        for name, status in record.get("worktrees", {}).items():
+            acc = per_worktree.setdefault(name, [0.0, 0.0, 0.0])  # commit sum, samples, max conflicts
+            if status.get("commits_24h") is not None:
+                acc[0] += status["commits_24h"]
+                acc[1] += 1
+            acc[2] = max(acc[2], conflicts.get(name, 0))
+    return {
+        bucket: {
+            name: {"commits_24h": acc[0] / acc[1] if acc[1] else 0.0, "conflicts_max": acc[2]}
+            for name, acc in per_worktree.items()
+        }
+        for bucket, per_worktree in sorted(sums.items())
+    }
+
+
+def add_retention_arguments(parser: argparse.ArgumentParser) -> None:
+    defaults = RetentionPolicy()
+    parser.add_argument("--raw-days", type=int, default=defaults.raw_days, help="Days kept at full resolution")
+    parser.add_argument("--keep-days", type=int, default=defaults.keep_days, help="Days kept at all")
+    parser.add_argument(
+        "--downsample-minutes",
+        type=int,
+        default=defaults.downsample_minutes,
+        help="Bucket width for history older than --raw-days",
+    )
+
+
+def policy_from_args(args: argparse.Namespace) -> RetentionPolicy:
+    return RetentionPolicy(args.raw_days, args.keep_days, args.downsample_minutes)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Query recorded parallel development dashboard history.")
+    parser.add_argument("--dir", type=Path, default=DEFAULT_HISTORY_DIR, help="History directory")
+    parser.add_argument("--since", help="ISO date or timestamp (UTC unless an offset is given)")
+    parser.add_argument("--until", help="ISO date or timestamp (a date includes the whole day)")
+    parser.add_argument("--bucket", choices=list(BUCKETS), default="day", help="Trend bucket width")
+    parser.add_argument("--raw", action="store_true", help="Print the snapshots as NDJSON instead of trends")
+    parser.add_argument("--maintain", action="store_true", help="Seal, downsample and expire shards now")
+    add_retention_arguments(parser)
+    args = parser.parse_args()
+
+    store = HistoryStore(args.dir, policy_from_args(args))
+    if args.maintain:
+        done = store.maintain()
+        print(", ".join(f"{value} {key}" for key, value in done.items()))
+        return
+
+    records = store.read_range(parse_when(parser, args.since, False), parse_when(parser, args.until, True))
+    if args.raw:
+        for record in records:
+            sys.stdout.write(json.dumps(record, separators=(",", ":"), ensure_ascii=False) + "\n")
+        return
+
+    print(f"{'bucket (UTC)':<17} | {'worktree':<24} | {'commits/24h':>11} | {'conflicts':>9}")
+    for bucket, per_worktree in trends(records, BUCKETS[args.bucket]).items():
+        label = dt.datetime.fromtimestamp(bucket, dt.timezone.utc).strftime("%Y-%m-%d %H:%M")
+        for name, values in sorted(per_worktree.items()):
+            print(f"{label:<17} | {name:<24} | {values['commits_24h']:>11.1f} | {values['conflicts_max']:>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
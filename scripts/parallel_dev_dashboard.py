@@ -2,66 +2,661 @@
 """
 Parallel Development Dashboard
 Real-time monitoring and coordination tool for EPIC-005 and Unified Strategy parallel development
+
+Worktrees are polled concurrently with asyncio; pass --worktree NAME=PATH (repeatable)
+or --discover to monitor any number of worktrees instead of the default two.
+Conflicts are reported as an N-way matrix from one diff per worktree (cached by HEAD
+and merge-base); --hunks narrows same-file overlaps to overlapping line ranges.
+--watch is event-driven: it recomputes only the sections of worktrees whose HEAD,
+refs or index changed and redraws only the lines that differ.
+--profile FILE records per-section and per-git-call timings (JSON summary, or a
+Chrome trace with --profile-format chrome that shows the concurrent git calls).
+--history [DIR] appends a compact snapshot of every report to day-sharded, gzipped
+NDJSON (see dashboard_history.py for retention and commit-rate/conflict trends).
 """
 
+import asyncio
+import contextlib
+import io
+import itertools
 import os
+import re
+import shlex
+import shutil
 import subprocess
+import sys
 import json
+import time
+import unicodedata
 from datetime import datetime, timedelta
 from pathlib import Path
 import argparse
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "VaultGuide" / "scripts" / "sync"))
+from profiling import add_profile_arguments, count, enable_from_args, phase  # noqa: E402
+from dashboard_history import DEFAULT_HISTORY_DIR, HistoryStore, add_retention_arguments, policy_from_args  # noqa: E402
+
+# One log call yields the fields previously fetched by three separate commands.
+LAST_COMMIT_FORMAT = "--format=%h %s%x00%cr%x00%an"
+# The last day's commits, newest first: the first line is the last commit, the line count is commits today.
+RECENT_LOG = ("log", "--since=1 day ago", LAST_COMMIT_FORMAT)
+LAST_LOG = ("log", "-1", LAST_COMMIT_FORMAT)  # only when nothing was committed in the last day
+BASE_REF = "origin/main"
+AHEAD_BEHIND = ("rev-list", "--left-right", "--count", f"{BASE_REF}...HEAD")
+ACTIVITY_FORMAT = "--format=%h|%an|%cr|%s"
+HUNK_HEADER = re.compile(r"^@@ -(\d+)(?:,(\d+))? ")
+BINARY_LINE = re.compile(r"^Binary files (.+) and (.+) differ$")
+
+FileRanges = Dict[str, List[Tuple[int, int]]]  # path -> changed line ranges on the merge-base side
+
+# Display name -> sibling directory created by setup_parallel_worktrees.sh
+DEFAULT_WORKTREES = {
+    "EPIC-005": "SynapticTrading-EPIC005",
+    "Unified Strategy": "SynapticTrading-UnifiedStrategy",
+}
+
+# Bumped when report keys change shape; 2 moved per-worktree data under "worktrees"/"activity".
+REPORT_SCHEMA_VERSION = 2
+# Schema 1 top-level keys, still written to exported JSON for the default worktrees.
+# Deprecated: drop them in the next release.
+LEGACY_REPORT_KEYS = {
+    "EPIC-005": ("epic005", "epic005_activity"),
+    "Unified Strategy": ("unified_strategy", "unified_activity"),
+}
+
+
+def tracked_ahead_behind(status_out: str, base: str = BASE_REF) -> Optional[str]:
+    """``behind\tahead`` from ``# branch.ab`` when the branch's upstream is ``base``, else ``None``.
+
+    ``git status --branch`` counts against the upstream only, so a branch tracking
+    anything else still needs ``rev-list`` against ``base``.
+    """
+    upstream, counts = None, None
+    for line in status_out.split('\n'):
+        if line.startswith("# branch.upstream "):
+            upstream = line[len("# branch.upstream "):]
+        elif line.startswith("# branch.ab "):
+            counts = line[len("# branch.ab "):].split()
+    if upstream != base or counts is None or len(counts) != 2:
+        return None
+    return f"{counts[1].lstrip('-')}\t{counts[0].lstrip('+')}"
+
+
+def parse_branch_status(status_out: str, recent_out: str, last_out: str, ahead_out: str) -> Dict[str, str]:
+    """Build the branch status dict from raw git outputs.
+
+    ``recent_out`` is the last day's log; ``last_out`` is the ``log -1`` fallback
+    used when that is empty.
+    """
+    status = {}
+    branch = ""
+    modified = 0
+    for line in status_out.split('\n'):
+        if line.startswith("# branch.head "):
+            branch = line[len("# branch.head "):]
+        elif line and not line.startswith("#"):
+            modified += 1
+    status["current_branch"] = "" if branch == "(detached)" else branch
+
+    recent = recent_out.split("\n") if recent_out else []
+    last = (recent[0] if recent else last_out).split("\0")
+    last += [""] * (3 - len(last))
+    status["last_commit"], status["last_commit_time"], status["author"] = last[:3]
+    status["commits_today"] = str(len(recent))
+    status["modified_files"] = modified
+    status["ahead_behind"] = ahead_out
+    return status
+
+
+def parse_activity(commits: str) -> List[Dict[str, str]]:
+    activity = []
+    for line in commits.split('\n'):
+        if line:
+            parts = line.split('|', 3)
+            if len(parts) == 4:
+                activity.append({
+                    "hash": parts[0],
+                    "author": parts[1],
+                    "time": parts[2],
+                    "message": parts[3]
+                })
+    return activity
+
+
+def parse_name_list(output: str) -> set:
+    return {f for f in output.split('\n') if f}
+
+
+def find_conflicts(changed: Dict[str, set]) -> List[str]:
+    """Files changed in more than one worktree."""
+    seen: Dict[str, int] = {}
+    for files in changed.values():
+        for f in files:
+            seen[f] = seen.get(f, 0) + 1
+    return sorted(f for f, worktrees in seen.items() if worktrees > 1)
+
+
+def parse_hunks(diff_out: str) -> FileRanges:
+    """Map each file in a --no-prefix -U0 diff to its changed line ranges on the base side.
+
+    ``---``/``+++`` lines count as file headers only between ``diff --git`` and the
+    first ``@@``; inside a hunk they are content (e.g. a removed ``-- comment``).
+    Binary files map to no ranges, which always overlap.
+    """
+    files: FileRanges = {}
+    current = None
+    in_header = False
+    old_path = ""
+    for line in diff_out.split('\n'):
+        if line.startswith("diff --git "):
+            in_header, current, old_path = True, None, ""
+            continue
+        if in_header:
+            if line.startswith("--- "):
+                # git appends a TAB to paths that contain spaces.
+                old_path = line[4:].rstrip("\t")
+                continue
+            if line.startswith("+++ "):
+                path = line[4:].rstrip("\t")
+                current = files.setdefault(old_path if path == "/dev/null" else path, [])
+                continue
+            binary = BINARY_LINE.match(line)
+            if binary:
+                old, new = binary.groups()
+                files.setdefault(old if new == "/dev/null" else new, [])
+                continue
+            if not line.startswith("@@"):
+                continue  # index, mode and rename lines
+            in_header = False
+        if current is not None and line.startswith("@@"):
+            match = HUNK_HEADER.match(line)
+            if match:
+                start = int(match.group(1))
+                length = int(match.group(2) or 1)
+                current.append((start, start + max(length, 1) - 1))
+    return files
+
+
+def ranges_overlap(a: List[Tuple[int, int]], b: List[Tuple[int, int]]) -> bool:
+    """True when any two ranges overlap or touch; files without hunks (binary) always overlap."""
+    if not a or not b:
+        return True
+    a, b = sorted(a), sorted(b)
+    i = j = 0
+    while i < len(a) and j < len(b):
+        if a[i][0] <= b[j][1] + 1 and b[j][0] <= a[i][1] + 1:
+            return True
+        if a[i][1] < b[j][1]:
+            i += 1
+        else:
+            j += 1
+    return False
+
+
+def hunks_comparable(a: str, b: str, bases: Optional[Dict[str, str]]) -> bool:
+    """True when both worktrees' line ranges are numbered against the same merge-base."""
+    return bases is None or bases.get(a) == bases.get(b)
+
+
+def build_conflict_matrix(
+    changed: Dict[str, set],
+    hunks: Optional[Dict[str, FileRanges]] = None,
+    bases: Optional[Dict[str, str]] = None,
+) -> Dict[str, Any]:
+    """Pairwise overlap of changed files across every worktree.
+
+    An inverted file -> worktrees index keeps this proportional to the number of
+    shared files rather than to every pair of worktrees times their diff sizes.
+    Line ranges are only compared between worktrees with the same merge-base
+    (``bases``); other pairs fall back to file-level overlap.
+    """
+    owners: Dict[str, List[str]] = {}
+    for name in changed:
+        for f in changed[name]:
+            owners.setdefault(f, []).append(name)
+
+    pairs: Dict[Tuple[str, str], Dict[str, List[str]]] = {}
+    for f, names in owners.items():
+        for a, b in itertools.combinations(sorted(names), 2):
+            entry = pairs.setdefault((a, b), {"files": [], "hunk_conflicts": []})
+            entry["files"].append(f)
+            if hunks is not None and (
+                not hunks_comparable(a, b, bases) or ranges_overlap(hunks[a].get(f, []), hunks[b].get(f, []))
+            ):
+                entry["hunk_conflicts"].append(f)
+
+    matrix = []
+    for (a, b), entry in sorted(pairs.items()):
+        row = {"worktrees": [a, b], "files": sorted(entry["files"])}
+        if hunks is not None:
+            row["hunk_conflicts"] = sorted(entry["hunk_conflicts"])
+            if not hunks_comparable(a, b, bases):
+                row["file_level"] = True
+        matrix.append(row)
+    return {"hunk_mode": hunks is not None, "pairs": matrix}
+
+
+def conflict_pair(
+    a: str,
+    b: str,
+    changed: Dict[str, set],
+    hunks: Optional[Dict[str, FileRanges]] = None,
+    bases: Optional[Dict[str, str]] = None,
+) -> Optional[Dict[str, Any]]:
+    """Matrix row for one pair of worktrees, or None when they share no files."""
+    files = sorted(changed[a] & changed[b])
+    if not files:
+        return None
+    row = {"worktrees": [a, b], "files": files}
+    if hunks is not None:
+        if hunks_comparable(a, b, bases):
+            row["hunk_conflicts"] = [f for f in files if ranges_overlap(hunks[a].get(f, []), hunks[b].get(f, []))]
+        else:
+            row["hunk_conflicts"] = files
+            row["file_level"] = True
+    return row
+
+
+def update_conflict_matrix(
+    matrix: Dict[str, Any],
+    changed: Dict[str, set],
+    names: set,
+    hunks: Optional[Dict[str, FileRanges]] = None,
+    bases: Optional[Dict[str, str]] = None,
+) -> Dict[str, Any]:
+    """``matrix`` with only the rows of pairs involving ``names`` recomputed.
+
+    Rows of worktrees no longer in ``changed`` are dropped.
+    """
+    pairs = [
+        row for row in matrix["pairs"]
+        if not names.intersection(row["worktrees"]) and all(name in changed for name in row["worktrees"])
+    ]
+    for a, b in itertools.combinations(sorted(changed), 2):
+        if a in names or b in names:
+            row = conflict_pair(a, b, changed, hunks, bases)
+            if row is not None:
+                pairs.append(row)
+    pairs.sort(key=lambda row: row["worktrees"])
+    return {"hunk_mode": hunks is not None, "pairs": pairs}
+
+
+def conflicts_from_matrix(matrix: Dict[str, Any]) -> List[str]:
+    key = "hunk_conflicts" if matrix["hunk_mode"] else "files"
+    return sorted({f for pair in matrix["pairs"] for f in pair[key]})
+
+
+def with_legacy_keys(report: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy of ``report`` that also carries the schema 1 keys of the default worktrees it lists."""
+    report = dict(report)
+    for name, (status_key, activity_key) in LEGACY_REPORT_KEYS.items():
+        if name in report["worktrees"]:
+            report[status_key] = report["worktrees"][name]
+            report[activity_key] = report["activity"].get(name, [])
+    return report
+
+
+def discover_worktrees(main_repo: Path) -> Dict[str, Path]:
+    """All linked worktrees of main_repo, keyed by directory name."""
+    result = subprocess.run(
+        ["git", "worktree", "list", "--porcelain"],
+        cwd=main_repo, capture_output=True, text=True
+    )
+    worktrees = {}
+    for line in result.stdout.split('\n'):
+        if line.startswith("worktree "):
+            path = Path(line[len("worktree "):])
+            if path.resolve() != main_repo.resolve():
+                worktrees[path.name] = path
+    return worktrees
+
+
+def clip_to_width(line: str, width: int) -> str:
+    """Cut ``line`` to at most ``width`` terminal columns.
+
+    East Asian wide characters and emoji count as two columns; combining marks and
+    zero-width joiners count as none. An emoji variation selector widens the
+    character before it, so it counts as one more.
+    """
+    if len(line) * 2 <= width:
+        return line
+    used = 0
+    for pos, char in enumerate(line):
+        if char == "\ufe0f":
+            cells = 1
+        elif unicodedata.combining(char) or char == "\u200d":
+            cells = 0
+        else:
+            cells = 2 if unicodedata.east_asian_width(char) in "WF" else 1
+        if used + cells > width:
+            return line[:pos]
+        used += cells
+    return line
+
+
+async def _section(name: str, awaitable):
+    """Await one report section, timed as a phase alongside its concurrent siblings."""
+    with phase(name, concurrent=True):
+        return await awaitable
+
+
+class AsyncGitRunner:
+    """Runs git commands as concurrent subprocesses with a per-call timeout."""
+
+    def __init__(self, timeout: float = 10.0):
+        self.timeout = timeout
+        self.calls = 0
+        self.elapsed = 0.0
+        self.timeouts = 0
+
+    async def run(self, repo_path: Path, *args: str) -> str:
+        with phase(f"git {args[0]}", cat="git", concurrent=True, repo=repo_path.name):
+            return await self._run(repo_path, *args)
+
+    async def _run(self, repo_path: Path, *args: str) -> str:
+        start = time.perf_counter()
+        self.calls += 1
+        count("git_calls")
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                "git", *args,
+                cwd=repo_path,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL
+            )
+        except OSError:
+            return ""
+        try:
+            stdout, _ = await asyncio.wait_for(proc.communicate(), self.timeout)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            count("git_timeouts")
+            proc.kill()
+            await proc.wait()
+            return ""
+        finally:
+            self.elapsed += time.perf_counter() - start
+        return stdout.decode("utf-8", "replace").strip() if proc.returncode == 0 else ""
+
+
+class GitChangeWatcher:
+    """Detects HEAD, ref and index changes per repository.
+
+    Changes are found by comparing stat fingerprints of each repository's git
+    files, which costs no git subprocesses. When the optional inotify_simple
+    package is available it is used to sleep until the filesystem reports
+    activity; otherwise the fingerprints are polled every poll_interval seconds.
+    """
+
+    def __init__(self, repos: Dict[str, Path], poll_interval: float = 0.5):
+        self.poll_interval = poll_interval
+        self.git_dirs: Dict[str, Tuple[Path, Path]] = {}
+        for name, repo in repos.items():
+            result = subprocess.run(
+                ["git", "rev-parse", "--absolute-git-dir", "--git-common-dir"],
+                cwd=repo, capture_output=True, text=True
+            ) if repo.exists() else None
+            if result is None or result.returncode != 0:
+                continue
+            git_dir, common_dir = result.stdout.split('\n')[:2]
+            self.git_dirs[name] = (Path(git_dir), (repo / common_dir).resolve())
+        self.fingerprints = self.snapshot()
+        self.inotify = None
+        self.watched_dirs: set = set()
+        try:
+            import inotify_simple
+        except ImportError:
+            pass
+        else:
+            self.inotify = inotify_simple.INotify()
+            self._watch_flags = (
+                inotify_simple.flags.CLOSE_WRITE | inotify_simple.flags.MOVED_TO
+                | inotify_simple.flags.CREATE | inotify_simple.flags.DELETE
+            )
+            self._add_watches()
+
+    def _watch_paths(self, name: str) -> List[Path]:
+        """Files whose change can alter this repository's dashboard sections."""
+        git_dir, common_dir = self.git_dirs[name]
+        paths = [
+            git_dir / "HEAD",
+            git_dir / "index",
+            common_dir / "packed-refs",
+            common_dir / "refs" / "heads" / "main",
+            common_dir / "refs" / "remotes" / "origin" / "main",
+        ]
+        try:
+            head = (git_dir / "HEAD").read_text().strip()
+        except OSError:
+            head = ""
+        if head.startswith("ref: "):
+            paths.append(common_dir / head[len("ref: "):])
+        return paths
+
+    def _fingerprint(self, name: str) -> tuple:
+        paths = [str(path) for path in self._watch_paths(name)]
+        if name == "main":
+            # Integration branches live under the main repo's remote refs.
+            _, common_dir = self.git_dirs[name]
+            for root, _, files in os.walk(common_dir / "refs" / "remotes"):
+                paths.extend(os.path.join(root, filename) for filename in files)
+        entries = []
+        for path in sorted(set(paths)):
+            try:
+                st = os.stat(path)
+                entries.append((path, st.st_mtime_ns, st.st_size))
+            except OSError:
+                entries.append((path, None, None))
+        return tuple(entries)
+
+    def snapshot(self) -> Dict[str, tuple]:
+        return {name: self._fingerprint(name) for name in self.git_dirs}
+
+    @staticmethod
+    def _ref_dirs(common_dir: Path) -> List[Path]:
+        """``refs`` and every directory below its heads and remotes; inotify watches are not recursive."""
+        refs = common_dir / "refs"
+        dirs = [refs]
+        for top in (refs / "heads", refs / "remotes"):
+            for root, _, _ in os.walk(top):
+                dirs.append(Path(root))
+        return dirs
+
+    def _add_watches(self):
+        dirs = set()
+        for git_dir, common_dir in self.git_dirs.values():
+            dirs.update({git_dir, common_dir})
+            dirs.update(self._ref_dirs(common_dir))
+        for directory in dirs - self.watched_dirs:
+            with contextlib.suppress(OSError):
+                self.inotify.add_watch(str(directory), self._watch_flags)
+        self.watched_dirs |= dirs
+
+    def changed(self) -> set:
+        """Names of repositories whose fingerprint differs from the last call."""
+        current = self.snapshot()
+        names = {name for name, fp in current.items() if fp != self.fingerprints.get(name)}
+        self.fingerprints = current
+        return names
+
+    def wait(self, timeout: float) -> set:
+        """Block until a repository changes or timeout elapses; returns changed names."""
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return set()
+            if self.inotify is not None:
+                if not self.inotify.read(timeout=int(remaining * 1000)):
+                    return set()
+                time.sleep(0.05)  # let git finish its lock-file renames
+                self._add_watches()
+            else:
+                time.sleep(min(self.poll_interval, remaining))
+            names = self.changed()
+            if names:
+                return names
+
 
 class ParallelDevDashboard:
-    def __init__(self):
+    def __init__(
+        self,
+        latency_budget_ms: Optional[float] = None,
+        worktrees: Optional[Dict[str, Path]] = None,
+        git_timeout: float = 10.0,
+        hunk_mode: bool = False,
+        history: Optional[HistoryStore] = None,
+    ):
         self.main_repo = Path.cwd()
-        self.epic005_repo = self.main_repo.parent / "SynapticTrading-EPIC005"
-        self.unified_repo = self.main_repo.parent / "SynapticTrading-UnifiedStrategy"
+        if worktrees is None:
+            worktrees = {name: self.main_repo.parent / directory for name, directory in DEFAULT_WORKTREES.items()}
+        self.worktrees = worktrees
+        self.latency_budget_ms = latency_budget_ms
+        self.git_timeout = git_timeout
+        self.hunk_mode = hunk_mode
+        self.history = history
+        self.base_branch = "main"
+        # (repo, HEAD, merge-base, hunk_mode) -> diff output, valid while the worktree is clean
+        self.diff_cache: Dict[Tuple[str, str, str, bool], str] = {}
+        # worktree name -> (merge-base, changed files, hunks or None) from the last diff, for incremental matrices
+        self.worktree_changes: Dict[str, Tuple[str, set, Optional[FileRanges]]] = {}
+        self.git_calls = 0
+        self.git_time = 0.0
         
-    def run_git_command(self, repo_path: Path, command: str) -> str:
-        """Run git command in specified repository."""
+    def run_git_command(self, repo_path: Path, command: Union[str, List[str]]) -> str:
+        """Run git command in specified repository (no shell involved)."""
+        args = shlex.split(command) if isinstance(command, str) else list(command)
+        start = time.perf_counter()
+        count("git_calls")
         try:
-            result = subprocess.run(
-                f"git {command}",
-                shell=True,
-                cwd=repo_path,
-                capture_output=True,
-                text=True
-            )
+            with phase(f"git {args[0]}", cat="git", repo=repo_path.name):
+                result = subprocess.run(
+                    ["git", *args],
+                    cwd=repo_path,
+                    capture_output=True,
+                    text=True
+                )
             return result.stdout.strip() if result.returncode == 0 else ""
         except Exception:
             return ""
+        finally:
+            self.git_calls += 1
+            self.git_time += time.perf_counter() - start
     
     def get_branch_status(self, repo_path: Path) -> Dict[str, str]:
         """Get detailed branch status for a repository."""
         if not repo_path.exists():
             return {"status": "not_found", "error": f"Repository not found: {repo_path}"}
             
-        status = {}
-        status["current_branch"] = self.run_git_command(repo_path, "branch --show-current")
-        status["last_commit"] = self.run_git_command(repo_path, "log -1 --oneline")
-        status["last_commit_time"] = self.run_git_command(repo_path, "log -1 --format='%cr'")
-        status["author"] = self.run_git_command(repo_path, "log -1 --format='%an'")
-        status["commits_today"] = self.run_git_command(repo_path, "rev-list --count --since='1 day ago' HEAD")
-        status["modified_files"] = self.run_git_command(repo_path, "status --porcelain").count('\n') if self.run_git_command(repo_path, "status --porcelain") else 0
-        status["ahead_behind"] = self.run_git_command(repo_path, "rev-list --left-right --count origin/main...HEAD")
-        
-        return status
+        status_out = self.run_git_command(repo_path, ["status", "--porcelain=v2", "--branch"])
+        recent_out = self.run_git_command(repo_path, list(RECENT_LOG))
+        last_out = "" if recent_out else self.run_git_command(repo_path, list(LAST_LOG))
+        ahead_out = tracked_ahead_behind(status_out)
+        if ahead_out is None:
+            ahead_out = self.run_git_command(repo_path, list(AHEAD_BEHIND))
+        return parse_branch_status(status_out, recent_out, last_out, ahead_out)
+    
+    async def get_branch_status_async(self, git: AsyncGitRunner, repo_path: Path) -> Dict[str, str]:
+        """Concurrent variant of get_branch_status."""
+        if not repo_path.exists():
+            return {"status": "not_found", "error": f"Repository not found: {repo_path}"}
+        status_out, recent_out = await asyncio.gather(
+            git.run(repo_path, "status", "--porcelain=v2", "--branch"),
+            git.run(repo_path, *RECENT_LOG),
+        )
+        ahead_out = tracked_ahead_behind(status_out)
+        # Follow-up calls only for an idle branch or one that does not track origin/main.
+        followups = {}
+        if not recent_out:
+            followups["last"] = git.run(repo_path, *LAST_LOG)
+        if ahead_out is None:
+            followups["ahead"] = git.run(repo_path, *AHEAD_BEHIND)
+        results = dict(zip(followups, await asyncio.gather(*followups.values())))
+        if ahead_out is None:
+            ahead_out = results["ahead"]
+        return parse_branch_status(status_out, recent_out, results.get("last", ""), ahead_out)
     
     def detect_file_conflicts(self) -> List[str]:
-        """Detect potential file conflicts between the two development streams."""
-        if not self.epic005_repo.exists() or not self.unified_repo.exists():
-            return []
-            
-        epic005_files = set(self.run_git_command(self.epic005_repo, "diff --name-only main").split('\n'))
-        unified_files = set(self.run_git_command(self.unified_repo, "diff --name-only main").split('\n'))
+        """Detect potential file conflicts between the parallel development streams."""
+        return asyncio.run(self.detect_file_conflicts_async(AsyncGitRunner(self.git_timeout)))
+    
+    async def worktree_diff_async(self, git: AsyncGitRunner, repo_path: Path) -> Tuple[str, str]:
+        """Merge-base with the base branch, and the worktree's diff against it.
         
-        # Remove empty strings
-        epic005_files = {f for f in epic005_files if f}
-        unified_files = {f for f in unified_files if f}
+        Committed-only diffs are cached by HEAD and merge-base SHA; a dirty
+        worktree is always diffed fresh so uncommitted edits are included.
+        """
+        status_out, merge_base = await asyncio.gather(
+            git.run(repo_path, "status", "--porcelain=v2", "--branch", "--untracked-files=no"),
+            git.run(repo_path, "merge-base", self.base_branch, "HEAD"),
+        )
+        if not merge_base:
+            return "", ""
+        head = ""
+        dirty = False
+        for line in status_out.split('\n'):
+            if line.startswith("# branch.oid "):
+                head = line[len("# branch.oid "):]
+            elif line and not line.startswith("#"):
+                dirty = True
+        key = (str(repo_path), head, merge_base, self.hunk_mode)
+        if not dirty and key in self.diff_cache:
+            count("diff_cache_hits")
+            return merge_base, self.diff_cache[key]
+        count("diff_cache_misses")
+        if self.hunk_mode:
+            output = await git.run(repo_path, "diff", "--no-prefix", "-U0", "--no-color", merge_base)
+        else:
+            output = await git.run(repo_path, "diff", "--name-only", merge_base)
+        if not dirty:
+            self.diff_cache[key] = output
+        return merge_base, output
+    
+    async def worktree_changes_async(
+        self, git: AsyncGitRunner, repo_path: Path
+    ) -> Tuple[str, set, Optional[FileRanges]]:
+        """Merge-base and changed files of a worktree, with their line ranges in hunk mode."""
+        merge_base, output = await self.worktree_diff_async(git, repo_path)
+        if self.hunk_mode:
+            hunks = parse_hunks(output)
+            return merge_base, set(hunks), hunks
+        return merge_base, parse_name_list(output), None
+    
+    async def conflict_matrix_async(
+        self, git: AsyncGitRunner, names: Optional[set] = None, previous: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """N-way conflict matrix from exactly one diff per worktree.
         
-        conflicts = epic005_files.intersection(unified_files)
-        return list(conflicts)
+        Given the ``previous`` matrix, only the worktrees in ``names`` are diffed
+        again and only the rows of pairs involving them are recomputed. In hunk
+        mode, pairs with different merge-bases are compared by file only: their
+        line numbers refer to different base commits.
+        """
+        repos = {name: repo for name, repo in self.worktrees.items() if repo.exists()}
+        incremental = previous is not None and names is not None
+        stale = [
+            name for name in repos
+            if not incremental or name in names or name not in self.worktree_changes
+        ]
+        results = await asyncio.gather(*(self.worktree_changes_async(git, repos[name]) for name in stale))
+        self.worktree_changes = {
+            name: changes for name, changes in self.worktree_changes.items() if name in repos
+        }
+        self.worktree_changes.update(zip(stale, results))
+        changed = {name: files for name, (_, files, _) in self.worktree_changes.items()}
+        if not self.hunk_mode:
+            hunks, bases = None, None
+        else:
+            hunks = {name: ranges for name, (_, _, ranges) in self.worktree_changes.items()}
+            bases = {name: base for name, (base, _, _) in self.worktree_changes.items()}
+        if incremental:
+            return update_conflict_matrix(previous, changed, set(stale), hunks, bases)
+        return build_conflict_matrix(changed, hunks, bases)
+    
+    async def detect_file_conflicts_async(self, git: AsyncGitRunner) -> List[str]:
+        matrix = await self.conflict_matrix_async(git)
+        return conflicts_from_matrix(matrix)
     
     def get_commit_activity(self, repo_path: Path, days: int = 7) -> List[Dict[str, str]]:
         """Get recent commit activity for a repository."""
@@ -70,73 +665,117 @@ class ParallelDevDashboard:
             
         commits = self.run_git_command(
             repo_path, 
-            f"log --since='{days} days ago' --format='%h|%an|%cr|%s'"
+            ["log", f"--since={days} days ago", ACTIVITY_FORMAT]
         )
-        
-        activity = []
-        for line in commits.split('\n'):
-            if line:
-                parts = line.split('|', 3)
-                if len(parts) == 4:
-                    activity.append({
-                        "hash": parts[0],
-                        "author": parts[1],
-                        "time": parts[2],
-                        "message": parts[3]
-                    })
-        
-        return activity
+        return parse_activity(commits)
     
-    def generate_status_report(self) -> Dict[str, any]:
-        """Generate comprehensive status report."""
-        report = {
+    async def get_commit_activity_async(self, git: AsyncGitRunner, repo_path: Path, days: int = 7) -> List[Dict[str, str]]:
+        if not repo_path.exists():
+            return []
+        return parse_activity(await git.run(repo_path, "log", f"--since={days} days ago", ACTIVITY_FORMAT))
+    
+    async def generate_status_report_async(self) -> Dict[str, Any]:
+        """Poll every worktree and report section concurrently."""
+        git = AsyncGitRunner(self.git_timeout)
+        names = list(self.worktrees)
+        repos = list(self.worktrees.values())
+        statuses, activities, main_status, conflicts = await asyncio.gather(
+            _section("branch status", asyncio.gather(*(self.get_branch_status_async(git, repo) for repo in repos))),
+            _section("activity", asyncio.gather(*(self.get_commit_activity_async(git, repo) for repo in repos))),
+            _section("main status", self.get_branch_status_async(git, self.main_repo)),
+            _section("conflicts", self.conflict_matrix_async(git)),
+        )
+        self.git_calls += git.calls
+        self.git_time += git.elapsed
+        return {
+            "schema_version": REPORT_SCHEMA_VERSION,
             "timestamp": datetime.now().isoformat(),
-            "epic005": self.get_branch_status(self.epic005_repo),
-            "unified_strategy": self.get_branch_status(self.unified_repo),
-            "main": self.get_branch_status(self.main_repo),
-            "conflicts": self.detect_file_conflicts(),
-            "epic005_activity": self.get_commit_activity(self.epic005_repo),
-            "unified_activity": self.get_commit_activity(self.unified_repo)
+            "worktrees": dict(zip(names, statuses)),
+            "main": main_status,
+            "conflicts": conflicts_from_matrix(conflicts),
+            "conflict_matrix": conflicts,
+            "activity": dict(zip(names, activities)),
+            "git_timeouts": git.timeouts,
         }
+    
+    async def refresh_report_async(self, report: Dict[str, Any], changed: set) -> Dict[str, Any]:
+        """Recompute only the report sections affected by changes in the named repos.
         
+        Only the changed worktrees are diffed again, unless the main repo changed:
+        a moved base branch can shift every worktree's merge-base.
+        """
+        git = AsyncGitRunner(self.git_timeout)
+        names = [name for name in self.worktrees if name in changed]
+        statuses, activities, main_status, matrix = await asyncio.gather(
+            asyncio.gather(*(self.get_branch_status_async(git, self.worktrees[name]) for name in names)),
+            asyncio.gather(*(self.get_commit_activity_async(git, self.worktrees[name]) for name in names)),
+            self.get_branch_status_async(git, self.main_repo) if "main" in changed else asyncio.sleep(0, report["main"]),
+            self.conflict_matrix_async(git)
+            if "main" in changed
+            else self.conflict_matrix_async(git, set(names), report["conflict_matrix"]),
+        )
+        self.git_calls += git.calls
+        self.git_time += git.elapsed
+        report = dict(report, worktrees=dict(report["worktrees"]), activity=dict(report["activity"]))
+        report["worktrees"].update(zip(names, statuses))
+        report["activity"].update(zip(names, activities))
+        report.update(
+            timestamp=datetime.now().isoformat(),
+            main=main_status,
+            conflicts=conflicts_from_matrix(matrix),
+            conflict_matrix=matrix,
+            git_timeouts=git.timeouts,
+        )
+        if "main" in changed:
+            report.pop("integration", None)
+        return report
+    
+    def generate_status_report(self) -> Dict[str, Any]:
+        """Generate comprehensive status report."""
+        start = time.perf_counter()
+        calls_before, git_time_before = self.git_calls, self.git_time
+        with phase("status report"):
+            report = asyncio.run(self.generate_status_report_async())
+        
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        report["timing"] = {
+            "refresh_ms": round(elapsed_ms, 1),
+            "git_calls": self.git_calls - calls_before,
+            "git_ms": round((self.git_time - git_time_before) * 1000, 1),
+            "budget_ms": self.latency_budget_ms,
+            "over_budget": self.latency_budget_ms is not None and elapsed_ms > self.latency_budget_ms,
+        }
         return report
     
-    def print_status_dashboard(self):
+    def record_history(self, report: Dict[str, Any]):
+        """Append a compact snapshot of ``report`` to the history store, if one is configured."""
+        if self.history is not None:
+            with phase("history append"):
+                self.history.append(report)
+    
+    def print_status_dashboard(self, report: Optional[Dict[str, Any]] = None):
         """Print formatted status dashboard."""
-        report = self.generate_status_report()
+        if report is None:
+            report = self.generate_status_report()
+            self.record_history(report)
         
         print("=" * 80)
         print("🚀 PARALLEL DEVELOPMENT DASHBOARD")
         print(f"📅 {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         print("=" * 80)
         
-        # EPIC-005 Status
-        print("\n📊 EPIC-005 STATUS")
-        print("-" * 40)
-        epic005 = report["epic005"]
-        if "error" in epic005:
-            print(f"❌ {epic005['error']}")
-        else:
-            print(f"🌿 Branch: {epic005['current_branch']}")
-            print(f"📝 Last commit: {epic005['last_commit']}")
-            print(f"⏰ When: {epic005['last_commit_time']}")
-            print(f"👤 Author: {epic005['author']}")
-            print(f"📈 Commits today: {epic005['commits_today']}")
-            print(f"📄 Modified files: {epic005['modified_files']}")
-        
-        # Unified Strategy Status
-        print("\n🔧 UNIFIED STRATEGY STATUS")
-        print("-" * 40)
-        unified = report["unified_strategy"]
-        if "error" in unified:
-            print(f"❌ {unified['error']}")
-        else:
-            print(f"🌿 Branch: {unified['current_branch']}")
-            print(f"📝 Last commit: {unified['last_commit']}")
-            print(f"⏰ When: {unified['last_commit_time']}")
-            print(f"👤 Author: {unified['author']}")
-            print(f"📈 Commits today: {unified['commits_today']}")
-            print(f"📄 Modified files: {unified['modified_files']}")
+        for name, status in report["worktrees"].items():
+            print(f"\n📊 {name.upper()} STATUS")
+            print("-" * 40)
+            if "error" in status:
+                print(f"❌ {status['error']}")
+            else:
+                print(f"🌿 Branch: {status['current_branch']}")
+                print(f"📝 Last commit: {status['last_commit']}")
+                print(f"⏰ When: {status['last_commit_time']}")
+                print(f"👤 Author: {status['author']}")
+                print(f"📈 Commits today: {status['commits_today']}")
+                print(f"📄 Modified files: {status['modified_files']}")
         
         # Conflict Detection
         print("\n⚠️  CONFLICT ANALYSIS")
@@ -150,34 +789,62 @@ class ParallelDevDashboard:
                 print(f"   ... and {len(conflicts) - 5} more")
         else:
             print("✅ No file conflicts detected")
+        for pair in report["conflict_matrix"]["pairs"]:
+            a, b = pair["worktrees"]
+            detail = f"{len(pair['files'])} shared files"
+            if pair.get("file_level"):
+                detail += " (different merge-bases; line ranges not compared)"
+            elif report["conflict_matrix"]["hunk_mode"]:
+                detail += f", {len(pair['hunk_conflicts'])} with overlapping hunks"
+            print(f"   {a} ↔ {b}: {detail}")
         
         # Recent Activity
         print("\n📈 RECENT ACTIVITY (Last 3 commits)")
         print("-" * 40)
         
-        print("EPIC-005:")
-        for commit in report["epic005_activity"][:3]:
-            print(f"  {commit['hash']} • {commit['author']} • {commit['time']}")
-            print(f"    {commit['message']}")
-        
-        print("\nUnified Strategy:")
-        for commit in report["unified_activity"][:3]:
-            print(f"  {commit['hash']} • {commit['author']} • {commit['time']}")
-            print(f"    {commit['message']}")
+        for pos, (name, activity) in enumerate(report["activity"].items()):
+            if pos:
+                print()
+            print(f"{name}:")
+            for commit in activity[:3]:
+                print(f"  {commit['hash']} • {commit['author']} • {commit['time']}")
+                print(f"    {commit['message']}")
         
         # Integration Status
         print("\n🔄 INTEGRATION STATUS")
         print("-" * 40)
-        self.print_integration_status()
+        if "integration" in report:
+            print(report["integration"], end="")
+        else:
+            self.print_integration_status()
+        
+        timing = report["timing"]
+        print(f"\n⏱️  Refreshed in {timing['refresh_ms']:.0f} ms ({timing['git_calls']} git calls)")
+        if report["git_timeouts"]:
+            print(f"⚠️  {report['git_timeouts']} git calls timed out after {self.git_timeout:.0f}s")
+        if timing["over_budget"]:
+            print(f"⚠️  Over latency budget of {timing['budget_ms']:.0f} ms")
         
         print("\n" + "=" * 80)
     
+    def render_dashboard(self, report: Dict[str, Any]) -> List[str]:
+        """Render the dashboard to lines, caching the integration section in the report."""
+        if "integration" not in report:
+            buffer = io.StringIO()
+            with contextlib.redirect_stdout(buffer):
+                self.print_integration_status()
+            report["integration"] = buffer.getvalue()
+        buffer = io.StringIO()
+        with contextlib.redirect_stdout(buffer):
+            self.print_status_dashboard(report)
+        return buffer.getvalue().rstrip("\n").split("\n")
+    
     def print_integration_status(self):
         """Print integration branch status."""
         # Check for integration branches
         integration_branches = self.run_git_command(
             self.main_repo, 
-            "branch -r | grep integration"
+            ["branch", "-r", "--list", "*integration*"]
         )
         
         if integration_branches:
@@ -212,14 +879,13 @@ class ParallelDevDashboard:
             print("❌ No worktrees found - run setup script?")
         
         # Check for worktree issues
-        epic005_exists = self.epic005_repo.exists()
-        unified_exists = self.unified_repo.exists()
+        exists = {name: repo.exists() for name, repo in self.worktrees.items()}
         
         print(f"\n🔍 Worktree Status:")
-        print(f"  EPIC-005: {'✅ Ready' if epic005_exists else '❌ Missing'}")
-        print(f"  Unified Strategy: {'✅ Ready' if unified_exists else '❌ Missing'}")
+        for name, ready in exists.items():
+            print(f"  {name}: {'✅ Ready' if ready else '❌ Missing'}")
         
-        if not epic005_exists or not unified_exists:
+        if not all(exists.values()):
             print("\n💡 Run setup script: ./scripts/setup_parallel_worktrees.sh")
     
     def export_json_report(self, filename: Optional[str] = None):
@@ -228,24 +894,72 @@ class ParallelDevDashboard:
             filename = f"parallel_dev_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
         
         report = self.generate_status_report()
+        self.record_history(report)
         
         with open(filename, 'w') as f:
-            json.dump(report, f, indent=2)
+            json.dump(with_legacy_keys(report), f, indent=2)
         
         print(f"📄 Report exported to: {filename}")
     
     def watch_mode(self, interval: int = 30):
-        """Run dashboard in watch mode with auto-refresh."""
-        import time
+        """Run dashboard in watch mode, refreshing when a worktree's HEAD, refs or index change.
+        
+        A full refresh still happens every interval seconds to pick up working-tree
+        edits, which do not touch git metadata.
+        """
+        watcher = GitChangeWatcher(dict(self.worktrees, main=self.main_repo))
+        report = self.generate_status_report()
+        self.record_history(report)
+        previous: List[str] = []
+        width = 0
         
         try:
             while True:
-                os.system('clear')  # Clear screen
-                self.print_status_dashboard()
-                print(f"\n🔄 Refreshing in {interval} seconds... (Ctrl+C to exit)")
-                time.sleep(interval)
+                lines = self.render_dashboard(report)
+                lines.append("")
+                lines.append(f"👀 Watching {len(watcher.git_dirs)} repos for changes; full refresh every {interval}s (Ctrl+C to exit)")
+                columns = shutil.get_terminal_size().columns
+                if columns != width:
+                    # First frame or a resize: clear once; later frames only rewrite changed lines.
+                    print("\033[2J", end="")
+                    previous, width = [], columns
+                previous = self._redraw(previous, lines, width)
+                
+                changed = watcher.wait(interval)
+                start = time.perf_counter()
+                calls_before = self.git_calls
+                if changed:
+                    report = asyncio.run(self.refresh_report_async(report, changed))
+                else:
+                    report = self.generate_status_report()
+                    watcher.changed()
+                report["timing"] = dict(
+                    report.get("timing", {}),
+                    refresh_ms=round((time.perf_counter() - start) * 1000, 1),
+                    git_calls=self.git_calls - calls_before,
+                )
+                self.record_history(report)
         except KeyboardInterrupt:
             print("\n👋 Dashboard stopped")
+    
+    @staticmethod
+    def _redraw(previous: List[str], lines: List[str], width: int) -> List[str]:
+        """Rewrite only the terminal rows whose content changed; returns the rows as drawn.
+        
+        Lines are clipped to the terminal width so none wraps onto the next row,
+        which would shift every row below it.
+        """
+        # Leave the last column free: writing into it puts some terminals in a pending wrap.
+        lines = [clip_to_width(line, max(width - 1, 1)) for line in lines]
+        out = []
+        for row, line in enumerate(lines):
+            if row >= len(previous) or previous[row] != line:
+                out.append(f"\033[{row + 1};1H{line}\033[K")
+        if len(previous) > len(lines):
+            out.append(f"\033[{len(lines) + 1};1H\033[J")
+        out.append(f"\033[{len(lines) + 1};1H")
+        print("".join(out), end="", flush=True)
+        return lines
 
 def main():
     parser = argparse.ArgumentParser(description="Parallel Development Dashboard")
@@ -253,10 +967,43 @@ def main():
     parser.add_argument("--interval", type=int, default=30, help="Refresh interval for watch mode (seconds)")
     parser.add_argument("--export", type=str, help="Export JSON report to file")
     parser.add_argument("--health", action="store_true", help="Check worktree health")
+    parser.add_argument("--budget-ms", type=float, default=1000, help="Warn when a refresh takes longer than this (milliseconds)")
+    parser.add_argument("--worktree", action="append", metavar="NAME=PATH", help="Worktree to monitor (repeatable; replaces the default two)")
+    parser.add_argument("--discover", action="store_true", help="Monitor every linked worktree from 'git worktree list'")
+    parser.add_argument("--git-timeout", type=float, default=10.0, help="Timeout per git call (seconds)")
+    parser.add_argument("--hunks", action="store_true", help="Only count conflicts whose changed line ranges overlap")
+    parser.add_argument(
+        "--history",
+        nargs="?",
+        type=Path,
+        const=DEFAULT_HISTORY_DIR,
+        metavar="DIR",
+        help=f"Append a snapshot of each report to a sharded history store (default dir: {DEFAULT_HISTORY_DIR})",
+    )
+    add_retention_arguments(parser)
+    add_profile_arguments(parser)
     
     args = parser.parse_args()
+    enable_from_args(args)
+    
+    worktrees = None
+    if args.discover:
+        worktrees = discover_worktrees(Path.cwd())
+    if args.worktree:
+        worktrees = worktrees or {}
+        for spec in args.worktree:
+            name, sep, path = spec.partition("=")
+            if not sep:
+                parser.error(f"--worktree expects NAME=PATH, got {spec!r}")
+            worktrees[name] = Path(path).expanduser()
     
-    dashboard = ParallelDevDashboard()
+    dashboard = ParallelDevDashboard(
+        latency_budget_ms=args.budget_ms,
+        worktrees=worktrees,
+        git_timeout=args.git_timeout,
+        hunk_mode=args.hunks,
+        history=HistoryStore(args.history, policy_from_args(args)) if args.history else None,
+    )
     
     if args.health:
         dashboard.check_worktree_health()
@@ -0,0 +1,89 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "VaultGuide" / "scripts" / "sync"))
+import batch_writer  # noqa: E402
+from batch_writer import BatchCommitError, BatchWriter  # noqa: E402
+
+
+def render(metadata, body):
+    lines = [f"{key}: {value}" for key, value in metadata.items()]
+    return "---\n" + "\n".join(lines) + "\n---\n" + str(body)
+
+
+@pytest.fixture
+def docs(tmp_path):
+    paths = []
+    for name in ("a.md", "b.md", "c.md"):
+        path = tmp_path / name
+        path.write_text("---\nstatus: planned\n---\nbody\n")
+        paths.append(path)
+    return paths
+
+
+def stage_all(paths):
+    writer = BatchWriter(render)
+    for path in paths:
+        doc = writer.document(path)
+        doc.metadata["status"] = "completed"
+        doc.changed = True
+    return writer
+
+
+def test_commit_renames_every_document(docs):
+    written = stage_all(docs).commit()
+
+    assert [doc.path for doc in written] == [path.resolve() for path in docs]
+    assert all("status: completed" in path.read_text() for path in docs)
+
+
+def test_failed_rename_reports_paths_and_removes_temp_files(docs, monkeypatch):
+    real_replace = os.replace
+    calls = []
+
+    def flaky_replace(src, dst):
+        calls.append(dst)
+        if len(calls) == 2:
+            raise PermissionError("read-only")
+        real_replace(src, dst)
+
+    monkeypatch.setattr(batch_writer.os, "replace", flaky_replace)
+    with pytest.raises(BatchCommitError) as info:
+        stage_all(docs).commit()
+
+    first, second, third = (path.resolve() for path in docs)
+    assert info.value.committed == [first]
+    assert info.value.pending == [second, third]
+    assert "status: completed" in first.read_text()
+    assert "status: planned" in second.read_text() and "status: planned" in third.read_text()
+    assert not list(docs[0].parent.glob("*.tmp"))
+
+
+def edit_and_commit(path, edit, volatile=("updated_at",)):
+    writer = BatchWriter(render, volatile=volatile)
+    doc = writer.document(path)
+    edit(doc.metadata)
+    doc.changed = True
+    return writer, writer.commit()
+
+
+def test_edits_that_cancel_out_or_touch_only_volatile_fields_are_skipped(tmp_path):
+    path = tmp_path / "a.md"
+    path.write_text("---\nstatus: planned\nprogress_pct: 0\nupdated_at: 2025-11-01\n---\nbody\n")
+    before = (path.read_text(), path.stat().st_mtime_ns)
+
+    edits = [
+        lambda metadata: metadata.update(status="completed") or metadata.update(status="planned"),
+        lambda metadata: metadata.update(dict(reversed(list(metadata.items())))),
+        lambda metadata: metadata.update(updated_at="2025-11-20"),
+    ]
+    for edit in edits:
+        writer, written = edit_and_commit(path, edit)
+        assert written == [] and len(writer.skipped()) == 1
+    assert (path.read_text(), path.stat().st_mtime_ns) == before
+
+    _, written = edit_and_commit(path, lambda metadata: metadata.update(progress_pct=10, updated_at="2025-11-20"))
+    assert len(written) == 1 and "progress_pct: 10" in path.read_text()
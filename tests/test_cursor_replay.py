@@ -0,0 +1,62 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "VaultGuide" / "scripts" / "sync"))
+from cursor_replay import CursorReplay, merged_events, stream_cursor_file  # noqa: E402
+
+OUT_OF_ORDER = """\
+cursors:
+  - cursor_id: C-1
+    timestamp: 2025-11-04T10:00:00Z
+    touched_epics:
+      - id: EPIC-001
+        status: in_progress
+        progress_pct: 10
+  - cursor_id: C-2
+    timestamp: 2025-11-03T10:00:00Z
+    touched_epics:
+      - id: EPIC-001
+        status: planned
+  - cursor_id: C-3
+    timestamp: 2025-11-05T10:00:00Z
+    touched_epics:
+      - id: EPIC-001
+        progress_pct: 40
+"""
+
+IN_ORDER = """\
+cursors:
+  - cursor_id: D-1
+    timestamp: 2025-11-04T12:00:00Z
+    touched_epics:
+      - id: EPIC-002
+        status: completed
+"""
+
+
+def write_cursor(root, sprint, text):
+    path = root / "Sprints" / sprint / "progress_cursor.yaml"
+    path.parent.mkdir(parents=True)
+    path.write_text(text)
+    return path
+
+
+def test_out_of_order_cursor_raises_without_problems(tmp_path):
+    path = write_cursor(tmp_path, "SPRINT-A", OUT_OF_ORDER)
+
+    with pytest.raises(ValueError, match="C-2"):
+        list(stream_cursor_file(path))
+
+
+def test_out_of_order_cursor_is_skipped_and_reported(tmp_path):
+    paths = [write_cursor(tmp_path, "SPRINT-A", OUT_OF_ORDER), write_cursor(tmp_path, "SPRINT-B", IN_ORDER)]
+    problems = []
+
+    replay = CursorReplay()
+    replay.build(merged_events(paths, problems))
+
+    assert [event.cursor_id for event in replay.events] == ["C-1", "D-1", "C-3"]
+    assert len(problems) == 1 and "C-2" in problems[0] and "skipped" in problems[0]
+    assert replay.state_at()["epic"]["EPIC-001"]["progress_pct"] == 40
@@ -0,0 +1,76 @@
+import datetime as dt
+import gzip
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+from dashboard_history import HistoryStore, RetentionPolicy, trends  # noqa: E402
+
+DAY = dt.datetime(2025, 11, 1, tzinfo=dt.timezone.utc)
+
+
+def report(commits, conflicts=0):
+    return {
+        "worktrees": {"main": {"last_commit": "abc123 msg", "commits_today": str(commits), "ahead_behind": "1 2"}},
+        "conflict_matrix": {"hunk_mode": False, "pairs": [{"worktrees": ["main", "a"], "files": ["x"] * conflicts}]},
+    }
+
+
+def at(days, minutes=0):
+    return DAY + dt.timedelta(days=days, minutes=minutes)
+
+
+@pytest.fixture
+def store(tmp_path):
+    return HistoryStore(tmp_path / "history", RetentionPolicy(raw_days=2, keep_days=5, downsample_minutes=60))
+
+
+def names(store):
+    return sorted(path.name for path in store.root.iterdir())
+
+
+def test_first_snapshot_of_a_day_seals_the_previous_day(store):
+    store.append(report(1), at(0, 10))
+    store.append(report(2), at(0, 20))
+    assert names(store) == ["2025-11-01.ndjson"]
+
+    store.append(report(3), at(1, 5))
+
+    assert names(store) == ["2025-11-01.ndjson.gz", "2025-11-02.ndjson"]
+    with gzip.open(store.root / "2025-11-01.ndjson.gz", "rt") as sealed:
+        assert [json.loads(line)["worktrees"]["main"]["commits_24h"] for line in sealed] == [1, 2]
+    assert [record["worktrees"]["main"]["commits_24h"] for record in store.read_range()] == [1, 2, 3]
+
+
+def test_retention_downsamples_then_deletes(store):
+    for minutes in (0, 20, 50, 70):  # two hourly buckets on day 0
+        store.append(report(minutes, conflicts=1), at(0, minutes))
+    store.append(report(1), at(1))
+
+    assert store.maintain(at(3).date()) == {"sealed": 1, "downsampled": 1, "deleted": 0}
+    assert names(store) == ["2025-11-01.60m.ndjson.gz", "2025-11-02.ndjson.gz"]
+    kept = list(store.read_range(at(0), at(0, 119)))
+    assert [(record["ts"], record["samples"]) for record in kept] == [
+        ("2025-11-01T00:50:00Z", 3),
+        ("2025-11-01T01:10:00Z", 1),
+    ]
+
+    assert store.maintain(at(3).date()) == {"sealed": 0, "downsampled": 0, "deleted": 0}
+    assert store.maintain(at(6).date()) == {"sealed": 0, "downsampled": 1, "deleted": 1}
+    assert names(store) == ["2025-11-02.60m.ndjson.gz"]
+
+
+def test_read_range_and_trends_stream_only_the_requested_days(store):
+    for day in range(3):
+        for hour in (9, 15):
+            store.append(report(day * 10 + hour, conflicts=day), at(day, hour * 60))
+
+    records = list(store.read_range(at(1, 12 * 60), at(2, 10 * 60)))
+    assert [record["ts"] for record in records] == ["2025-11-02T15:00:00Z", "2025-11-03T09:00:00Z"]
+
+    daily = trends(store.read_range(), 86400)
+    assert [round(bucket["main"]["commits_24h"]) for _, bucket in sorted(daily.items())] == [12, 22, 32]
+    assert [bucket["main"]["conflicts_max"] for _, bucket in sorted(daily.items())] == [0, 1, 2]
@@ -0,0 +1,66 @@
+import sys
+from pathlib import Path
+
+import pytest
+import yaml
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "VaultGuide" / "scripts" / "sync"))
+from frontmatter import parse_front_matter_text, read_front_matter, read_front_matter_lazy  # noqa: E402
+
+
+def split_whole_file(path):
+    """The reader the sync scripts used before the header-only fast path."""
+    text = path.read_text()
+    lines = text.splitlines()
+    if not lines or lines[0].strip() != "---":
+        return {}, text
+    end = next(idx for idx, line in enumerate(lines[1:], start=1) if line.strip() == "---")
+    return yaml.safe_load("\n".join(lines[1:end])) or {}, "\n".join(lines[end + 1 :]).lstrip("\n")
+
+
+DOCUMENTS = {
+    "plain": "---\nid: EPIC-001\ntags: [a, b]\n---\n\n# Title\n\nBody text.\n",
+    "crlf": "---\r\nid: EPIC-002\r\nstatus: planned\r\n---\r\n# Title\r\nline\r\n",
+    "rule in body": "---\nid: EPIC-003\n---\nabove\n---\nbelow\n",
+    "empty body": "---\nid: EPIC-004\n---\n",
+    "empty header": "---\n---\nbody\n",
+    "no front matter": "# Just markdown\n\ntext\n",
+    "empty file": "",
+    "unicode": "---\ntitle: Überblick — ✓\n---\nnaïve body ✓\n",
+}
+
+
+@pytest.mark.parametrize("name", sorted(DOCUMENTS))
+def test_lazy_reader_matches_whole_file_split(tmp_path, name):
+    path = tmp_path / "README.md"
+    path.write_bytes(DOCUMENTS[name].encode("utf-8"))
+
+    metadata, body = read_front_matter_lazy(path)
+    expected = split_whole_file(path)
+    assert read_front_matter(path) == expected
+    assert metadata == expected[0]
+    assert parse_front_matter_text(path.read_text(), path) == expected[0]
+    if body.offset:
+        assert body.text == expected[1]
+
+
+def test_body_is_read_only_on_first_use(tmp_path):
+    path = tmp_path / "README.md"
+    path.write_text("---\nid: EPIC-001\n---\noriginal\n")
+
+    _, body = read_front_matter_lazy(path)
+    assert body._text is None
+    path.write_text("---\nid: EPIC-001\n---\nedited\n")  # same header length
+    assert str(body) == "edited"
+    path.write_text("---\nid: EPIC-001\n---\nagain\n")
+    assert body.text == "edited"
+
+
+def test_unclosed_front_matter_raises(tmp_path):
+    path = tmp_path / "README.md"
+    path.write_text("---\nid: EPIC-001\nbody without closing delimiter\n")
+
+    with pytest.raises(ValueError, match="not closed"):
+        read_front_matter_lazy(path)
+    with pytest.raises(ValueError, match="not closed"):
+        parse_front_matter_text(path.read_text(), path)
@@ -0,0 +1,110 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "VaultGuide" / "scripts" / "sync"))
+from frontmatter_index import FrontMatterIndex, load_many  # noqa: E402
+
+
+@pytest.fixture
+def index(tmp_path):
+    with FrontMatterIndex(tmp_path / "cache") as index:
+        yield index
+
+
+def write(path, status, mtime_ns=None):
+    path.write_text(f"---\nid: EPIC-001\nstatus: {status}\n---\nbody\n")
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_unchanged_file_is_parsed_once(tmp_path, index):
+    doc = tmp_path / "README.md"
+    write(doc, "planned")
+
+    assert index.get(doc)["status"] == "planned"
+    assert index.get(doc)["status"] == "planned"
+    assert (index.hits, index.misses) == (1, 1)
+
+
+def test_edit_with_same_size_is_reparsed(tmp_path, index):
+    doc = tmp_path / "README.md"
+    write(doc, "planned", mtime_ns=1_000_000_000)
+    index.get(doc)
+    write(doc, "blocked", mtime_ns=2_000_000_000)  # same length as "planned"
+
+    assert index.get(doc)["status"] == "blocked"
+    assert index.misses == 2
+
+
+def test_size_change_is_reparsed_even_with_same_mtime(tmp_path, index):
+    doc = tmp_path / "README.md"
+    write(doc, "planned", mtime_ns=1_000_000_000)
+    index.get(doc)
+    write(doc, "completed", mtime_ns=1_000_000_000)
+
+    assert index.get(doc)["status"] == "completed"
+    assert index.misses == 2
+
+
+def test_touched_file_is_a_hit_and_refreshes_its_fingerprint(tmp_path, index):
+    doc = tmp_path / "README.md"
+    write(doc, "planned", mtime_ns=1_000_000_000)
+    index.get(doc)
+    os.utime(doc, ns=(3_000_000_000, 3_000_000_000))
+
+    assert index.lookup(doc)["status"] == "planned"
+    row = index.conn.execute("SELECT mtime_ns FROM entries").fetchone()
+    assert row[0] == 3_000_000_000
+    assert index.misses == 1
+
+
+def test_entries_survive_reopening(tmp_path):
+    doc = tmp_path / "README.md"
+    write(doc, "planned")
+    with FrontMatterIndex(tmp_path / "cache") as index:
+        index.get(doc)
+    with FrontMatterIndex(tmp_path / "cache") as index:
+        assert index.lookup(doc)["status"] == "planned"
+
+
+def test_prune_drops_deleted_files_only(tmp_path, index):
+    kept, deleted = tmp_path / "a.md", tmp_path / "b.md"
+    write(kept, "planned")
+    write(deleted, "planned")
+    index.get(kept)
+    index.get(deleted)
+    deleted.unlink()
+
+    assert index.prune() == 1
+    assert index.lookup(kept) is not None
+    assert index.conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0] == 1
+
+
+def test_load_many_keeps_order_across_hits_and_pooled_misses(tmp_path, index):
+    docs = []
+    for number in range(12):
+        doc = tmp_path / f"EPIC-{number:03d}.md"
+        doc.write_text(f"---\nid: EPIC-{number:03d}\n---\n")
+        docs.append(doc)
+    for doc in docs[::3]:
+        index.get(doc)  # every third file is already cached
+
+    results = load_many(docs, jobs=2, index=index)
+
+    assert [metadata["id"] for metadata in results] == [doc.stem for doc in docs]
+    assert (index.hits, index.misses) == (4, 12)
+    assert load_many(docs, jobs=2, index=index) == results
+    assert index.misses == 12
+
+
+def test_load_many_without_index_matches_serial(tmp_path):
+    docs = []
+    for number in range(5):
+        doc = tmp_path / f"{number}.md"
+        doc.write_text(f"---\nseq: {number}\n---\n" if number != 2 else "no front matter\n")
+        docs.append(doc)
+
+    assert load_many(docs, jobs=3) == load_many(docs, jobs=1) == [{"seq": 0}, {"seq": 1}, {}, {"seq": 3}, {"seq": 4}]
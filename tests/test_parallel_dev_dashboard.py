@@ -0,0 +1,206 @@
+import asyncio
+import contextlib
+import io
+import json
+import subprocess
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+import parallel_dev_dashboard as dashboard  # noqa: E402
+
+
+class FakeINotify:
+    def __init__(self):
+        self.watches = []
+
+    def add_watch(self, path, mask):
+        self.watches.append(path)
+
+    def read(self, timeout=None):
+        return []
+
+
+@pytest.fixture
+def fake_inotify(monkeypatch):
+    module = types.ModuleType("inotify_simple")
+    module.INotify = FakeINotify
+    module.flags = types.SimpleNamespace(CLOSE_WRITE=8, MOVED_TO=128, CREATE=256, DELETE=512)
+    monkeypatch.setitem(sys.modules, "inotify_simple", module)
+    return module
+
+
+def git(repo, *args):
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+
+@pytest.fixture
+def repo(tmp_path):
+    git(tmp_path, "init", "-q", "-b", "main")
+    git(tmp_path, "-c", "user.name=t", "-c", "user.email=t@t", "commit", "-q", "--allow-empty", "-m", "init")
+    git(tmp_path, "branch", "feature/nested/x")
+    git(tmp_path, "update-ref", "refs/remotes/origin/main", "HEAD")
+    return tmp_path
+
+
+def test_watcher_watches_every_ref_directory(fake_inotify, repo):
+    watcher = dashboard.GitChangeWatcher({"main": repo})
+
+    refs = (repo / ".git" / "refs").resolve()
+    watched = {Path(path) for path in watcher.inotify.watches}
+    assert {
+        refs,
+        refs / "heads",
+        refs / "heads" / "feature",
+        refs / "heads" / "feature" / "nested",
+        refs / "remotes",
+        refs / "remotes" / "origin",
+    } <= watched
+    assert watcher.wait(0.01) == set()
+
+
+def test_watcher_reports_new_commit(fake_inotify, repo):
+    watcher = dashboard.GitChangeWatcher({"main": repo})
+    git(repo, "-c", "user.name=t", "-c", "user.email=t@t", "commit", "-q", "--allow-empty", "-m", "next")
+
+    assert watcher.changed() == {"main"}
+
+
+def test_branch_ab_used_only_when_tracking_origin_main():
+    status = "# branch.head feature/x\n# branch.upstream origin/main\n# branch.ab +3 -1\n1 .M N... a"
+    assert dashboard.tracked_ahead_behind(status) == "1\t3"
+    assert dashboard.tracked_ahead_behind(status.replace("origin/main", "origin/feature/x")) is None
+    assert dashboard.tracked_ahead_behind("# branch.head feature/x") is None
+
+
+def test_branch_status_from_recent_log(repo):
+    for message in ("one", "two"):
+        git(repo, "-c", "user.name=t", "-c", "user.email=t@t", "commit", "-q", "--allow-empty", "-m", message)
+    board = dashboard.ParallelDevDashboard(worktrees={"main": repo})
+    status = board.get_branch_status(repo)
+    assert status["commits_today"] == "3"
+    assert status["last_commit"].endswith(" two")
+    assert status["author"] == "t"
+    assert board.git_calls == 3  # status, log, rev-list: no upstream to read branch.ab from
+
+
+def test_export_keeps_schema_1_keys(tmp_path, monkeypatch):
+    board = dashboard.ParallelDevDashboard(worktrees={"EPIC-005": tmp_path / "a", "other": tmp_path / "b"})
+    report = {"schema_version": dashboard.REPORT_SCHEMA_VERSION, "worktrees": {"EPIC-005": {"x": 1}, "other": {}},
+              "activity": {"EPIC-005": [{"hash": "abc"}], "other": []}}
+    monkeypatch.setattr(board, "generate_status_report", lambda: report)
+    out = tmp_path / "report.json"
+    with contextlib.redirect_stdout(io.StringIO()):
+        board.export_json_report(str(out))
+    exported = json.loads(out.read_text())
+    assert exported["schema_version"] == 2
+    assert exported["epic005"] == {"x": 1}
+    assert exported["epic005_activity"] == [{"hash": "abc"}]
+    assert "unified_strategy" not in exported
+
+
+def commit_file(repo, name, text, message):
+    (repo / name).write_text(text)
+    git(repo, "add", name)
+    git(repo, "-c", "user.name=t", "-c", "user.email=t@t", "commit", "-q", "-m", message)
+
+
+@pytest.fixture
+def worktrees(tmp_path):
+    main = tmp_path / "main"
+    main.mkdir()
+    git(main, "init", "-q", "-b", "main")
+    commit_file(main, "shared.txt", "".join(f"line {n}\n" for n in range(1, 21)), "init")
+    trees = {}
+    for name in ("a", "b", "c"):
+        git(main, "worktree", "add", "-q", "-b", f"feature/{name}", str(tmp_path / name))
+        trees[name] = tmp_path / name
+    commit_file(trees["a"], "shared.txt", "changed by a\n" + "".join(f"line {n}\n" for n in range(2, 21)), "a")
+    commit_file(trees["b"], "shared.txt", "".join(f"line {n}\n" for n in range(1, 20)) + "changed by b\n", "b")
+    commit_file(trees["c"], "other.txt", "c\n", "c")
+    return main, trees
+
+
+def test_refresh_rediffs_only_the_changed_worktree(worktrees, monkeypatch):
+    main, trees = worktrees
+    monkeypatch.chdir(main)
+    board = dashboard.ParallelDevDashboard(worktrees=trees)
+    report = asyncio.run(board.generate_status_report_async())
+    assert report["conflicts"] == ["shared.txt"]
+
+    commit_file(trees["c"], "shared.txt", "changed by c\n", "c again")
+    diffed = []
+    real_diff = board.worktree_diff_async
+
+    async def recording_diff(git, repo_path):
+        diffed.append(repo_path.name)
+        return await real_diff(git, repo_path)
+
+    monkeypatch.setattr(board, "worktree_diff_async", recording_diff)
+    refreshed = asyncio.run(board.refresh_report_async(report, {"c"}))
+
+    assert diffed == ["c"]
+    full = asyncio.run(dashboard.ParallelDevDashboard(worktrees=trees).conflict_matrix_async(
+        dashboard.AsyncGitRunner()))
+    assert refreshed["conflict_matrix"] == full
+    assert [row["worktrees"] for row in full["pairs"]] == [["a", "b"], ["a", "c"], ["b", "c"]]
+
+
+def test_redraw_clips_lines_to_the_terminal_width(capsys):
+    lines = ["x" * 30, "🚀 " + "y" * 30, "short"]
+    drawn = dashboard.ParallelDevDashboard._redraw([], lines, 21)
+    capsys.readouterr()
+
+    assert drawn == ["x" * 20, "🚀 " + "y" * 17, "short"]
+    assert dashboard.clip_to_width("⚠️  warn", 4) == "⚠️  "
+    assert dashboard.ParallelDevDashboard._redraw(drawn, lines[:2] + ["changed"], 21) == drawn[:2] + ["changed"]
+    assert capsys.readouterr().out.count("\033[K") == 1
+
+
+def test_parse_hunks_ignores_header_like_content_lines(tmp_path):
+    git(tmp_path, "init", "-q", "-b", "main")
+    commit_file(tmp_path, "schema.sql", "-- drop me\nselect 1;\n", "init")
+    commit_file(tmp_path, "my notes.md", "a\nb\n", "spaces")
+    (tmp_path / "schema.sql").write_text("select 1;\n++ added\n")
+    (tmp_path / "my notes.md").write_text("a\nchanged\n")
+    (tmp_path / "logo.png").write_bytes(b"\x00\x01binary")
+    git(tmp_path, "add", "-N", "logo.png")
+    diff = subprocess.run(
+        ["git", "diff", "--no-prefix", "-U0", "--no-color", "HEAD"], cwd=tmp_path, capture_output=True, text=True
+    ).stdout
+    assert "\n--- drop me" in diff and "\n+++ added" in diff
+
+    assert dashboard.parse_hunks(diff) == {"logo.png": [], "my notes.md": [(2, 2)], "schema.sql": [(1, 1), (2, 2)]}
+
+
+def test_hunks_compared_only_between_worktrees_with_the_same_merge_base():
+    changed = {"a": {"f.py"}, "b": {"f.py"}, "c": {"f.py"}}
+    hunks = {"a": {"f.py": [(1, 2)]}, "b": {"f.py": [(10, 12)]}, "c": {"f.py": [(40, 41)]}}
+    bases = {"a": "base1", "b": "base1", "c": "base2"}
+
+    matrix = dashboard.build_conflict_matrix(changed, hunks, bases)
+    rows = {tuple(row["worktrees"]): row for row in matrix["pairs"]}
+    assert rows[("a", "b")]["hunk_conflicts"] == [] and "file_level" not in rows[("a", "b")]
+    assert rows[("a", "c")]["hunk_conflicts"] == ["f.py"] and rows[("a", "c")]["file_level"]
+    assert dashboard.update_conflict_matrix(matrix, changed, {"c"}, hunks, bases) == matrix
+
+
+def test_hunk_mode_falls_back_to_files_when_main_moved_between_worktrees(worktrees, monkeypatch):
+    main, trees = worktrees
+    # d branches after main inserted ten lines at the top, so its line numbers are shifted against a's.
+    commit_file(main, "shared.txt", "".join(f"top {n}\n" for n in range(10)) + (main / "shared.txt").read_text(), "m")
+    git(main, "worktree", "add", "-q", "-b", "feature/d", str(main.parent / "d"))
+    d = main.parent / "d"
+    lines = (d / "shared.txt").read_text().split("\n")
+    lines[10] = "changed by d"  # "line 1", the same line a changed
+    commit_file(d, "shared.txt", "\n".join(lines), "d")
+    monkeypatch.chdir(main)
+
+    board = dashboard.ParallelDevDashboard(worktrees={"a": trees["a"], "d": d}, hunk_mode=True)
+    matrix = asyncio.run(board.conflict_matrix_async(dashboard.AsyncGitRunner()))
+    assert matrix["pairs"] == [
+        {"worktrees": ["a", "d"], "files": ["shared.txt"], "hunk_conflicts": ["shared.txt"], "file_level": True}
+    ]
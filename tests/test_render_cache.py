@@ -0,0 +1,55 @@
+import datetime as dt
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "VaultGuide" / "scripts" / "sync"))
+from render_cache import RenderCache, lines_digest, semantic_digest  # noqa: E402
+
+
+def test_semantic_digest_ignores_key_order_and_volatile_keys():
+    base = {"id": "EPIC-001", "status": "planned", "updated_at": "2025-11-01T00:00:00Z", "tags": ["a", "b"]}
+    reordered = {"tags": ["a", "b"], "updated_at": "2025-11-20T09:00:00Z", "status": "planned", "id": "EPIC-001"}
+
+    assert semantic_digest(base, ["updated_at"]) == semantic_digest(reordered, ["updated_at"])
+    assert semantic_digest(base) != semantic_digest(reordered)
+
+
+def test_semantic_digest_sees_real_changes():
+    base = {"id": "EPIC-001", "progress_pct": 1, "meta": {"updated_at": 1}, "tags": ["a", "b"]}
+    variants = [
+        {**base, "progress_pct": "1"},
+        {**base, "progress_pct": True},
+        {**base, "tags": ["b", "a"]},
+        {**base, "meta": {"updated_at": 2}},  # only top-level keys are ignored
+    ]
+
+    digests = {semantic_digest(value, ["updated_at"]) for value in [base, *variants]}
+    assert len(digests) == len(variants) + 1
+
+
+def test_semantic_digest_handles_yaml_values():
+    value = {"created_at": dt.date(2025, 11, 4), "ids": {"B", "A"}}
+    assert semantic_digest(value) == semantic_digest({"created_at": "2025-11-04", "ids": ["A", "B"]})
+
+
+def test_lines_digest_is_streaming_and_line_sensitive():
+    assert lines_digest(iter(["a", "b"])) == lines_digest(["a", "b"])
+    assert lines_digest(["a", "b"]) != lines_digest(["ab"])
+
+
+def test_lookup_only_vouches_for_untouched_files(tmp_path):
+    output = tmp_path / "ROADMAP.md"
+    output.write_text("table\n")
+    with RenderCache(tmp_path / "cache") as cache:
+        assert cache.lookup(output) is None
+        cache.record(output, "digest-1")
+        assert cache.lookup(output) == "digest-1"
+
+    with RenderCache(tmp_path / "cache") as cache:
+        assert cache.lookup(output) == "digest-1"
+        stat = output.stat()
+        os.utime(output, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        assert cache.lookup(output) is None
+        output.unlink()
+        assert cache.lookup(output) is None
@@ -0,0 +1,88 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "VaultGuide" / "scripts" / "sync"))
+import roadmap_sync  # noqa: E402
+from roadmap_render import read_block  # noqa: E402
+
+
+def git(repo, *args):
+    subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args], cwd=repo, check=True, capture_output=True
+    )
+
+
+def write_epic(vault, directory, epic_id, status="planned"):
+    readme = vault / "EPICS" / directory / "README.md"
+    readme.parent.mkdir(parents=True, exist_ok=True)
+    readme.write_text(f"---\nid: {epic_id}\ntitle: {directory}\nstatus: {status}\n---\n\n# {directory}\n")
+
+
+@pytest.fixture
+def vault(tmp_path):
+    write_epic(tmp_path, "EPIC-001-alpha", "EPIC-001")
+    write_epic(tmp_path, "EPIC-002-beta", "EPIC-002")
+    (tmp_path / "ROADMAP.md").write_text("# Roadmap\n")
+    git(tmp_path, "init", "-q")
+    git(tmp_path, "add", ".")
+    git(tmp_path, "commit", "-q", "-m", "init")
+    return tmp_path
+
+
+def sync(vault, incremental=True):
+    roadmap = vault / "ROADMAP.md"
+    state = vault / ".vault-cache" / roadmap_sync.STATE_FILENAME
+    roadmap_sync.sync_roadmap(vault, roadmap, None, state, incremental=incremental)
+    return read_block(roadmap, roadmap_sync.SUMMARY_BLOCK).split("\n", 2)[2]
+
+
+def full_table(vault):
+    return "\n".join(roadmap_sync.table_lines(roadmap_sync.collect_epic_metadata(vault / "EPICS")))
+
+
+def test_incremental_rebuilds_after_roadmap_edited_outside_sync(vault):
+    sync(vault)
+    roadmap = vault / "ROADMAP.md"
+    roadmap.write_text(roadmap.read_text().replace("| EPIC-002 |", "| EPIC-008 |"))
+
+    assert sync(vault) == full_table(vault)
+
+
+def test_incremental_drops_row_of_renamed_epic_directory(vault):
+    sync(vault)
+    git(vault, "mv", "EPICS/EPIC-002-beta", "EPICS/EPIC-002-renamed")
+    git(vault, "commit", "-qm", "rename")
+
+    table = sync(vault)
+    assert table == full_table(vault)
+    assert table.count("| EPIC-002 |") == 1
+
+
+def test_incremental_keeps_rows_with_duplicate_ids(vault):
+    write_epic(vault, "EPIC-002-copy", "EPIC-002")
+    sync(vault, incremental=False)
+    write_epic(vault, "EPIC-001-alpha", "EPIC-001", status="completed")
+
+    table = sync(vault)
+    assert table == full_table(vault)
+    assert table.count("| EPIC-002 |") == 2
+
+
+def test_unchanged_table_keeps_the_file_and_its_timestamp(vault):
+    roadmap = vault / "ROADMAP.md"
+    state = vault / ".vault-cache" / roadmap_sync.STATE_FILENAME
+    assert roadmap_sync.sync_roadmap(vault, roadmap, None, state) is True
+    written = (roadmap.read_text(), roadmap.stat().st_mtime_ns)
+
+    assert roadmap_sync.sync_roadmap(vault, roadmap, None, state) is False
+    assert (roadmap.read_text(), roadmap.stat().st_mtime_ns) == written
+
+    roadmap.write_text(written[0] + "\nNotes added by hand.\n")  # outside the block
+    assert roadmap_sync.sync_roadmap(vault, roadmap, None, state) is False
+    assert roadmap.read_text().endswith("Notes added by hand.\n")
+
+    write_epic(vault, "EPIC-001-alpha", "EPIC-001", status="completed")
+    assert roadmap_sync.sync_roadmap(vault, roadmap, None, state) is True
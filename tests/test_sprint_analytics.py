@@ -0,0 +1,60 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("numpy")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "VaultGuide" / "scripts" / "sync"))
+from sprint_analytics import COMBINED_FILENAME, load_columns, summary_digest  # noqa: E402
+
+SUMMARY = """\
+sprint_id: {sprint}
+ended_at: 2025-11-04T18:00:00Z
+planned_items:
+  - linked_epic: EPIC-001
+    type: story
+    status: {status}
+    estimated_hours: 4
+    actual_hours: 5
+"""
+
+
+def write_summary(root, sprint, status="completed"):
+    path = root / "Sprints" / sprint / "execution_summary.yaml"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(SUMMARY.format(sprint=sprint, status=status))
+    return path
+
+
+def test_edited_and_removed_summaries_leave_no_cached_columns(tmp_path):
+    cache_dir = tmp_path / "cache"
+    first, second = write_summary(tmp_path, "SPRINT-1"), write_summary(tmp_path, "SPRINT-2")
+    load_columns([first, second], cache_dir)
+
+    write_summary(tmp_path, "SPRINT-1", status="in_progress")
+    columns = load_columns([first], cache_dir)
+
+    assert list(columns["status"]) == ["in_progress"]
+    cached = sorted(path.name for path in cache_dir.glob("*.npz"))
+    assert cached == sorted([COMBINED_FILENAME, f"{summary_digest(first)}.npz"])
+
+
+@pytest.mark.parametrize("cached", [False, True])
+def test_malformed_summaries_are_skipped_and_reported(tmp_path, cached):
+    cache_dir = tmp_path / "cache" if cached else None
+    good = write_summary(tmp_path, "SPRINT-1")
+    listed = write_summary(tmp_path, "SPRINT-2")
+    listed.write_text("- not\n- a mapping\n")
+    broken = write_summary(tmp_path, "SPRINT-3")
+    broken.write_text("sprint_id: [unclosed\n")
+    paths = [good, listed, broken]
+
+    for _ in range(2):  # the second run reads the cached concatenation
+        problems = []
+        columns = load_columns(paths, cache_dir, problems)
+        assert list(columns["sprint_id"]) == ["SPRINT-1"]
+        assert [problem.split(":")[0] for problem in problems] == [str(listed), str(broken)]
+        assert "mapping" in problems[0]
+
+    with pytest.raises(ValueError, match="mapping"):
+        load_columns([listed], None)
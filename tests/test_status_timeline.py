@@ -0,0 +1,90 @@
+import argparse
+import datetime as dt
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "VaultGuide" / "scripts" / "sync"))
+from status_timeline import open_timeline  # noqa: E402
+from timeutil import format_ts, parse_when, to_utc  # noqa: E402
+
+EPIC = "Product/EPICS/EPIC-001-alpha/README.md"
+
+
+def git(repo, *args):
+    command = ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args]
+    result = subprocess.run(command, cwd=repo, check=True, capture_output=True, text=True)
+    return result.stdout.strip()
+
+
+def commit(repo, status, progress, message):
+    path = repo / EPIC
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(f"---\nid: EPIC-001\nstatus: {status}\nprogress_pct: {progress}\n---\n")
+    git(repo, "add", "-A")
+    git(repo, "commit", "-q", "-m", message)
+    return git(repo, "rev-parse", "HEAD")
+
+
+@pytest.fixture
+def repo(tmp_path):
+    git(tmp_path, "init", "-q", "-b", "main")
+    commit(tmp_path, "planned", 0, "plan")
+    return tmp_path
+
+
+def transitions(timeline):
+    return [(event.field, event.old, event.new) for event in timeline.events("EPIC-001")]
+
+
+def test_later_runs_read_only_new_commits(repo, tmp_path):
+    vault = repo / "Product"
+    with open_timeline(vault, tmp_path / "cache") as timeline:
+        assert timeline.update(vault) == (1, 2)
+        head = commit(repo, "in_progress", 40, "start")
+        assert timeline.update(vault) == (1, 2)
+        assert timeline.update(vault) == (0, 0)
+        assert timeline.last_commit == head
+        assert transitions(timeline) == [
+            ("status", None, "planned"),
+            ("progress_pct", None, 0),
+            ("status", "planned", "in_progress"),
+            ("progress_pct", 0, 40),
+        ]
+
+
+def test_rewritten_history_rebuilds_the_timeline(repo, tmp_path):
+    vault = repo / "Product"
+    commit(repo, "in_progress", 40, "start")
+    with open_timeline(vault, tmp_path / "cache") as timeline:
+        timeline.update(vault)
+        stale = timeline.last_commit
+
+        git(repo, "reset", "-q", "--hard", "HEAD~1")
+        commit(repo, "blocked", 10, "start, rewritten")
+        commits, _ = timeline.update(vault)
+
+        assert commits == 2  # the whole branch, not just the commits after the dropped one
+        assert any("no longer an ancestor" in problem and stale[:12] in problem for problem in timeline.problems)
+        assert transitions(timeline) == [
+            ("status", None, "planned"),
+            ("progress_pct", None, 0),
+            ("status", "planned", "blocked"),
+            ("progress_pct", 0, 10),
+        ]
+        assert timeline.stats() == (4, 1)
+
+
+def test_time_helpers_normalise_to_utc():
+    assert format_ts(to_utc("2025-11-04T10:00:00+02:00")) == "2025-11-04T08:00:00Z"
+    assert to_utc(dt.date(2025, 11, 4)) == dt.datetime(2025, 11, 4, tzinfo=dt.timezone.utc)
+    assert to_utc("not a date") is None and to_utc(42) is None
+
+    parser = argparse.ArgumentParser()
+    assert format_ts(parse_when(parser, "2025-11-04", True)) == "2025-11-04T23:59:59Z"
+    assert format_ts(parse_when(parser, "2025-11-04T09:00Z", True)) == "2025-11-04T09:00:00Z"
+    assert parse_when(parser, None, False) is None
+    with pytest.raises(SystemExit):
+        parse_when(parser, "yesterday", False)
@@ -0,0 +1,158 @@
+import contextlib
+import io
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "VaultGuide" / "scripts" / "sync"))
+import batch_writer  # noqa: E402
+import update_epic_status  # noqa: E402
+from batch_writer import BatchValidationError  # noqa: E402
+from frontmatter import read_front_matter  # noqa: E402
+from frontmatter_index import FrontMatterIndex  # noqa: E402
+
+EPIC = "EPICS/EPIC-001-alpha/README.md"
+FEATURE = "EPICS/EPIC-001-alpha/FEATURE-001-one/README.md"
+
+
+def write_doc(vault, rel, doc_id):
+    path = vault / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(f"---\nid: {doc_id}\ntitle: {doc_id}\nstatus: planned\nprogress_pct: 0\n---\n\n# {doc_id}\n")
+    return path
+
+
+@pytest.fixture
+def vault(tmp_path):
+    write_doc(tmp_path, EPIC, "EPIC-001")
+    write_doc(tmp_path, FEATURE, "FEATURE-001")
+    return tmp_path
+
+
+def write_summary(vault, sprint_id, epic_update, feature_update=None, ended_at=None):
+    lines = [f"sprint_id: {sprint_id}"]
+    if ended_at:
+        lines.append(f"ended_at: {ended_at}")
+    lines += ["epic_updates:", "  - id: EPIC-001", f"    path: {EPIC}"]
+    lines += [f"    {key}: {value}" for key, value in epic_update.items()]
+    if feature_update is not None:
+        lines += ["    features:", "      - id: FEATURE-001", f"        path: {feature_update.pop('path', FEATURE)}"]
+        lines += [f"        {key}: {value}" for key, value in feature_update.items()]
+    path = vault / "Sprints" / sprint_id / "execution_summary.yaml"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("\n".join(lines) + "\n")
+    return path
+
+
+def run(func, *args):
+    with contextlib.redirect_stdout(io.StringIO()) as out:
+        func(*args)
+    return out.getvalue()
+
+
+def test_summary_updates_every_level_and_writes_through_to_the_index(vault, tmp_path):
+    summary = write_summary(
+        vault, "SPRINT-1", {"status": "in_progress", "progress_pct": 40}, {"status": "completed", "progress_pct": 100}
+    )
+    with FrontMatterIndex(tmp_path / "cache") as index:
+        run(update_epic_status.process_summary, vault, summary, index)
+        cached = index.lookup(vault / EPIC)
+
+    epic, body = read_front_matter(vault / EPIC)
+    assert (epic["status"], epic["progress_pct"], epic["linked_sprints"]) == ("in_progress", 40, ["SPRINT-1"])
+    assert body == "# EPIC-001"
+    assert read_front_matter(vault / FEATURE)[0]["status"] == "completed"
+    assert cached == epic
+
+
+def test_invalid_update_aborts_before_any_file_is_written(vault):
+    before = {rel: (vault / rel).read_text() for rel in (EPIC, FEATURE)}
+    summary = write_summary(
+        vault, "SPRINT-1", {"status": "in_progress"}, {"path": "EPICS/EPIC-001-alpha/FEATURE-404/README.md"}
+    )
+
+    with pytest.raises(BatchValidationError) as info:
+        run(update_epic_status.process_summary, vault, summary)
+
+    assert any("FEATURE-404" in error and "not found" in error for error in info.value.errors)
+    assert {rel: (vault / rel).read_text() for rel in before} == before
+    assert not list(vault.rglob("*.tmp"))
+
+
+def test_reapplying_a_summary_changes_nothing(vault):
+    summary = write_summary(vault, "SPRINT-1", {"status": "in_progress", "progress_pct": 40})
+    run(update_epic_status.process_summary, vault, summary)
+    after = (vault / EPIC).read_text()
+
+    out = run(update_epic_status.process_summary, vault, summary)
+    assert (vault / EPIC).read_text() == after
+    assert "Updated" not in out
+
+
+def test_value_rejected_by_schema_aborts_the_batch(vault):
+    before = (vault / EPIC).read_text()
+    summary = write_summary(vault, "SPRINT-1", {"status": "in_progress"}, {"progress_pct": 140})
+
+    with pytest.raises(BatchValidationError, match="progress_pct"):
+        run(update_epic_status.process_summary, vault, summary)
+    assert (vault / EPIC).read_text() == before
+
+
+@pytest.fixture
+def sprints(vault):
+    # Listed out of order: SPRINT-2 ended last, SPRINT-3 is still open.
+    return [
+        write_summary(vault, "SPRINT-2", {"status": "in_progress", "progress_pct": 60,
+                                          "change_log_entry": '"sprint 2"'}, ended_at="2025-11-20T10:00:00Z"),
+        write_summary(vault, "SPRINT-3", {"progress_pct": 70, "linked_sprints": "[SPRINT-0]"},
+                      {"status": "in_progress"}),
+        write_summary(vault, "SPRINT-1", {"status": "blocked", "progress_pct": 30,
+                                          "change_log_entry": '"sprint 1"'}, {"progress_pct": 50},
+                      ended_at="2025-11-06T23:59:00Z"),
+    ]
+
+
+def test_summaries_apply_in_ended_at_order_like_consecutive_runs(vault, sprints, monkeypatch, tmp_path):
+    monkeypatch.setattr(update_epic_status, "_now_iso", lambda: "2025-11-21T00:00:00Z")
+    sequential = tmp_path / "sequential"
+    for rel in (EPIC, FEATURE):
+        write_doc(sequential, rel, rel.split("/")[-2].split("-")[0] + "-001")
+    for summary in (sprints[2], sprints[0], sprints[1]):
+        run(update_epic_status.process_summary, sequential, summary)
+
+    run(update_epic_status.process_summaries, vault, sprints)
+
+    epic = read_front_matter(vault / EPIC)[0]
+    assert epic["progress_pct"] == 70 and epic["status"] == "in_progress"
+    assert epic["change_log"] == ["sprint 2", "sprint 1"]
+    assert epic["linked_sprints"] == ["SPRINT-1", "SPRINT-2", "SPRINT-3", "SPRINT-0"]
+    for rel in (EPIC, FEATURE):
+        assert (vault / rel).read_text() == (sequential / rel).read_text()
+
+
+def test_summaries_write_each_target_once(vault, sprints, monkeypatch):
+    replaced = []
+    real_replace = batch_writer.os.replace
+    monkeypatch.setattr(batch_writer.os, "replace", lambda src, dst: replaced.append(dst) or real_replace(src, dst))
+
+    out = run(update_epic_status.process_summaries, vault, sprints)
+
+    assert sorted(map(str, replaced)) == sorted(str((vault / rel).resolve()) for rel in (EPIC, FEATURE))
+    assert "Merged 3 summaries into 2 files" in out
+
+
+def test_one_bad_summary_aborts_every_write(vault, sprints):
+    before = {rel: (vault / rel).read_text() for rel in (EPIC, FEATURE)}
+    broken = write_summary(vault, "SPRINT-4", {"status": "in_progress"}, {"path": "EPICS/missing/README.md"})
+    empty = vault / "Sprints" / "SPRINT-5" / "execution_summary.yaml"
+    empty.parent.mkdir()
+    empty.write_text("ended_at: 2025-11-07\n")
+
+    with pytest.raises(BatchValidationError) as info:
+        run(update_epic_status.process_summaries, vault, sprints + [broken, empty])
+
+    assert len(info.value.errors) == 2
+    assert any("SPRINT-4" in error for error in info.value.errors)
+    assert any("no sprint_id" in error for error in info.value.errors)
+    assert {rel: (vault / rel).read_text() for rel in before} == before
@@ -0,0 +1,59 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "VaultGuide" / "scripts" / "sync"))
+import vault  # noqa: E402
+from vault import split_chain  # noqa: E402
+
+
+@pytest.mark.parametrize(
+    "argv, expected",
+    [
+        (["--vault", "P", "check"], (["--vault", "P"], [("check", [])])),
+        (
+            ["--vault", "P", "--timings", "epic-status", "--summary", "s.yaml", "+", "roadmap-sync", "--check"],
+            (["--vault", "P", "--timings"], [("epic-status", ["--summary", "s.yaml"]), ("roadmap-sync", ["--check"])]),
+        ),
+        # Option values that look like command names belong to the option.
+        (["--vault", "check", "check"], (["--vault", "check"], [("check", [])])),
+        (
+            ["--cache-dir", "dashboard", "--vault", "P", "dashboard", "check"],
+            (["--cache-dir", "dashboard", "--vault", "P"], [("dashboard", ["check"])]),
+        ),
+        (["--vault=check", "--no-daemon", "check"], (["--vault=check", "--no-daemon"], [("check", [])])),
+        # Unknown options and stray words are left for main() to reject.
+        (["--vault", "P", "--bogus", "check"], (["--vault", "P", "--bogus"], [("check", [])])),
+        (["--vault", "P", "nonsense", "check"], (["--vault", "P"], [("nonsense", ["check"])])),
+        (["--vault"], (["--vault"], [])),
+    ],
+)
+def test_split_chain_parses_global_options_first(argv, expected):
+    assert split_chain(argv) == expected
+
+
+def test_command_named_vault_directory_runs_the_command(tmp_path, monkeypatch):
+    calls = []
+    monkeypatch.setitem(vault.HANDLERS, "check", lambda session, argv, timings: calls.append((session.vault, argv)) or 0)
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "check").mkdir()
+
+    assert vault.main(["--vault", "check", "--no-cache", "check", "--strict"]) == 0
+    assert calls == [((tmp_path / "check").resolve(), ["--strict"])]
+
+
+def test_chain_stops_at_the_first_failure(tmp_path, monkeypatch):
+    calls = []
+    monkeypatch.setitem(vault.HANDLERS, "check", lambda session, argv, timings: calls.append("check") or 1)
+    monkeypatch.setitem(vault.HANDLERS, "roadmap-sync", lambda session, argv, timings: calls.append("sync") or 0)
+
+    assert vault.main(["--vault", str(tmp_path), "--no-cache", "check", "+", "roadmap-sync"]) == 1
+    assert calls == ["check"]
+
+
+def test_unknown_command_and_abbreviated_options_are_rejected(tmp_path, capsys):
+    assert vault.main(["--vault", str(tmp_path), "frobnicate"]) == 2
+    assert "unknown command 'frobnicate'" in capsys.readouterr().err
+    with pytest.raises(SystemExit):
+        vault.main(["--vault", str(tmp_path), "--no-cach", "check"])
@@ -0,0 +1,118 @@
+import socket
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "VaultGuide" / "scripts" / "sync"))
+import daemon_client  # noqa: E402
+from daemon_client import DaemonError, run_via_daemon, send_request, socket_path  # noqa: E402
+from vault_daemon import VaultDaemon, _Server  # noqa: E402
+
+
+@pytest.fixture
+def vault(tmp_path):
+    epic = tmp_path / "EPICS" / "EPIC-001-alpha" / "README.md"
+    epic.parent.mkdir(parents=True)
+    epic.write_text("---\nid: EPIC-001\nstatus: planned\n---\n")
+    return tmp_path
+
+
+@pytest.fixture
+def daemon(vault):
+    """Run one client call against a real daemon served from this thread, as SQLite requires."""
+    cache_dir = vault / ".vault-cache"
+    cache_dir.mkdir()
+    daemon = VaultDaemon(vault, cache_dir)
+    daemon.scan()
+    server = _Server(str(socket_path(cache_dir)), daemon)
+
+    def call(op, client_vault=vault):
+        result = []
+        thread = threading.Thread(target=lambda: result.append(run_via_daemon(cache_dir, client_vault, op, {})))
+        thread.start()
+        server.handle_request()
+        thread.join()
+        return result[0]
+
+    yield call
+    server.server_close()
+    daemon.close()
+
+
+def listener(cache_dir, reply):
+    """A socket that accepts one connection and calls ``reply`` with it."""
+    cache_dir.mkdir(exist_ok=True)
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.bind(str(socket_path(cache_dir)))
+    sock.listen(1)
+
+    def accept():
+        conn, _ = sock.accept()
+        with conn:
+            conn.recv(65536)
+            reply(conn)
+        sock.close()
+
+    thread = threading.Thread(target=accept)
+    thread.start()
+    return thread
+
+
+def test_request_runs_in_the_daemon_and_relays_its_output(daemon, capsys):
+    assert daemon("status") == 0
+
+    out = capsys.readouterr().out
+    assert "1 requests" in out and "1 files warm" in out
+
+
+def test_daemon_errors_are_relayed_with_a_failing_exit(daemon, capsys):
+    assert daemon("no-such-op") == 1
+
+    assert "unknown op 'no-such-op'" in capsys.readouterr().err
+
+
+def test_daemon_for_another_vault_means_run_in_process(daemon, tmp_path):
+    assert daemon("status", tmp_path / "other") is None
+
+
+def test_missing_or_stale_socket_means_run_in_process(tmp_path):
+    cache_dir = tmp_path / "cache"
+    assert run_via_daemon(cache_dir, tmp_path, "status", {}) is None
+
+    cache_dir.mkdir()
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(str(socket_path(cache_dir)))
+    stale.close()  # the file stays, nothing listens
+    assert run_via_daemon(cache_dir, tmp_path, "status", {}) is None
+
+
+def test_accepted_request_without_a_reply_is_not_rerun(tmp_path, capsys):
+    cache_dir = tmp_path / "cache"
+    thread = listener(cache_dir, lambda conn: None)  # closes without answering
+
+    assert run_via_daemon(cache_dir, tmp_path, "epic-status", {}) == 1
+    thread.join()
+    assert "not re-run in-process" in capsys.readouterr().err
+
+
+def test_request_timeout_is_an_error_not_a_fallback(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(daemon_client, "REQUEST_TIMEOUT", 0.2)
+    released = threading.Event()
+    thread = listener(cache_dir, lambda conn: released.wait(5))
+
+    with pytest.raises(DaemonError, match="no reply"):
+        send_request(socket_path(cache_dir), {"protocol": daemon_client.PROTOCOL_VERSION, "op": "status"})
+    released.set()
+    thread.join()
+
+
+def test_reply_in_another_protocol_is_an_error(tmp_path):
+    cache_dir = tmp_path / "cache"
+    thread = listener(cache_dir, lambda conn: conn.sendall(b'{"protocol": 99}\n'))
+
+    with pytest.raises(DaemonError, match="protocol"):
+        send_request(socket_path(cache_dir), {"op": "status"})
+    thread.join()
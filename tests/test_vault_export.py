@@ -0,0 +1,90 @@
+import math
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "VaultGuide" / "scripts" / "sync"))
+import vault_export  # noqa: E402
+from vault_export import COLUMNS, ColumnarExport, artifact_records, write_export  # noqa: E402
+
+FORMATS = [
+    "csv",
+    pytest.param("npy", marks=pytest.mark.skipif(vault_export.np is None, reason="numpy not installed")),
+    pytest.param("arrow", marks=pytest.mark.skipif(vault_export.pa is None, reason="pyarrow not installed")),
+]
+
+
+def write_doc(vault, rel, front):
+    path = vault / "EPICS" / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(f"---\n{front}\n---\n")
+
+
+@pytest.fixture
+def vault(tmp_path):
+    write_doc(tmp_path, "EPIC-001-alpha/README.md",
+              "id: EPIC-001\ntitle: Alpha, with comma\nartifact_type: Epic\nstatus: In-Progress\n"
+              "progress_pct: '40%'\nlinked_sprints: [SPRINT-1, SPRINT-2]\ncreated_at: 2025-11-01\n"
+              "updated_at: 2025-11-06T23:59:00Z")
+    write_doc(tmp_path, "EPIC-001-alpha/Features/FEATURE-001-one/README.md",
+              "id: FEATURE-001\ntitle: One\nstatus: in progress\nrequirement_coverage: TBD")
+    write_doc(tmp_path, "EPIC-001-alpha/Features/FEATURE-001-one/Stories/STORY-001.md",
+              "id: STORY-001\ntitle: Story\nstatus: completed\nprogress_pct: 100\nlinked_sprints: SPRINT-1")
+    write_doc(tmp_path, "EPIC-001-alpha/notes.md", "id: NOTE\ntitle: not an artifact")
+    return tmp_path
+
+
+def same(a, b):
+    return (isinstance(a, float) and isinstance(b, float) and math.isnan(a) and math.isnan(b)) or a == b
+
+
+def test_records_normalise_front_matter(vault):
+    records = {record["id"]: record for record in artifact_records(vault)}
+
+    assert set(records) == {"EPIC-001", "FEATURE-001", "STORY-001"}
+    epic = records["EPIC-001"]
+    assert (epic["kind"], epic["artifact_type"], epic["status"]) == ("epic", "epic", "in_progress")
+    assert epic["progress_pct"] == 40.0 and epic["linked_sprints"] == 2
+    assert epic["created_at"] == 1761955200 and epic["updated_at"] == 1762473540
+    feature = records["FEATURE-001"]
+    assert feature["status"] == "in_progress" and math.isnan(feature["requirement_coverage"])
+    assert feature["created_at"] == vault_export.MISSING_TS
+    assert records["STORY-001"]["linked_sprints"] == 1
+
+
+@pytest.mark.parametrize("fmt", FORMATS)
+def test_export_round_trips(vault, tmp_path, fmt):
+    records = artifact_records(vault)
+    manifest = write_export(tmp_path / "out", records, fmt, vault)
+    assert manifest["format"] == fmt and manifest["rows"] == 3
+
+    export = ColumnarExport(tmp_path / "out")
+    for name, dtype in COLUMNS:
+        column = export.column(name)
+        values = column.to_pylist() if hasattr(column, "to_pylist") else list(column)
+        if dtype == "enum":
+            assert export.labels(name) == [record[name] for record in records]
+        else:
+            assert all(same(type(expected)(value), expected) for value, expected in zip(values, (r[name] for r in records)))
+    assert export.counts("status") == {"completed": 1, "in_progress": 2}
+    assert export.counts("kind") == {"epic": 1, "feature": 1, "story": 1}
+
+
+@pytest.mark.parametrize("fmt", FORMATS)
+def test_empty_export_round_trips(tmp_path, fmt):
+    write_export(tmp_path, [], fmt)
+    export = ColumnarExport(tmp_path)
+
+    assert export.rows == 0
+    assert len(export.column("path")) == 0
+    assert export.counts("status") == {}
+
+
+def test_reader_rejects_other_export_versions(tmp_path):
+    write_export(tmp_path, [], "csv")
+    manifest = tmp_path / vault_export.MANIFEST_FILENAME
+    manifest.write_text(manifest.read_text().replace('"version": 1', '"version": 99'))
+
+    with pytest.raises(ValueError, match="unsupported export version"):
+        ColumnarExport(tmp_path)
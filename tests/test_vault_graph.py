@@ -0,0 +1,142 @@
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "VaultGuide" / "scripts" / "sync"))
+from vault_graph import VaultGraph, open_graph  # noqa: E402
+
+
+def test_malformed_summary_is_skipped_and_reported(tmp_path):
+    epic = tmp_path / "EPICS" / "EPIC-001-alpha" / "README.md"
+    epic.parent.mkdir(parents=True)
+    epic.write_text("---\nid: EPIC-001\nstatus: planned\n---\n")
+    good = tmp_path / "Sprints" / "SPRINT-good" / "execution_summary.yaml"
+    good.parent.mkdir(parents=True)
+    good.write_text("sprint_id: SPRINT-good\nepic_updates:\n  - path: EPICS/EPIC-001-alpha/README.md\n")
+    bad = tmp_path / "Sprints" / "SPRINT-bad" / "execution_summary.yaml"
+    bad.parent.mkdir(parents=True)
+    bad.write_text("sprint_id: [unclosed\n")
+
+    graph = open_graph(tmp_path)
+    assert graph.artifacts_for_sprint("SPRINT-good") == ["EPIC-001-alpha/README.md"]
+    assert len(graph.problems) == 1 and "SPRINT-bad" in graph.problems[0]
+
+    cached = open_graph(tmp_path)  # the problem is persisted with the source entry
+    assert cached.problems == graph.problems
+
+
+def write_epic(vault, front):
+    epic = vault / "EPICS" / "EPIC-001-alpha" / "README.md"
+    epic.parent.mkdir(parents=True, exist_ok=True)
+    epic.write_text(front)
+    return epic
+
+
+def test_malformed_front_matter_is_skipped_and_reported(tmp_path):
+    write_epic(tmp_path, "---\nid: EPIC-001\nstatus: planned\n---\n")
+    bad = tmp_path / "EPICS" / "EPIC-002-beta" / "README.md"
+    bad.parent.mkdir(parents=True)
+    bad.write_text("---\nid: [unclosed\n---\n")
+
+    graph = open_graph(tmp_path)
+    assert list(graph.nodes) == ["EPIC-001-alpha/README.md"]
+    assert len(graph.problems) == 1 and "EPIC-002-beta" in graph.problems[0]
+
+
+def test_file_removed_between_scan_and_parse_is_reported(tmp_path, monkeypatch):
+    epic = write_epic(tmp_path, "---\nid: EPIC-001\n---\n")
+    graph = VaultGraph(tmp_path)
+    real_scan = graph._scan
+
+    def scan_then_delete():
+        found = real_scan()
+        epic.unlink()
+        return found
+
+    monkeypatch.setattr(graph, "_scan", scan_then_delete)
+    assert graph.refresh() == (1, 0)
+    assert graph.nodes == {} and "EPIC-001-alpha/README.md" in graph.problems[0]
+
+
+def write(vault, rel, text, clock=[10**18]):
+    path = vault / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    clock[0] += 10**9  # distinct mtimes even for same-size rewrites within one timer tick
+    os.utime(path, ns=(clock[0], clock[0]))
+    return rel
+
+
+def artifact(doc_id, **fields):
+    lines = [f"id: {doc_id}"] + [f"{key}: {value}" for key, value in fields.items()]
+    return "---\n" + "\n".join(lines) + "\n---\n"
+
+
+def snapshot(graph):
+    return graph.nodes, graph.aliases, graph.out_edges, graph.in_edges
+
+
+def assert_matches_rebuild(graph, vault):
+    fresh = VaultGraph(vault)
+    fresh.refresh()
+    assert snapshot(graph) == snapshot(fresh)
+
+
+def test_incremental_refresh_matches_a_full_rebuild(tmp_path):
+    epic = "EPICS/EPIC-001-alpha/README.md"
+    feature = "EPICS/EPIC-001-alpha/Features/FEATURE-001-one/README.md"
+    story = "EPICS/EPIC-001-alpha/Features/FEATURE-001-one/Stories/STORY-001.md"
+    other = "EPICS/EPIC-002-beta/README.md"
+    summary = "Sprints/SPRINT-7/execution_summary.yaml"
+    write(tmp_path, epic, artifact("EPIC-001", linked_sprints="[SPRINT-1]"))
+    write(tmp_path, feature, artifact("FEATURE-001", related_epic="EPIC-002"))
+    write(tmp_path, story, artifact("STORY-001", linked_sprints="SPRINT-1"))
+    graph = VaultGraph(tmp_path)
+    graph.refresh()
+    feature_node = feature[len("EPICS/") :]
+    assert graph.neighbors(feature_node, "related_epic") == {"ref:EPIC-002"}
+
+    steps = [
+        # the referenced epic appears: the feature's edge now resolves to it
+        lambda: write(tmp_path, other, artifact("EPIC-002")),
+        # a summary adds sprint edges; SPRINT-1 stays implied by front matter only
+        lambda: write(
+            tmp_path, summary, f"sprint_id: SPRINT-7\nepic_updates:\n  - path: {epic}\n    features:\n"
+            "      - id: FEATURE-001\n"
+        ),
+        # the epic drops its sprint link while the story keeps one
+        lambda: write(tmp_path, epic, artifact("EPIC-001")),
+        # the story drops the last link to SPRINT-1: the implied sprint node goes too
+        lambda: write(tmp_path, story, artifact("STORY-001")),
+        # ids move: EPIC-002 is now claimed by two epics
+        lambda: write(tmp_path, epic, artifact("EPIC-002")),
+        # the other epic disappears: EPIC-002 resolves to the renamed one
+        lambda: (tmp_path / other).unlink() or other,
+        lambda: (tmp_path / summary).unlink() or summary,
+    ]
+    for step in steps:
+        watched = VaultGraph(tmp_path)
+        watched.sources = {key: dict(value) for key, value in graph.sources.items()}
+        watched._build()
+        changed = step()
+        graph.refresh()
+        assert_matches_rebuild(graph, tmp_path)
+        watched.refresh([tmp_path / changed])  # the caller knows what changed: no scan
+        assert_matches_rebuild(watched, tmp_path)
+    assert "sprint:SPRINT-1" not in graph.nodes
+    assert graph.neighbors(feature_node, "related_epic") == {"EPIC-001-alpha/README.md"}
+
+
+def test_refresh_without_changes_skips_the_rebuild(tmp_path, monkeypatch):
+    write(tmp_path, "EPICS/EPIC-001-alpha/README.md", artifact("EPIC-001"))
+    graph = VaultGraph(tmp_path)
+    graph.refresh()
+
+    def fail(*args):
+        raise AssertionError("adjacency rebuilt without a change")
+
+    monkeypatch.setattr(graph, "_build", fail)
+    monkeypatch.setattr(graph, "_apply", fail)
+    assert graph.refresh() == (0, 0)
+    monkeypatch.setattr(graph, "_scan", fail)
+    assert graph.refresh(["EPICS/EPIC-001-alpha/README.md"]) == (0, 0)
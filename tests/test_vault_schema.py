@@ -0,0 +1,105 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "VaultGuide" / "scripts" / "sync"))
+import vault_schema  # noqa: E402
+from vault_schema import DEFAULT_SCHEMA, CompiledSchema, SchemaCache, run_check, validate_paths  # noqa: E402
+
+VALID = "id: EPIC-001\ntitle: Alpha\nartifact_type: epic\n"
+
+
+def write(path, front, mtime_ns=None):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(f"---\n{front}---\n\n# Body\n")
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+    return path
+
+
+def check(tmp_path, front):
+    path = write(tmp_path / "README.md", front)
+    return validate_paths([path], DEFAULT_SCHEMA)[path]
+
+
+def test_valid_front_matter_has_no_violations(tmp_path):
+    front = VALID + "status: completed\nmanual_update: true\nseq: 1\nprogress_pct: 100\nlinked_sprints: [SPRINT-1]\n"
+    assert check(tmp_path, front) == []
+
+
+@pytest.mark.parametrize(
+    "line, message",
+    [
+        ("manual_update: 'true'", "manual_update: expected bool"),
+        ("seq: '001'", "write 1 without quotes"),
+        ("progress_pct: 140", "progress_pct"),
+        ("status: complete", "did you mean 'completed'"),
+        ("created_at: yesterday", "created_at"),
+        ("linked_sprints: [1]", "linked_sprints"),
+    ],
+)
+def test_field_violations_are_errors_on_the_field_line(tmp_path, line, message):
+    violations = check(tmp_path, VALID + "owner: me\n" + line + "\n")
+
+    assert len(violations) == 1
+    number, severity, field, text = violations[0]
+    assert (number, severity, field) == (6, "error", line.split(":")[0])
+    assert message in text
+
+
+def test_allowed_values_and_nullable_fields_pass(tmp_path):
+    assert check(tmp_path, VALID + "requirement_coverage: TBD\nchange_log:\nrelated_epic: [EPIC-002]\n") == []
+
+
+def test_missing_required_fields_and_cross_field_rules(tmp_path):
+    violations = check(tmp_path, "id: EPIC-001\nstatus: completed\nprogress_pct: 80\n")
+
+    assert [(severity, field) for _, severity, field, _ in violations] == [
+        ("error", "title"),
+        ("error", "artifact_type"),
+        ("warning", "status"),  # manual_update is absent, so the status line is blamed
+        ("warning", "progress_pct"),
+    ]
+    assert "manual_update: true" in violations[2][3]
+
+
+def test_unparseable_front_matter_is_reported_not_raised(tmp_path):
+    assert check(tmp_path, "id: [unclosed\n")[0][1:3] == ("error", "")
+    assert check(tmp_path, "- a list\n") == [(2, "error", "", "front matter is not a mapping")]
+
+
+def test_custom_schema_merges_fields_and_replaces_rules(tmp_path):
+    schema_path = tmp_path / "schema.yaml"
+    schema_path.write_text("fields:\n  owner: {type: str, required: true}\nrules: []\n")
+    write(tmp_path / "vault" / "README.md", VALID + "status: completed\n")
+
+    assert run_check(tmp_path / "vault", schema_path=schema_path) == 1
+    assert run_check(tmp_path / "vault") == 0  # only the manual_update warning
+    assert run_check(tmp_path / "vault", strict=True) == 1
+
+
+def test_cache_reuses_results_until_the_file_or_schema_changes(tmp_path, monkeypatch):
+    doc = write(tmp_path / "README.md", VALID + "seq: '001'\n", mtime_ns=1_000_000_000)
+    digest = CompiledSchema(DEFAULT_SCHEMA).digest
+    with SchemaCache(tmp_path / "cache", digest) as cache:
+        first = validate_paths([doc], DEFAULT_SCHEMA, cache=cache)
+
+    validated = []
+    real_chunk = vault_schema._validate_chunk
+    monkeypatch.setattr(vault_schema, "_validate_chunk", lambda paths: validated.extend(paths) or real_chunk(paths))
+
+    def run(schema_digest=digest):
+        with SchemaCache(tmp_path / "cache", schema_digest) as cache:
+            return validate_paths([doc], DEFAULT_SCHEMA, cache=cache)[doc], cache.hits
+
+    assert run() == (first[doc], 1)
+    os.utime(doc, ns=(2_000_000_000, 2_000_000_000))  # touched, same content
+    assert run() == (first[doc], 1)
+    assert validated == []
+
+    write(doc, VALID + "seq: 1\n", mtime_ns=2_000_000_000)
+    assert run() == ([], 0)
+    assert run("other schema")[1] == 0
+    assert len(validated) == 2